@@ -0,0 +1,79 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Benchmark: memory footprint of a whole course, per representation
+
+Usage: python benchmarks/course_memory.py [DATA_DIR]
+"""
+
+# imports: library
+import gc
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from typing import Any, Callable
+
+# imports: project
+from glossanea.structure import config
+from glossanea.structure import decoding
+from glossanea.structure import model
+from glossanea.structure import pack
+from glossanea.structure.frozen import freeze
+
+
+def main() -> None:
+    """Main"""
+
+    parser = ArgumentParser()
+    parser.add_argument('data_dir', nargs='?', default=None,
+                        help='Data folder (default: the configured one)')
+    args: Namespace = parser.parse_args()
+
+    data_dir_path: str = args.data_dir if args.data_dir is not None else config.data_dir_path()
+
+    contents: list[tuple[int, int, bytes]] = []
+    for week_number, unit_number, full_path in pack.find_unit_files(data_dir_path):
+        with open(full_path, 'rb') as fh:
+            contents.append((week_number, unit_number, fh.read()))
+
+    # warm up caches (schema validators, compiled checks, interned names)
+    model.load_unit(contents[0][0], contents[0][1], decoding.loads(contents[0][2]))
+
+    unit_count: int = len(contents)
+    json_size: int = sum(len(content) for _, _, content in contents)
+    print(f'{unit_count} units, {json_size / 1024:.1f} KiB of JSON')
+
+    representations: dict[str, Callable[[int, int, bytes], Any]] = {
+        'dicts': lambda week_number, unit_number, content: decoding.loads(content),
+        'read-only views': lambda week_number, unit_number, content: freeze(
+            decoding.loads(content)),
+        'records': lambda week_number, unit_number, content: model.load_unit(
+            week_number, unit_number, decoding.loads(content)),
+    }
+
+    for name, build_fn in representations.items():
+        size: int = _resident_size(contents, build_fn)
+        print(f'  {name:<16} {size / 1024:9.1f} KiB {size / unit_count / 1024:7.2f} KiB/unit')
+
+
+def _resident_size(contents: list[tuple[int, int, bytes]],
+                   build_fn: Callable[[int, int, bytes], Any],
+                   ) -> int:
+    """Memory held by a course built from contents"""
+
+    gc.collect()
+    tracemalloc.start()
+
+    course: list[Any] = [build_fn(*content) for content in contents]
+
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del course
+
+    return size
+
+
+if __name__ == '__main__':
+    main()
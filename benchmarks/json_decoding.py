@@ -0,0 +1,72 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Benchmark: JSON decoding backends on all units of a course
+
+Usage: python benchmarks/json_decoding.py [DATA_DIR] [--repeat N]
+"""
+
+# imports: library
+import json
+import time
+from argparse import ArgumentParser, Namespace
+from typing import Callable
+
+# imports: project
+from glossanea.structure import config
+from glossanea.structure import decoding
+from glossanea.structure import pack
+
+
+def main() -> None:
+    """Main"""
+
+    parser = ArgumentParser()
+    parser.add_argument('data_dir', nargs='?', default=None,
+                        help='Data folder (default: the configured one)')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Passes over the course per backend')
+    args: Namespace = parser.parse_args()
+
+    data_dir_path: str = args.data_dir if args.data_dir is not None else config.data_dir_path()
+
+    contents: list[bytes] = []
+    for _, _, full_path in pack.find_unit_files(data_dir_path):
+        with open(full_path, 'rb') as fh:
+            contents.append(fh.read())
+
+    total_size: int = sum(map(len, contents))
+    print(f'{len(contents)} units, {total_size / 1024:.1f} KiB,'
+          f' best of {args.repeat} passes per course')
+
+    # baseline: the text-mode json.load of earlier versions
+    print(f'  {"json (text)":<12} {_best_time(contents, args.repeat, _decode_text) * 1000:8.3f} ms')
+
+    for backend_name in decoding.available():
+        decoding.select(backend_name)
+        best: float = _best_time(contents, args.repeat, decoding.loads)
+        print(f'  {backend_name:<12} {best * 1000:8.3f} ms'
+              f' {total_size / best / 1024 / 1024:8.1f} MiB/s')
+
+
+def _decode_text(content: bytes) -> None:
+    """Decode through a text string"""
+    json.loads(content.decode('UTF-8'))
+
+
+def _best_time(contents: list[bytes], repeat: int, decode_fn: Callable[[bytes], object]) -> float:
+    """Best time of decoding all contents"""
+
+    best: float = float('inf')
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        for content in contents:
+            decode_fn(content)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+if __name__ == '__main__':
+    main()
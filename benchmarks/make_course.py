@@ -0,0 +1,142 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Generate a test course for the benchmarks
+
+Every week has six day units and a weekly review, filled with words
+drawn from a fixed list, so the same seed gives the same course.
+
+Usage: python benchmarks/make_course.py DATA_DIR [--weeks N] [--seed N]
+"""
+
+# imports: library
+import json
+import os
+import random
+from argparse import ArgumentParser, Namespace
+from typing import Any
+
+# imports: project
+from glossanea.version import REQUIRED_DATA_VERSION
+
+WORDS: tuple[str, ...] = (
+    'apple', 'brave', 'candle', 'drift', 'eager', 'fable', 'glimpse', 'harbor',
+    'ivory', 'jolt', 'kettle', 'linger', 'meadow', 'nimble', 'orbit',
+)
+DAY_COUNT: int = 6
+ITEM_COUNT: int = 5
+ITEM_LETTERS: str = 'abcde'
+
+
+def _pairs(count: int) -> list[list[str]]:
+    """Answers of a matching task, in order"""
+    return [[str(index + 1), ITEM_LETTERS[index]] for index in range(count)]
+
+
+def day_unit(week_number: int, day_number: int, rng: random.Random) -> dict[str, Any]:
+    """Data of a day unit"""
+
+    words: list[str] = rng.sample(WORDS, ITEM_COUNT + 1)
+
+    return {
+        'version': REQUIRED_DATA_VERSION,
+        'title': f'Week {week_number} Day {day_number}: {words[0]}',
+        'intro_text': ['Some intro text ' * 8, '\u00a0centered\u00a0', 'More text ' * 12],
+        'new_words': [{'regular': word, 'phonetic': 'ˈ' + word + 'ə', 'search': word}
+                      for word in words],
+        'sample_sentences': {
+            'prompt': 'Fill in the blanks.',
+            'sentences': [{'id': str(index + 1), 'beginning': f'The {word} was',
+                           'answer': word, 'end': '.'}
+                          for index, word in enumerate(words)],
+        },
+        'new_words_extension': [f'{word} - also {word}s, {word}ed' for word in words[:3]],
+        'definitions': {
+            'prompt': 'Match definitions.',
+            'definitions': [{'id': str(index + 1), 'text': f'definition of {words[index]}'}
+                            for index in range(ITEM_COUNT)],
+            'words': [{'id': ITEM_LETTERS[index], 'text': words[index]}
+                      for index in range(ITEM_COUNT)],
+            'answers': _pairs(ITEM_COUNT),
+        },
+        'matching': {
+            'name': 'Matching',
+            'prompt': 'Match the halves.',
+            'sentences': [{'id': str(index + 1), 'text': f'first half {index}'}
+                          for index in range(ITEM_COUNT)],
+            'words': [{'id': ITEM_LETTERS[index], 'text': f'second half {index}'}
+                      for index in range(ITEM_COUNT)],
+            'answers': _pairs(ITEM_COUNT),
+        },
+        'other_new_words': {'prompt': 'Write other new words.'},
+    }
+
+
+def weekly_review_unit(week_number: int) -> dict[str, Any]:
+    """Data of a weekly review unit"""
+
+    def question_task(task_number: int) -> dict[str, Any]:
+        """Task of questions with one answer each"""
+        return {'task_number': task_number, 'prompt': 'p', 'scoring': 's',
+                'items': [{'id': '1', 'question': 'q', 'answer': 'a', 'accept': ['A']}]}
+
+    return {
+        'version': REQUIRED_DATA_VERSION,
+        'title': f'Week {week_number} Weekly review',
+        'wr_before_the_test': {'prompt': 'p', 'words': [['a', 'b']], 'after_text': 't'},
+        'wr_definitions': question_task(1),
+        'wr_word_combinations': {
+            'task_number': 2, 'prompt': 'p', 'scoring': 's', 'extra_words': ['x'],
+            'items': [{'id': '1', 'answer_before': 'a', 'accept_before': [], 'word': 'w',
+                       'answer_after': 'b', 'accept_after': []}],
+        },
+        'wr_skeletons': question_task(1),
+        'wr_substitution': question_task(1),
+        'wr_translation': question_task(1),
+        'wr_sit_back_and_relax': {
+            'text': 't', 'label_like': 'l', 'label_do_not_like': 'd', 'label_people': 'p',
+            'people': [{'name': 'n', 'like': 'l', 'do_not_like': 'd'}],
+        },
+        'wr_word_formation': {'groups': [['a']]},
+        'wr_usage': {'prompt': 'p', 'items': [{'word': 'w', 'sentences': ['s']}]},
+        'wr_extra_cards': [],
+    }
+
+
+def _write(file_path: str, unit_data: dict[str, Any]) -> None:
+    """Write a unit file"""
+
+    with open(file_path, 'w', encoding='UTF-8') as fh:
+        json.dump(unit_data, fh, ensure_ascii=False, indent=2)
+
+
+def main() -> None:
+    """Main"""
+
+    parser = ArgumentParser()
+    parser.add_argument('data_dir', help='Folder to create the course in')
+    parser.add_argument('--weeks', type=int, default=12, help='Number of weeks')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+    args: Namespace = parser.parse_args()
+
+    rng: random.Random = random.Random(args.seed)
+
+    for week_number in range(1, args.weeks + 1):
+        week_dir_path: str = os.path.join(args.data_dir, f'week_{week_number:02}')
+        os.makedirs(week_dir_path, exist_ok=True)
+
+        for day_number in range(1, DAY_COUNT + 1):
+            _write(os.path.join(week_dir_path, f'day_{day_number}.json'),
+                   day_unit(week_number, day_number, rng))
+
+        _write(os.path.join(week_dir_path, 'weekly_review.json'), weekly_review_unit(week_number))
+
+    with open(os.path.join(args.data_dir, 'introduction.txt'), 'w', encoding='UTF-8') as fh:
+        fh.write('Welcome to Glossanea\nA test course\n')
+
+    print(f'{args.weeks} weeks written to {args.data_dir}')
+
+
+if __name__ == '__main__':
+    main()
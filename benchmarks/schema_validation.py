@@ -0,0 +1,90 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Benchmark: compiled schema checks against jsonschema, per task
+
+Usage: python benchmarks/schema_validation.py [DATA_DIR] [--repeat N]
+"""
+
+# imports: library
+import time
+from argparse import ArgumentParser, Namespace
+from types import ModuleType
+from typing import Any, Callable
+
+# imports: project
+from glossanea import tasks
+from glossanea.structure import config
+from glossanea.structure import data_version
+from glossanea.structure import decoding
+from glossanea.structure import pack
+from glossanea.structure import schema_compiler
+
+
+def main() -> None:
+    """Main"""
+
+    parser = ArgumentParser()
+    parser.add_argument('data_dir', nargs='?', default=None,
+                        help='Data folder (default: the configured one)')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Passes over the course per task')
+    args: Namespace = parser.parse_args()
+
+    data_dir_path: str = args.data_dir if args.data_dir is not None else config.data_dir_path()
+
+    units: list[dict[str, Any]] = [
+        decoding.load_file(full_path) for _, _, full_path in pack.find_unit_files(data_dir_path)
+    ]
+
+    # units of each task, as the task decorators validate them
+    task_units: dict[str, list[dict[str, Any]]] = {data_version.DATA_KEY: units}
+    for unit_data in units:
+        for key in unit_data:
+            task_module: ModuleType | None = getattr(tasks, key, None)
+            if task_module is not None and hasattr(task_module, 'DATA_VALIDATOR'):
+                task_units.setdefault(key, []).append(unit_data)
+
+    print(f'{len(units)} units, best of {args.repeat} passes per task')
+    print(f'  {"task":<24} {"units":>5} {"jsonschema":>12} {"compiled":>12} {"speedup":>8}')
+
+    total_reference: float = 0.0
+    total_compiled: float = 0.0
+
+    for key, key_units in task_units.items():
+        validator = data_version.DATA_VALIDATOR if key == data_version.DATA_KEY \
+            else getattr(tasks, key).DATA_VALIDATOR
+
+        check: schema_compiler.CheckFunction = schema_compiler.check_function(validator)
+
+        reference: float = _best_time(key_units, args.repeat, validator.validate)
+        compiled: float = _best_time(key_units, args.repeat, check)
+
+        total_reference += reference
+        total_compiled += compiled
+
+        print(f'  {key:<24} {len(key_units):>5}'
+              f' {reference * 1000:9.3f} ms {compiled * 1000:9.3f} ms'
+              f' {reference / compiled:7.1f}x')
+
+    print(f'  {"total":<24} {"":>5}'
+          f' {total_reference * 1000:9.3f} ms {total_compiled * 1000:9.3f} ms'
+          f' {total_reference / total_compiled:7.1f}x')
+
+
+def _best_time(units: list[dict[str, Any]], repeat: int, check_fn: Callable[[Any], Any]) -> float:
+    """Best time of checking all units"""
+
+    best: float = float('inf')
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        for unit_data in units:
+            check_fn(unit_data)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+if __name__ == '__main__':
+    main()
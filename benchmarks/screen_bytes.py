@@ -0,0 +1,103 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Benchmark: bytes sent to the terminal, scrolling versus full-screen output
+
+Runs the item tasks of every day unit with scripted answers, one wrong
+attempt before each correct one.
+
+Usage: python benchmarks/screen_bytes.py [DATA_DIR] [--rows N]
+"""
+
+# imports: library
+import io
+from argparse import ArgumentParser, Namespace
+from types import ModuleType
+from typing import Callable
+
+# imports: project
+from glossanea import tasks
+from glossanea.cli import backend
+from glossanea.cli import output
+from glossanea.cli.screen import ScreenSink
+from glossanea.structure import config
+from glossanea.structure import pack
+from glossanea.structure.unit import WEEKLY_REVIEW_INDEX, Unit
+from glossanea.tasks import _common
+
+ITEM_TASKS: tuple[ModuleType, ...] = (tasks.sample_sentences, tasks.definitions, tasks.matching)
+
+
+def _scripted_answers(unit_obj: Unit, task_module: ModuleType) -> list[str]:
+    """A wrong then the correct answer of each item, followed by ENTER"""
+
+    task_plan = _common.task_plan(unit_obj.unit_data, task_module.DATA_KEY, task_module.plan)
+
+    return [line for subtask in task_plan.subtasks for line in ('?', subtask.answers[0], '')]
+
+
+def _run(runs: list[tuple[Unit, ModuleType, list[str]]],
+         sink_fn: Callable[[list[str]], backend.Sink],
+         ) -> backend.Sink:
+    """Run all tasks into a sink"""
+
+    answers: list[str] = [line for _, _, task_answers in runs for line in task_answers]
+    sink: backend.Sink = sink_fn(answers)
+
+    previous_sink: backend.Sink = backend.set_sink(sink)
+    try:
+        for unit_obj, task_module, _ in runs:
+            task_module.task(unit_obj.unit_data)
+        output.flush()
+    finally:
+        backend.set_sink(previous_sink)
+
+    return sink
+
+
+def main() -> None:
+    """Main"""
+
+    parser = ArgumentParser()
+    parser.add_argument('data_dir', nargs='?', default=None,
+                        help='Data folder (default: the configured one)')
+    parser.add_argument('--rows', type=int, default=40, help='Terminal rows')
+    args: Namespace = parser.parse_args()
+
+    if args.data_dir is not None:
+        config.settings.set_data_dir_override(args.data_dir)
+
+    runs: list[tuple[Unit, ModuleType, list[str]]] = []
+    for week_number, unit_number, _ in pack.find_unit_files(config.data_dir_path()):
+        if unit_number == WEEKLY_REVIEW_INDEX:
+            continue
+        unit_obj: Unit = Unit(week_number, unit_number)
+        for task_module in ITEM_TASKS:
+            if task_module.DATA_KEY in unit_obj.unit_data:
+                runs.append((unit_obj, task_module, _scripted_answers(unit_obj, task_module)))
+
+    interaction_count: int = sum(len(answers) for _, _, answers in runs)
+
+    capture: backend.Sink = _run(runs, backend.CaptureSink)
+    # the capture holds the typed answers, which the terminal echoes in both modes
+    scrolling_bytes: int = len(capture.text.encode('UTF-8')) - sum(
+        len(line.encode('UTF-8')) + 1 for _, _, answers in runs for line in answers)
+
+    def screen_sink(answers: list[str]) -> ScreenSink:
+        """Full-screen sink answering from a script"""
+        lines = iter(answers)
+        return ScreenSink(io.StringIO(), (output.DISPLAY_WIDTH, args.rows),
+                          lambda _: next(lines))
+
+    screen: backend.Sink = _run(runs, screen_sink)
+    screen_bytes: int = screen.bytes_written
+
+    print(f'{interaction_count} interactions')
+    for name, byte_count in (('scrolling', scrolling_bytes), ('full-screen', screen_bytes)):
+        print(f'  {name:<12} {byte_count / 1024:9.1f} KiB '
+              f'{byte_count / interaction_count:8.1f} B/interaction')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Benchmark: task engine without terminal I/O
+
+Runs the item tasks of every day unit with scripted correct answers,
+discarding the output.
+
+Usage: python benchmarks/task_engine.py [DATA_DIR] [--rounds N]
+"""
+
+# imports: library
+import time
+from argparse import ArgumentParser, Namespace
+from types import ModuleType
+
+# imports: project
+from glossanea import tasks
+from glossanea.cli import backend
+from glossanea.structure import config
+from glossanea.structure import pack
+from glossanea.structure.unit import WEEKLY_REVIEW_INDEX, Unit
+from glossanea.tasks import TaskResult, _common
+
+ITEM_TASKS: tuple[ModuleType, ...] = (tasks.sample_sentences, tasks.definitions, tasks.matching)
+
+
+def _scripted_answers(unit_obj: Unit, task_module: ModuleType) -> list[str]:
+    """Correct answers of a task, each followed by ENTER"""
+
+    task_plan = _common.task_plan(unit_obj.unit_data, task_module.DATA_KEY, task_module.plan)
+
+    return [line for subtask in task_plan.subtasks for line in (subtask.answers[0], '')]
+
+
+def main() -> None:
+    """Main"""
+
+    parser = ArgumentParser()
+    parser.add_argument('data_dir', nargs='?', default=None,
+                        help='Data folder (default: the configured one)')
+    parser.add_argument('--rounds', type=int, default=20, help='Runs of every task')
+    args: Namespace = parser.parse_args()
+
+    if args.data_dir is not None:
+        config.settings.set_data_dir_override(args.data_dir)
+
+    runs: list[tuple[Unit, ModuleType, list[str]]] = []
+    for week_number, unit_number, _ in pack.find_unit_files(config.data_dir_path()):
+        if unit_number == WEEKLY_REVIEW_INDEX:
+            continue
+        unit_obj: Unit = Unit(week_number, unit_number)
+        for task_module in ITEM_TASKS:
+            if task_module.DATA_KEY in unit_obj.unit_data:
+                runs.append((unit_obj, task_module, _scripted_answers(unit_obj, task_module)))
+
+    item_count: int = sum(len(answers) // 2 for _, _, answers in runs) * args.rounds
+
+    start: float = time.perf_counter()
+
+    for _ in range(args.rounds):
+        for unit_obj, task_module, answers in runs:
+            previous_sink: backend.Sink = backend.set_sink(backend.NullSink(answers))
+            try:
+                task_result: TaskResult = task_module.task(unit_obj.unit_data)
+            finally:
+                backend.set_sink(previous_sink)
+            if task_result != TaskResult.FINISHED:
+                raise RuntimeError(f'Task not finished: {task_module.DATA_KEY}: {task_result}')
+
+    seconds: float = time.perf_counter() - start
+
+    print(f'{len(runs) * args.rounds} task runs, {item_count} items: {seconds:.3f} s, '
+          f'{seconds / item_count * 1e6:.1f} µs/item')
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,8 @@
 """Main"""
 
 # imports: library
+import logging
+import sys
 from argparse import ArgumentParser, Namespace
 
 # imports: dependencies
@@ -14,7 +16,12 @@ import libmonty_logging.message as logging_message
 # imports: project
 from glossanea import version
 from glossanea.cli import cli
+from glossanea.cli import cli_data
+from glossanea.cli import output
+from glossanea.structure import cache
 from glossanea.structure import config
+from glossanea.structure import data
+from glossanea.structure.exceptions import DataError
 
 
 def main() -> None:
@@ -34,18 +41,95 @@ def main() -> None:
                         action='store_true',
                         dest='version')
 
+    parser.add_argument('--no-cache',
+                        help='Do not use the persistent unit cache',
+                        action='store_true',
+                        dest='no_cache')
+
+    parser.add_argument('--full-screen',
+                        help='Use the whole terminal, only redrawing what changed '
+                             '(for slow remote sessions)',
+                        action='store_true',
+                        dest='full_screen')
+
+    parser.add_argument('--data-dir',
+                        help=f'Data folder to use instead of the configured one '
+                             f'(also: {config.ENV_DATA_DIR} environment variable)',
+                        default=None,
+                        dest='data_dir')
+
+    parser.add_argument('--backend',
+                        help='Source of unit data (default: %(default)s, which uses '
+                             'the course pack or database if the data folder has one)',
+                        choices=[backend.value for backend in data.Backend],
+                        default=data.Backend.AUTO.value,
+                        dest='backend')
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    parser_pack = subparsers.add_parser('pack',
+                                        help='Compile the data folder into a single-file course')
+    parser_pack.add_argument('--format',
+                             help='Course pack or SQLite database (default: %(default)s)',
+                             choices=cli_data.PACK_FORMATS,
+                             default=cli_data.PACK_FORMAT_PACK,
+                             dest='format')
+    parser_pack.add_argument('--output',
+                             help='Path of the course file (default: in the data folder)',
+                             default=None,
+                             dest='output')
+
+    parser_validate = subparsers.add_parser('validate',
+                                            help='Validate every unit of the data folder '
+                                                 'and print a JSON report')
+    parser_validate.add_argument('--jobs',
+                                 help='Number of worker processes (default: number of CPUs)',
+                                 type=int,
+                                 default=None,
+                                 dest='jobs')
+    parser_validate.add_argument('--incremental',
+                                 help='Only validate units whose content or schemas changed '
+                                      'since the previous incremental run',
+                                 action='store_true',
+                                 dest='incremental')
+
     args: Namespace = parser.parse_args()
 
     if args.version:
         print(f'{version.PROGRAM_NAME} {version.__version__}')
         return
 
+    if args.no_cache:
+        cache.disable()
+
+    data.set_backend(data.Backend(args.backend))
+
+    try:
+        config.settings.set_data_dir_override(args.data_dir)
+    except DataError as exc:
+        print(str(exc))
+        sys.exit(1)
+
     config.check_data_dir_path()
 
     try:
+        if args.command == 'pack':
+            sys.exit(cli_data.run_pack(args.format, args.output))
+
+        if args.command == 'validate':
+            sys.exit(cli_data.run_validate(args.jobs, args.incremental and cache.is_enabled()))
+
+        if args.full_screen:
+            if sys.stdout.isatty():
+                output.full_screen()
+            else:
+                logging.warning('Not a terminal, full-screen output disabled')
+
         cli.mainloop()
     except KeyboardInterrupt:
         return
+    finally:
+        output.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,162 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Output backend
+
+Displayed text is collected into a frame, which is written to the sink
+in one piece before the next input is read, or when flushed explicitly.
+"""
+
+# imports: library
+import sys
+from typing import Callable, Iterable
+
+
+class Sink:
+    """Destination of frames, and source of input lines"""
+
+    def write(self, text: str) -> None:
+        """Write a frame"""
+        raise NotImplementedError
+
+    def read_line(self, prompt: str) -> str:
+        """Read an input line after displaying a prompt"""
+        raise NotImplementedError
+
+    def write_and_read_line(self, text: str, prompt: str) -> str:
+        """Write a frame, then read an input line after displaying a prompt"""
+
+        if len(text) > 0:
+            self.write(text)
+
+        return self.read_line(prompt)
+
+    def close(self) -> None:
+        """Leave the terminal ready for other output"""
+
+
+class TerminalSink(Sink):
+    """Standard output and input"""
+
+    def write(self, text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def read_line(self, prompt: str) -> str:
+        return input(prompt)
+
+
+class CaptureSink(Sink):
+    """Collects the output, and answers input from a script, for tests"""
+
+    def __init__(self, input_lines: Iterable[str] = ()) -> None:
+        self._chunks: list[str] = []
+        self._input_lines: list[str] = list(input_lines)
+        self.write_count: int = 0
+
+    @property
+    def text(self) -> str:
+        """Get all text written so far, with the prompts and answers"""
+        return ''.join(self._chunks)
+
+    def write(self, text: str) -> None:
+        self._chunks.append(text)
+        self.write_count += 1
+
+    def read_line(self, prompt: str) -> str:
+
+        if len(self._input_lines) == 0:
+            raise EOFError('No more scripted input')
+
+        line: str = self._input_lines.pop(0)
+        self._chunks.append(f'{prompt}{line}\n')
+
+        return line
+
+
+class NullSink(Sink):
+    """Discards the output, and answers input from a script, for benchmarks"""
+
+    def __init__(self, input_lines: Iterable[str] = ()) -> None:
+        self._input_lines: list[str] = list(input_lines)
+        self._input_index: int = 0
+
+    def write(self, text: str) -> None:
+        pass
+
+    def read_line(self, prompt: str) -> str:
+
+        if self._input_index >= len(self._input_lines):
+            raise EOFError('No more scripted input')
+
+        self._input_index += 1
+
+        return self._input_lines[self._input_index - 1]
+
+
+class FrameWriter:
+    """Buffers text until the frame is flushed"""
+
+    def __init__(self, sink: Sink) -> None:
+        self.sink: Sink = sink
+        self._parts: list[str] = []
+
+    def write(self, text: str) -> None:
+        """Add text to the frame"""
+        self._parts.append(text)
+
+    def line(self, text: str = '') -> None:
+        """Add a line to the frame"""
+        self._parts.append(text)
+        self._parts.append('\n')
+
+    def flush(self) -> None:
+        """Write the frame to the sink"""
+
+        if len(self._parts) == 0:
+            return
+
+        text: str = ''.join(self._parts)
+        self._parts.clear()
+        self.sink.write(text)
+
+    def record(self, draw_fn: Callable[[], None]) -> str:
+        """Get the text added by a drawing function, instead of adding it to the frame"""
+
+        parts: list[str] = self._parts
+        self._parts = []
+        try:
+            draw_fn()
+            return ''.join(self._parts)
+        finally:
+            self._parts = parts
+
+    def read_line(self, prompt: str) -> str:
+        """Write the frame, then read an input line"""
+
+        text: str = ''.join(self._parts)
+        self._parts.clear()
+
+        return self.sink.write_and_read_line(text, prompt)
+
+
+frame: FrameWriter = FrameWriter(TerminalSink())
+
+
+def close() -> None:
+    """Flush the frame and release the sink"""
+
+    frame.flush()
+    frame.sink.close()
+
+
+def set_sink(sink: Sink) -> Sink:
+    """Send the output to another sink, return the previous one"""
+
+    frame.flush()
+
+    previous_sink: Sink = frame.sink
+    frame.sink = sink
+
+    return previous_sink
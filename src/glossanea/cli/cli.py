@@ -7,17 +7,22 @@
 # imports: library
 import enum
 import logging
-import random
 
 # imports: project
 from glossanea import version
 from glossanea.cli import cli_unit
 from glossanea.cli import output
 from glossanea.cli import user_input
+from glossanea.cli.commands import CommandRegistry, PluginCommand, Resolution
+from glossanea.structure import config
 from glossanea.structure import data
+from glossanea.structure import manifest
+from glossanea.structure import repository
+from glossanea.structure import schema
 from glossanea.structure import unit
-from glossanea.structure.unit import Unit
 from glossanea.structure.exceptions import DataError
+from glossanea.structure.manifest import Manifest
+from glossanea.structure.unit import Unit
 
 
 class Command(enum.Enum):
@@ -25,6 +30,7 @@ class Command(enum.Enum):
 
     EMPTY = 'EMPTY'
     INVALID = 'INVALID'
+    AMBIGUOUS = 'AMBIGUOUS'
 
     HELP = 'help'
     EXIT = 'quit'
@@ -49,6 +55,20 @@ COMMAND_TEXTS: dict[str, Command] = {
     'start': Command.START,
 }
 
+COMMANDS: CommandRegistry = CommandRegistry(COMMAND_TEXTS)
+
+# argument of the start command discarding the checkpoint
+START_OVER_ARGUMENT: str = 'over'
+
+# weekly reviews are skipped until their tasks are implemented
+SKIP_WEEKLY_REVIEWS: bool = True
+
+# unit types of the random command whose choice is made in advance,
+# so that the chosen units can be prefetched
+PREFETCH_RANDOM_UNIT_TYPES: tuple[str, ...] = ('',)
+
+_random_choices: dict[str, tuple[int, int]] = {}
+
 
 def mainloop() -> None:
     """CLI main loop"""
@@ -56,7 +76,8 @@ def mainloop() -> None:
     display_introduction()
 
     try:
-        unit_obj: Unit = Unit(unit.MIN_WEEK_NUMBER, unit.MIN_DAY_NUMBER)
+        repository.configure()
+        unit_obj: Unit = repository.units.get(*manifest.current().first_unit(SKIP_WEEKLY_REVIEWS))
     except DataError as exc:
         logging.error(str(exc))
         output.empty_line()
@@ -66,6 +87,17 @@ def mainloop() -> None:
 
     while True:
 
+        # the data dir may be asked for again on reload
+        output.flush()
+
+        try:
+            unit_obj = reload_settings(unit_obj)
+        except DataError as exc:
+            logging.warning(str(exc))
+            output.warning(str(exc))
+
+        prefetch_likely_units(unit_obj)
+
         command, arguments = get_command(unit_obj.week_number, unit_obj.unit_number_display)
 
         try:
@@ -74,27 +106,26 @@ def mainloop() -> None:
                 case Command.EMPTY:
                     output.warning('No command given!')
                     continue
+                case Command.AMBIGUOUS:
+                    continue
                 case Command.EXIT:
                     break
-                case Command.START:
-                    cli_unit.run(unit_obj)
                 case Command.HELP:
                     display_command_help()
                 case Command.NEXT:
                     unit_obj = get_next_unit(unit_obj)
-                    # TODO: temporary skip of weekly review until implemented
-                    while unit_obj.is_weekly_review:
-                        unit_obj = get_next_unit(unit_obj)
                     cli_unit.run(unit_obj)
                 # UI commands with variable arguments #
+                case Command.START:
+                    cli_unit.run(unit_obj, is_start_over(arguments))
                 case Command.RANDOM:
                     unit_obj = get_random_unit(''.join(arguments))
-                    # TODO: temporary skip of weekly review until implemented
-                    while unit_obj.is_weekly_review:
-                        unit_obj = get_random_unit(''.join(arguments))
                 # UI commands with one or more arguments #
                 case Command.GOTO:
                     unit_obj = get_specific_unit(unit_obj, arguments)
+                # commands added at runtime #
+                case PluginCommand():
+                    command.handler(arguments)
                 # other inputs #
                 case Command.INVALID | _:
                     output.warning('Invalid command!')
@@ -105,17 +136,13 @@ def mainloop() -> None:
             output.warning(str(exc))
             continue
 
-        except KeyError as exc:
-            output.warning(str(exc))
-            continue
-
-        except ValueError as exc:
+        except (KeyError, ValueError, IndexError) as exc:
             output.warning(str(exc))
             continue
 
-        except IndexError as exc:
-            output.warning(str(exc))
-            continue
+    repository.units.close()
+    logging.info('Unit repository: %s', repository.units.stats())
+    logging.info('Data validation: %s', schema.stats())
 
     # else:  # executes after while condition becomes false #
     #     pass
@@ -123,13 +150,15 @@ def mainloop() -> None:
 
 # input functions ---------------------------------------------------- #
 
-def get_command(week_number: int, unit_number_display: str) -> tuple[Command, list[str]]:
+def get_command(week_number: int,
+                unit_number_display: str,
+                ) -> tuple[Command | PluginCommand, list[str]]:
     """Get user input - top level command"""
 
     prompt: str = f'{version.PROGRAM_NAME.capitalize()} {week_number}/{unit_number_display} $ '
 
     output.empty_line()
-    input_text: str = input(prompt).strip()
+    input_text: str = user_input.read_line(prompt).strip()
 
     if len(input_text) < 1:
         return Command.EMPTY, []
@@ -137,18 +166,16 @@ def get_command(week_number: int, unit_number_display: str) -> tuple[Command, li
     input_elements: list[str] = input_text.split()
     command_text: str = input_elements.pop(0)
 
-    command: Command = Command.INVALID
-    if command_text in COMMAND_TEXTS:
-        command = COMMAND_TEXTS[command_text]
-    else:
-        for key, value in COMMAND_TEXTS.items():
-            try:
-                if key.index(command_text) == 0:
-                    command = value
-            except ValueError:
-                pass
+    resolution: Resolution = COMMANDS.resolve(command_text)
+
+    if resolution.is_ambiguous:
+        output.warning(f'Ambiguous command: {command_text} ({", ".join(resolution.candidates)})')
+        return Command.AMBIGUOUS, input_elements
+
+    if resolution.command is None:
+        return Command.INVALID, input_elements
 
-    return command, input_elements
+    return resolution.command, input_elements
 
 
 # display functions -------------------------------------------------- #
@@ -173,7 +200,9 @@ def display_command_help() -> None:
     """Help with commands"""
 
     collection: list[list[str]] = [
-        [Command.START.value, 'Start currently selected unit.'],
+        [Command.START.value, 'Start currently selected unit, or resume where it was left.'],
+        [f'{Command.START.value} {START_OVER_ARGUMENT}',
+         'Start currently selected unit from the beginning.'],
         [Command.EXIT.value, 'Exit the program.'],
         [Command.NEXT.value, 'Go to an start next unit.'],
         [f'{Command.GOTO.value} WEEK', 'Change to the unit of the first day in WEEK.'],
@@ -181,6 +210,7 @@ def display_command_help() -> None:
         [Command.RANDOM.value, 'Go to a random unit.'],
         [Command.HELP.value, 'Display this help text.']
     ]
+    collection.extend([plugin.name, plugin.help_text] for plugin in COMMANDS.plugins)
 
     output.empty_line()
     output.center('Glossanea help')
@@ -189,8 +219,20 @@ def display_command_help() -> None:
 
 # unit choice functions ---------------------------------------------- #
 
+def is_start_over(arguments: list[str]) -> bool:
+    """Check whether the start command discards the checkpoint"""
+
+    if len(arguments) == 0:
+        return False
+
+    if arguments != [START_OVER_ARGUMENT]:
+        raise ValueError(f'Invalid arguments: {" ".join(arguments)}')
+
+    return True
+
+
 def get_specific_unit(current_unit: Unit, arguments) -> Unit:
-    """Create an instance of a specific unit"""
+    """Get a specific unit"""
 
     if len(arguments) < 1:
         raise ValueError('No arguments given!')
@@ -218,47 +260,96 @@ def get_specific_unit(current_unit: Unit, arguments) -> Unit:
                 raise ValueError(f'Not a valid number: {arguments[1]}') from exc
     _ = unit.validate_unit_number(unit_number)
 
-    # TODO: temporary skip of weekly review until implemented
-    if unit_number == unit.WEEKLY_REVIEW_INDEX:
+    if SKIP_WEEKLY_REVIEWS and unit_number == unit.WEEKLY_REVIEW_INDEX:
         output.simple('Weekly Reviews are not yet implemented!')
         user_input.wait_for_enter()
         return current_unit
 
-    return Unit(week_number, unit_number)
+    if (week_number, unit_number) not in manifest.current():
+        raise ValueError(f'Unit not found: Week {week_number} / Day {unit_number}')
+
+    return repository.units.get(week_number, unit_number)
+
+
+def reload_settings(current_unit: Unit) -> Unit:
+    """Apply modified settings files, return the unit to continue with
+
+    A changed data dir is a different course, which starts at its first unit.
+    """
+
+    if config.settings.reload_config_if_changed():
+        try:
+            repository.configure()
+        except (DataError, ValueError) as exc:
+            logging.warning(str(exc))
+            output.warning(str(exc))
+
+    if not config.settings.reload_data_dir_if_changed():
+        return current_unit
+
+    repository.units.clear()
+    manifest.clear()
+    _random_choices.clear()
+
+    return repository.units.get(*manifest.current().first_unit(SKIP_WEEKLY_REVIEWS))
 
 
 def get_next_unit(current_unit: Unit) -> Unit:
-    """Create an instance of the next unit"""
+    """Get the next unit"""
 
-    next_week_no: int = current_unit.week_number
-    if current_unit.is_weekly_review:
-        next_week_no += 1
+    course: Manifest = manifest.current()
 
-    next_unit_no: int = (current_unit.unit_number + 1) % unit.UNITS_PER_WEEK
+    next_numbers: tuple[int, int] | None = course.next_unit(current_unit.week_number,
+                                                           current_unit.unit_number,
+                                                           SKIP_WEEKLY_REVIEWS)
 
-    if next_week_no > unit.MAX_WEEK_NUMBER:
+    if next_numbers is None:
         output.simple('End of units reached!')
         user_input.wait_for_enter()
-        return Unit(unit.MIN_WEEK_NUMBER, unit.MIN_DAY_NUMBER)
+        return repository.units.get(*course.first_unit(SKIP_WEEKLY_REVIEWS))
 
-    return Unit(next_week_no, next_unit_no)
+    return repository.units.get(*next_numbers)
 
 
 def get_random_unit(unit_type: str) -> Unit:
-    """Create an instance of a random unit"""
+    """Get a random unit"""
 
-    week_number: int = random.randint(unit.MIN_WEEK_NUMBER, unit.MAX_WEEK_NUMBER)
+    unit_numbers: tuple[int, int] | None = _random_choices.pop(unit_type, None)
 
-    match unit_type:
-        case '':
-            unit_number = random.randint(unit.MIN_DAY_NUMBER, unit.UNITS_PER_WEEK)
-            if unit_number == unit.UNITS_PER_WEEK:
-                unit_number = unit.WEEKLY_REVIEW_INDEX
-        case 'day':
-            unit_number = random.randint(unit.MIN_DAY_NUMBER, unit.MAX_DAY_NUMBER)
-        case 'WR':
-            unit_number = unit.WEEKLY_REVIEW_INDEX
-        case _:
-            raise ValueError('Incorrect unit type.')
-
-    return Unit(week_number, unit_number)
+    if unit_numbers is None:
+        unit_numbers = random_unit_numbers(unit_type)
+
+    return repository.units.get(*unit_numbers)
+
+
+def random_unit_numbers(unit_type: str) -> tuple[int, int]:
+    """Pick the week and unit number of a random unit"""
+
+    if SKIP_WEEKLY_REVIEWS and unit_type == 'WR':
+        raise ValueError('Weekly Reviews are not yet implemented!')
+
+    return manifest.current().random_unit(unit_type, SKIP_WEEKLY_REVIEWS)
+
+
+# prefetch functions ------------------------------------------------- #
+
+def prefetch_likely_units(current_unit: Unit) -> None:
+    """Load the units the next command will probably need in the background
+
+    Prefetching is best-effort, a failure only means the units load when used.
+    """
+
+    try:
+        next_numbers: tuple[int, int] | None = manifest.current().next_unit(
+            current_unit.week_number, current_unit.unit_number, SKIP_WEEKLY_REVIEWS)
+
+        if next_numbers is not None:
+            repository.units.prefetch(*next_numbers)
+
+        for unit_type in PREFETCH_RANDOM_UNIT_TYPES:
+            if unit_type not in _random_choices:
+                _random_choices[unit_type] = random_unit_numbers(unit_type)
+            repository.units.prefetch(*_random_choices[unit_type])
+
+    except (DataError, ValueError, OSError) as exc:
+        logging.warning('Prefetch skipped: %s', exc)
@@ -0,0 +1,84 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""CLI data commands"""
+
+# imports: library
+import json
+import logging
+import os.path
+import sqlite3
+import sys
+from typing import Any, Callable
+
+# imports: project
+from glossanea.cli import output
+from glossanea.structure import config
+from glossanea.structure import database
+from glossanea.structure import pack
+from glossanea.structure import validation
+from glossanea.structure.exceptions import DataError
+
+
+PACK_FORMAT_PACK: str = 'pack'
+PACK_FORMAT_SQLITE: str = 'sqlite'
+PACK_FORMATS: tuple[str, ...] = (PACK_FORMAT_PACK, PACK_FORMAT_SQLITE)
+
+
+def run_pack(pack_format: str, pack_path: str | None) -> int:
+    """Compile the data folder into a single-file course, return exit status"""
+
+    data_dir_path: str = config.data_dir_path()
+
+    match pack_format:
+        case 'pack':
+            file_name: str = pack.PACK_FILE_NAME
+            build_fn: Callable[[str, str], int] = pack.build
+        case 'sqlite':
+            file_name: str = database.DATABASE_FILE_NAME
+            build_fn: Callable[[str, str], int] = database.build
+        case _:
+            raise ValueError(f'Unknown pack format: {pack_format}')
+
+    if pack_path is None:
+        pack_path = os.path.join(data_dir_path, file_name)
+
+    try:
+        unit_count: int = build_fn(data_dir_path, pack_path)
+    except (DataError, OSError, sqlite3.Error) as exc:
+        logging.error(str(exc))
+        output.error(str(exc))
+        return 1
+
+    output.simple(f'Packed {unit_count} units into: {pack_path}')
+
+    return 0
+
+
+def run_validate(jobs: int | None, incremental: bool) -> int:
+    """Validate every unit of the data folder, print a JSON report, return exit status"""
+
+    data_dir_path: str = config.data_dir_path()
+
+    if jobs is not None and jobs < 1:
+        output.error(f'Incorrect number of jobs: {jobs}')
+        return 2
+
+    try:
+        report: dict[str, Any] = validation.validate_course(data_dir_path, jobs, incremental)
+    except (DataError, OSError) as exc:
+        logging.error(str(exc))
+        output.error(str(exc))
+        return 1
+
+    if incremental:
+        logging.info('Validated %s units (%s checked, %s skipped), %s failed',
+                     report['units'], report['checked'], report['skipped'], report['failed'])
+    else:
+        logging.info('Validated %s units, %s failed', report['units'], report['failed'])
+
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write('\n')
+
+    return 0 if report['failed'] == 0 else 1
@@ -5,26 +5,53 @@
 """CLI Unit"""
 import logging
 # imports: library
-from typing import Callable
+from typing import Any, Callable
 
 # imports: project
 from glossanea import tasks
-from glossanea.tasks import TaskResult
+from glossanea.tasks import TaskProgress, TaskResult
 from glossanea.cli import output
+from glossanea.structure import checkpoint
+from glossanea.structure.checkpoint import Checkpoint
 from glossanea.structure.unit import Unit
 
 
-def run(unit_obj: Unit) -> None:
-    """Run Unit"""
+def save_checkpoint(unit_obj: Unit, task_index: int, progress: TaskProgress) -> None:
+    """Record the position within a unit"""
+
+    checkpoint.save(unit_obj.week_number, unit_obj.unit_number, Checkpoint(
+        task_count=len(unit_obj.task_names),
+        task_index=task_index,
+        subtask_index=progress.subtask_index,
+        answered=frozenset(progress.answered),
+    ))
+
+
+def run(unit_obj: Unit, start_over: bool = False) -> None:
+    """Run Unit, resuming at its checkpoint unless starting over"""
+
+    if start_over:
+        checkpoint.clear(unit_obj.week_number, unit_obj.unit_number)
 
     task_list: list[str] = unit_obj.task_names
     task_index: int = 0
+
+    # progress of the tasks run so far, by task index
+    task_progress: dict[int, TaskProgress] = {}
+
+    saved: Checkpoint | None = checkpoint.load(unit_obj.week_number, unit_obj.unit_number,
+                                               len(task_list))
+    if saved is not None:
+        task_index = saved.task_index
+        task_progress[task_index] = TaskProgress(saved.subtask_index, set(saved.answered))
+
     while True:
 
         if task_index < 0:
             raise IndexError(f'Step index out of bounds: {task_index}')
 
         if task_index >= len(task_list):
+            checkpoint.clear(unit_obj.week_number, unit_obj.unit_number)
             break
 
         task_name = task_list[task_index]
@@ -32,9 +59,18 @@ def run(unit_obj: Unit) -> None:
         if not hasattr(tasks, task_name):
             raise ValueError(f'Unrecognized task type: {task_name}')
 
-        task_fn: Callable = getattr(tasks, task_name).task
+        task_module: Any = getattr(tasks, task_name)
+        task_fn: Callable = task_module.task
+
+        progress: TaskProgress = task_progress.setdefault(task_index, TaskProgress())
+        progress.on_change = \
+            lambda changed, index=task_index: save_checkpoint(unit_obj, index, changed)
+        save_checkpoint(unit_obj, task_index, progress)
 
-        task_result = task_fn(unit_obj.unit_data)
+        if getattr(task_module, 'RESUMABLE', False):
+            task_result = task_fn(unit_obj.unit_data, progress)
+        else:
+            task_result = task_fn(unit_obj.unit_data)
 
         match task_result:
 
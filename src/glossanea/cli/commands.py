@@ -0,0 +1,129 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Command registry
+
+Command texts, with their aliases and typo options, are kept in a prefix
+trie, so resolving an input takes one step per character. A prefix
+shared by texts of different commands is reported as ambiguous.
+"""
+
+# imports: library
+import dataclasses
+import threading
+from typing import Any, Callable
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PluginCommand:
+    """Command added at runtime, with its own handler"""
+
+    name: str
+    help_text: str
+    handler: Callable[[list[str]], None]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Resolution:
+    """Result of resolving a command text"""
+
+    command: Any = None
+    candidates: tuple[str, ...] = ()
+
+    @property
+    def is_ambiguous(self) -> bool:
+        """Get whether the text is a prefix of several commands"""
+        return self.command is None and len(self.candidates) > 1
+
+
+def command_name(command: Any) -> str | None:
+    """Name of a command: its enum value or plug-in name"""
+
+    if isinstance(command, PluginCommand):
+        return command.name
+
+    value: Any = getattr(command, 'value', None)
+
+    return value if isinstance(value, str) else None
+
+
+@dataclasses.dataclass(slots=True)
+class _Node:
+    """Trie node"""
+
+    children: dict[str, '_Node'] = dataclasses.field(default_factory=dict)
+    # command of the text ending at this node
+    command: Any = None
+    # commands of all texts below this node -> their name or shortest text
+    commands: dict[Any, str] = dataclasses.field(default_factory=dict)
+
+
+class CommandRegistry:
+    """Command texts in a prefix trie"""
+
+    def __init__(self, command_texts: dict[str, Any] | None = None) -> None:
+
+        self._lock: threading.Lock = threading.Lock()
+        self._root: _Node = _Node()
+        self._plugins: dict[str, PluginCommand] = {}
+
+        for text, command in (command_texts or {}).items():
+            self.add(text, command)
+
+    def add(self, text: str, command: Any) -> None:
+        """Add a command text, an alias or a typo option"""
+
+        if len(text) == 0:
+            raise ValueError('Empty command text')
+
+        with self._lock:
+            node: _Node = self._root
+            self._reach(node, text, command)
+            for character in text:
+                node = node.children.setdefault(character, _Node())
+                self._reach(node, text, command)
+
+            if node.command is not None and node.command != command:
+                raise ValueError(f'Command text already registered: {text}')
+            node.command = command
+
+    @staticmethod
+    def _reach(node: _Node, text: str, command: Any) -> None:
+        """Record a command as reachable below a node, by its name if possible"""
+
+        known_text: str | None = node.commands.get(command, None)
+        if known_text is None or text == command_name(command) \
+                or (known_text != command_name(command) and len(text) < len(known_text)):
+            node.commands[command] = text
+
+    def register_plugin(self, plugin: PluginCommand, aliases: tuple[str, ...] = ()) -> None:
+        """Add a plug-in command under its name and aliases"""
+
+        for text in (plugin.name, *aliases):
+            self.add(text, plugin)
+
+        self._plugins[plugin.name] = plugin
+
+    @property
+    def plugins(self) -> tuple[PluginCommand, ...]:
+        """Get the plug-in commands"""
+        return tuple(self._plugins.values())
+
+    def resolve(self, text: str) -> Resolution:
+        """Resolve a full command text or an unambiguous prefix"""
+
+        node: _Node | None = self._root
+        for character in text:
+            node = node.children.get(character, None)
+            if node is None:
+                return Resolution()
+
+        if node.command is not None:
+            return Resolution(command=node.command, candidates=(text,))
+
+        if len(node.commands) == 1:
+            command, command_text = next(iter(node.commands.items()))
+            return Resolution(command=command, candidates=(command_text,))
+
+        return Resolution(candidates=tuple(sorted(node.commands.values())))
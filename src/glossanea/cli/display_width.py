@@ -0,0 +1,110 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Display width of text
+
+A code point takes no terminal column when it is a combining mark or
+another zero-width character, two columns when it is a wide East Asian
+character, and one column otherwise. The widths are kept in a two-level
+table of 256 code point blocks, each built from the Unicode database
+when first needed. Blocks of equal widths share one entry, so the table
+stays small, and a lookup is two indexings.
+"""
+
+# imports: library
+import functools
+import sys
+import unicodedata
+
+BLOCK_BITS: int = 8
+BLOCK_MASK: int = (1 << BLOCK_BITS) - 1
+BLOCK_COUNT: int = (sys.maxunicode >> BLOCK_BITS) + 1
+
+# texts kept with their width
+WIDTH_CACHE_SIZE: int = 4096
+
+ZERO_WIDTH_CATEGORIES: frozenset[str] = frozenset({'Mn', 'Me', 'Cf', 'Cc'})
+WIDE_EAST_ASIAN_WIDTHS: frozenset[str] = frozenset({'W', 'F'})
+
+# shown as a hyphen, even though it is a format character
+SOFT_HYPHEN: int = 0x00AD
+# Hangul vowels and final consonants, joined to the preceding syllable
+HANGUL_JOINING: range = range(0x1160, 0x1200)
+
+# block index -> widths of its code points, None until built
+_blocks: list[bytes | None] = [None] * BLOCK_COUNT
+# widths -> the block shared by all blocks with those widths
+_shared_blocks: dict[bytes, bytes] = {}
+
+
+def _code_point_width(code_point: int) -> int:
+    """Width of a code point, from the Unicode database"""
+
+    if code_point in HANGUL_JOINING:
+        return 0
+
+    character: str = chr(code_point)
+
+    if unicodedata.category(character) in ZERO_WIDTH_CATEGORIES and code_point != SOFT_HYPHEN:
+        return 0
+
+    if unicodedata.east_asian_width(character) in WIDE_EAST_ASIAN_WIDTHS:
+        return 2
+
+    return 1
+
+
+def _build_block(block_index: int) -> bytes:
+    """Build the widths of a block, sharing them with equal blocks"""
+
+    first: int = block_index << BLOCK_BITS
+    widths: bytes = bytes(_code_point_width(code_point)
+                          for code_point in range(first, first + BLOCK_MASK + 1))
+
+    block: bytes = _shared_blocks.setdefault(widths, widths)
+    _blocks[block_index] = block
+
+    return block
+
+
+def char_width(character: str) -> int:
+    """Columns taken by a character"""
+
+    code_point: int = ord(character)
+
+    block: bytes | None = _blocks[code_point >> BLOCK_BITS]
+    if block is None:
+        block = _build_block(code_point >> BLOCK_BITS)
+
+    return block[code_point & BLOCK_MASK]
+
+
+def text_width(text: str) -> int:
+    """Columns taken by a text, printable ASCII takes one per character"""
+
+    if text.isascii():
+        return len(text)
+
+    return _text_width(text)
+
+
+@functools.lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def _text_width(text: str) -> int:
+    """Columns taken by a text with non-ASCII characters"""
+    return sum(map(char_width, text))
+
+
+def clip(text: str, width: int) -> str:
+    """Longest start of a text fitting into a width"""
+
+    if text.isascii():
+        return text[:width]
+
+    used: int = 0
+    for index, character in enumerate(text):
+        used += char_width(character)
+        if used > width:
+            return text[:index]
+
+    return text
@@ -6,13 +6,25 @@
 
 # imports: library
 import enum
+import functools
 from functools import reduce
+from typing import Any, Callable
+
+# imports: project
+from glossanea.cli import backend
+from glossanea.cli.display_width import text_width
+from glossanea.cli.screen import ScreenSink
 
 NO_BREAK_SPACE: str = '\u00a0'
 
 DISPLAY_WIDTH: int = 100
 BLANK: str = ' ............ '
 
+# wrapped texts kept, by text, width and line starts
+WRAP_CACHE_SIZE: int = 4096
+# section titles kept, by title and width
+TITLE_CACHE_SIZE: int = 64
+
 
 class Align(enum.Enum):
     """Enum of string alignments with formatter values"""
@@ -34,66 +46,110 @@ class Spacing(enum.Enum):
     APART = enum.auto()
 
 
-# template creation -------------------------------------------------- #
+# layout ------------------------------------------------------------- #
 
-def _template(filler: str = ' ', align: Align = Align.LEFT, width: int = -1) -> str:
-    """Template"""
+def _align(text: str, width: int, align: Align = Align.LEFT, filler: str = ' ') -> str:
+    """Pad a text to a display width, a wider text is kept whole"""
 
-    if not isinstance(width, int):
-        raise ValueError('Given width is not an integer')
-    if width == -1:
-        width = DISPLAY_WIDTH
-    if not width > 0:
-        raise ValueError('Illegal width parameter')
+    padding: int = width - text_width(text)
+
+    if padding <= 0:
+        return text
 
-    filler_escaping: str = '\\' if filler in {'{', '}'} else ''
+    if align == Align.LEFT:
+        return text + filler * padding
 
-    template: str = f':{filler_escaping}{filler}{align.value}{width}'
+    if align == Align.RIGHT:
+        return filler * padding + text
 
-    return '{' + template + '}'
+    return filler * (padding // 2) + text + filler * (padding - padding // 2)
 
 
 def _block_lines(text: str,
                  width: int = -1,
                  line_start_first: str = '',
                  line_start_all: str = ''
-                 ) -> list[str]:
+                 ) -> tuple[str, ...]:
     """Block lines"""
 
     if width == -1:
         width = DISPLAY_WIDTH
 
-    lines: list[str] = []
+    return _wrapped_lines(text, width, line_start_first, line_start_all)
 
-    line_build: str = _init_line(line_start_first, line_start_all)
-    line_start_length: int = len(line_build)
 
-    words: list[str] = text.split(' ')
+@functools.lru_cache(maxsize=WRAP_CACHE_SIZE)
+def _wrapped_lines(text: str,
+                   width: int,
+                   line_start_first: str,
+                   line_start_all: str,
+                   ) -> tuple[str, ...]:
+    """Wrap text into padded lines"""
 
-    while True:
+    prefix: str = _init_line(line_start_first, line_start_all)
+    prefix_next: str = _init_line(' ' * text_width(line_start_first), line_start_all)
+    # display widths are lengths when all is ASCII
+    is_ascii: bool = text.isascii() and prefix.isascii() and prefix_next.isascii()
 
-        if len(words) != 0:
-            if len(line_build + ' ' + words[0]) <= width:
+    lines: list[str] = [
+        (prefix if index == 0 else prefix_next) + text[line_start:line_end]
+        for index, (line_start, line_end)
+        in enumerate(_line_slices(text, width, text_width(prefix), is_ascii))
+    ]
 
-                if len(line_build) > line_start_length:
-                    line_build += ' '
+    if is_ascii:
+        return tuple(line.ljust(width) for line in lines)
 
-                line_build += words.pop(0)
-                continue
+    return tuple(_align(line, width) for line in lines)
 
-        line_build = line_build.ljust(width, ' ')
-        lines.append(line_build)
 
-        # start new line
-        if len(line_start_first) > 0:
-            line_build = _init_line(''.ljust(len(line_start_first), ' '), line_start_all)
-        else:
-            line_build = _init_line('', line_start_all)
+def _line_slices(text: str, width: int, start_length: int, is_ascii: bool) -> list[tuple[int, int]]:
+    """Place words on lines by their offsets in the text, return the slice of each line
+
+    Each word needs room for a separating space, even the first on a line.
+    A word too long for any line is put on a line of its own.
+    """
+
+    slices: list[tuple[int, int]] = []
+
+    length: int = start_length
+    # slice of the text on the current line
+    line_start: int = 0
+    line_end: int = 0
+    has_text: bool = False
+
+    text_length: int = len(text)
+    offset: int = 0
 
-        if len(words) == 0:
+    while True:
+        end: int = text.find(' ', offset)
+        if end == -1:
+            end = text_length
+        word_length: int = end - offset if is_ascii else text_width(text[offset:end])
+
+        if length + 1 + word_length > width and length > start_length:
+            slices.append((line_start, line_end))
+            length = start_length
+            line_start = line_end
+            has_text = False
+
+        if length > start_length:
+            length += 1
+        length += word_length
+
+        if not has_text and word_length > 0:
+            line_start = offset
+            has_text = True
+        if has_text:
+            line_end = end
+
+        if end == text_length:
             break
+        offset = end + 1
+
+    slices.append((line_start, line_end))
 
-    return lines
+    return slices
 
 
 def _init_line(line_start_first: str, line_start_all: str) -> str:
@@ -114,13 +170,21 @@ def _init_line(line_start_first: str, line_start_all: str) -> str:
 
 def section_title(title: str) -> None:
     """Section title"""
+    replay(_section_title_text(title.upper(), DISPLAY_WIDTH))
 
-    title: str = title.upper()
 
-    empty_line()
-    center(''.ljust(len(title) + 10, '='))
-    center('===  ' + title + '  ===')
-    center(''.ljust(len(title) + 10, '='))
+@functools.lru_cache(maxsize=TITLE_CACHE_SIZE)
+def _section_title_text(title: str, width: int) -> str:  # pylint: disable=unused-argument
+    """Rendered section title, the width only keys the cache"""
+
+    def draw() -> None:
+        """Draw"""
+        empty_line()
+        center('=' * (text_width(title) + 10))
+        center('===  ' + title + '  ===')
+        center('=' * (text_width(title) + 10))
+
+    return render(draw)
 
 
 def words_table(*word_lists: list[str]) -> None:
@@ -134,24 +198,18 @@ def words_table(*word_lists: list[str]) -> None:
     max_word_length: int = 1
     for word_list in word_lists:
         for word in word_list:
-            max_word_length = max(max_word_length, len(word))
+            max_word_length = max(max_word_length, text_width(word))
 
     full_width: int = (max_word_length + 3) * word_count + 1
     left_padding: str = ' ' * max(0, int((DISPLAY_WIDTH - full_width) / 2))
 
-    def horizontal_line(width: int) -> None:
-        """Top and bottom table line"""
-        print(left_padding, end='')
-        print(' ', '-' * (width - 2), sep='')
+    horizontal_line: str = left_padding + ' ' + '-' * (full_width - 2)
 
-    horizontal_line(full_width)
+    backend.frame.line(horizontal_line)
     for word_list in word_lists:
-        print(left_padding, end='')
-        for word in word_list:
-            print('|', end=' ')
-            print(_template(' ', Align.LEFT, max_word_length).format(word), end=' ')
-        print('|')
-    horizontal_line(full_width)
+        cells: str = ''.join('| ' + _align(word, max_word_length) + ' ' for word in word_list)
+        backend.frame.line(left_padding + cells + '|')
+    backend.frame.line(horizontal_line)
 
 
 def new_words_extension(data: list[str]):
@@ -162,14 +220,13 @@ def new_words_extension(data: list[str]):
 
     empty_line()
 
-    print_list: list[str] = _block_lines(data.pop(0), DISPLAY_WIDTH, '□ ', '')
+    print_list: list[str] = list(_block_lines(data[0], DISPLAY_WIDTH, '□ ', ''))
 
-    if len(data) > 0:
-        for unit in data:
-            print_list += _block_lines(unit, DISPLAY_WIDTH, '  ', '')
+    for unit in data[1:]:
+        print_list += _block_lines(unit, DISPLAY_WIDTH, '  ', '')
 
     for line in print_list:
-        print(line)
+        backend.frame.line(line)
 
 
 def framed(parts: list[str], width_fraction: float) -> None:
@@ -185,12 +242,11 @@ def framed(parts: list[str], width_fraction: float) -> None:
     for part in parts:
 
         if NO_BREAK_SPACE in part:
-            to_pad: int = width - len(part)
+            to_pad: int = width - text_width(part)
             padding_right: int = to_pad // 2  # div
-            size_with_right: int = len(part) + padding_right
             # padding_left = padding_right + (to_pad % 2) # same + mod
 
-            lines.append(part.rjust(size_with_right, ' ').ljust(width, ' '))
+            lines.append(_align(' ' * padding_right + part, width))
 
             continue
 
@@ -216,27 +272,26 @@ def numbered_sentence(number: int,
     if formatting == Formatting.INDENTED:
         line_start_all = '  | '
 
-    print_list: list[str] = _block_lines(sentence, DISPLAY_WIDTH, line_start_first, line_start_all)
+    print_list: tuple[str, ...] = _block_lines(sentence, DISPLAY_WIDTH,
+                                               line_start_first, line_start_all)
 
     for line in print_list:
-        print(line)
+        backend.frame.line(line)
 
 
 def simple(text: str):
     """Simple"""
 
-    print_list: list[str] = _block_lines(text, DISPLAY_WIDTH, '', '')
+    print_list: tuple[str, ...] = _block_lines(text, DISPLAY_WIDTH, '', '')
 
     for line in print_list:
-        print(line)
+        backend.frame.line(line)
 
 
 def center(text: str, filler: str = ' ') -> None:
     """Center"""
 
-    template: str = _template(filler, Align.CENTER, DISPLAY_WIDTH)
-    text: str = ' ' + text + ' '
-    print(template.format(text))
+    backend.frame.line(_align(' ' + text + ' ', DISPLAY_WIDTH, Align.CENTER, filler))
 
 
 def value_pair_list(collection: list[list[str]],
@@ -245,23 +300,13 @@ def value_pair_list(collection: list[list[str]],
                     ) -> None:
     """Value pair list"""
 
-    template: str = '  '
+    longest_key: int = 1
 
     if formatting == Formatting.REGULAR:
-        longest_key = 1
-
-        for pair in collection:
-            longest_key = max(longest_key, len(pair[0]))
-
-        template += _template(' ', Align.LEFT, longest_key) + ' : {}'
-
-    elif formatting == Formatting.WIDE:
         for pair in collection:
-            pair[0] = pair[0] + ' '
+            longest_key = max(longest_key, text_width(pair[0]))
 
-        template += '{0:.<46} : {1: <49}'
-
-    else:
+    elif formatting != Formatting.WIDE:
         raise ValueError('Illegal format parameter')
 
     if spacing == Spacing.CLOSE:
@@ -270,23 +315,73 @@ def value_pair_list(collection: list[list[str]],
     for pair in collection:
         if spacing == Spacing.APART:
             empty_line()
-        print(template.format(pair[0], pair[1]))
+        if formatting == Formatting.WIDE:
+            backend.frame.line('  ' + _align(pair[0] + ' ', 46, Align.LEFT, '.')
+                               + ' : ' + _align(pair[1], 49))
+        else:
+            backend.frame.line('  ' + _align(pair[0], longest_key) + ' : ' + pair[1])
 
 
 # special displays --------------------------------------------------- #
 
 def empty_line() -> None:
     """Empty line"""
-    print()
+    backend.frame.line()
 
 
 # message displays --------------------------------------------------- #
 
 def warning(text: str) -> None:
     """Warning"""
-    print(text)
+    backend.frame.line(text)
 
 
 def error(text: str) -> None:
     """Error"""
-    print(text)
+    backend.frame.line(text)
+
+
+# pre-rendered displays ---------------------------------------------- #
+
+def render(draw_fn: Callable[[], None]) -> str:
+    """Render the displays of a drawing function into text"""
+    return backend.frame.record(draw_fn)
+
+
+def replay(text: str) -> None:
+    """Display rendered text"""
+    backend.frame.write(text)
+
+
+def unit_block(unit_data: Any, name: str, draw_fn: Callable[[], None]) -> None:
+    """Display a block which is the same every time for a unit
+
+    The block is rendered once per display width and kept with the
+    loaded unit data, so it is dropped along with the unit.
+    """
+
+    rendered_block: Callable[[str, Callable[[], str]], str] | None = \
+        getattr(unit_data, 'rendered_block', None)
+
+    if rendered_block is None:
+        draw_fn()
+        return
+
+    replay(rendered_block(f'{name}:{DISPLAY_WIDTH}', lambda: render(draw_fn)))
+
+
+# frame -------------------------------------------------------------- #
+
+def flush() -> None:
+    """Write the displayed text to the terminal"""
+    backend.frame.flush()
+
+
+def full_screen() -> None:
+    """Switch to full-screen output, which only redraws changed rows"""
+    backend.set_sink(ScreenSink(min_columns=DISPLAY_WIDTH))
+
+
+def close() -> None:
+    """Write the displayed text and leave the terminal ready for other output"""
+    backend.close()
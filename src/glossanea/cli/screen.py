@@ -0,0 +1,251 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Full-screen output
+
+The screen shows a page: the output since the last page change, with
+the prompt on its last row. Frames are added below each other while
+they fit. A frame starting with rows already on the page, e.g. the
+words table before the next item, replaces the page from those rows on,
+so it is drawn at the same place. Only the rows which differ from what
+the terminal shows are sent.
+
+While the terminal is narrower than the output is laid out for, rows
+would be cut, so the output scrolls and the terminal wraps the lines.
+"""
+
+# imports: library
+import dataclasses
+import logging
+import shutil
+import sys
+from typing import Callable, TextIO
+
+# imports: project
+from glossanea.cli import backend
+from glossanea.cli.display_width import clip, text_width
+
+CSI: str = '\x1b['
+CLEAR_SCREEN: str = CSI + '2J'
+CLEAR_LINE: str = CSI + '2K'
+CLEAR_TO_SCREEN_END: str = CSI + 'J'
+
+# first lines by which a frame is recognised when drawn again
+PAGE_MATCH_LINES: int = 3
+
+# size used when the terminal size is unknown
+FALLBACK_SIZE: tuple[int, int] = (100, 30)
+
+
+def _cursor_to(row: int, column: int = 0) -> str:
+    """Escape sequence moving the cursor, from 0-based coordinates"""
+
+    if column == 0:
+        return f'{CSI}{row + 1}H'
+
+    return f'{CSI}{row + 1};{column + 1}H'
+
+
+def _row_update(row: int, shown: str, line: str) -> str:
+    """Escape sequences and text replacing a row, moving past its indentation"""
+
+    indentation: int = len(line) - len(line.lstrip(' '))
+
+    clear: str = CLEAR_LINE if len(shown) > 0 else ''
+
+    return _cursor_to(row, indentation) + clear + line[indentation:]
+
+
+@dataclasses.dataclass(slots=True)
+class Geometry:
+    """Terminal size followed by the screen, and the width the output needs"""
+
+    # size given instead of the terminal size
+    fixed_size: tuple[int, int] | None = None
+    min_columns: int = 0
+    row_count: int = 0
+    column_count: int = 0
+
+
+@dataclasses.dataclass(slots=True)
+class ShownFrame:
+    """What the terminal shows from the previous frames"""
+
+    # rows shown by the terminal, None until the screen is cleared
+    rows: list[str] | None = None
+    is_scrolling: bool = False
+
+
+class ScreenSink(backend.Sink):
+    """Full-screen output with ANSI escape sequences"""
+
+    def __init__(self,
+                 stream: TextIO | None = None,
+                 size: tuple[int, int] | None = None,
+                 input_fn: Callable[[str], str] = input,
+                 min_columns: int = 0,
+                 ) -> None:
+
+        self._stream: TextIO | None = stream
+        self._input_fn: Callable[[str], str] = input_fn
+
+        self._geometry: Geometry = Geometry(fixed_size=size, min_columns=min_columns)
+        self._shown: ShownFrame = ShownFrame()
+        self._page: list[str] = []
+
+        self.bytes_written: int = 0
+
+    @property
+    def stream(self) -> TextIO:
+        """Get the output stream"""
+        return self._stream if self._stream is not None else sys.stdout
+
+    # page ----------------------------------------------------------- #
+
+    def _add_frame(self, text: str) -> None:
+        """Add the lines of a frame to the page"""
+
+        lines: list[str] = [line.rstrip() for line in text.split('\n')]
+        if len(lines) > 0 and lines[-1] == '':
+            lines.pop()
+
+        if len(lines) == 0:
+            return
+
+        start_lines: list[str] = lines[:PAGE_MATCH_LINES]
+
+        if any(len(line) > 0 for line in start_lines):
+            for page_row in range(len(self._page) - len(start_lines), -1, -1):
+                if self._page[page_row:page_row + len(start_lines)] == start_lines:
+                    del self._page[page_row:]
+                    break
+
+        # the prompt needs a row below the frame
+        if len(self._page) + len(lines) + 1 > self._page_row_count():
+            self._page.clear()
+
+        self._page.extend(lines)
+
+    def _page_row_count(self) -> int:
+        """Rows available to the page, the last row stays free for the cursor"""
+        return max(1, self._geometry.row_count - 1)
+
+    # rendering ------------------------------------------------------ #
+
+    def _update_size(self) -> None:
+        """Follow the terminal size, the screen is redrawn when it changes"""
+
+        geometry: Geometry = self._geometry
+
+        column_count, row_count = geometry.fixed_size if geometry.fixed_size is not None \
+            else shutil.get_terminal_size(FALLBACK_SIZE)
+
+        if (row_count, column_count) != (geometry.row_count, geometry.column_count):
+            geometry.row_count = row_count
+            geometry.column_count = column_count
+            self._shown.rows = None
+
+    def _scrolls(self) -> bool:
+        """Check whether the output scrolls, as the terminal is too narrow"""
+
+        is_narrow: bool = self._geometry.column_count < self._geometry.min_columns
+
+        if is_narrow and not self._shown.is_scrolling:
+            logging.warning('Terminal narrower than %s columns, scrolling until it is wider',
+                            self._geometry.min_columns)
+            self.close()
+            self._shown.rows = None
+            self._page.clear()
+
+        self._shown.is_scrolling = is_narrow
+
+        return is_narrow
+
+    def _render(self, prompt: str | None = None) -> tuple[int, int]:
+        """Send the rows which changed, return the cursor position after the page"""
+
+        lines: list[str] = self._page + ([prompt] if prompt is not None else [])
+        lines = lines[-self._page_row_count():]
+
+        target: list[str] = [clip(line, self._geometry.column_count) for line in lines]
+        target += [''] * (self._page_row_count() - len(target))
+
+        chunks: list[str] = []
+
+        if self._shown.rows is None:
+            chunks.append(CLEAR_SCREEN)
+            self._shown.rows = [''] * len(target)
+        rows: list[str] = self._shown.rows
+
+        # rows below the page are cleared at once
+        clear_row: int = len(lines)
+        if any(len(line) > 0 for line in rows[clear_row:]):
+            chunks.append(_cursor_to(clear_row) + CLEAR_TO_SCREEN_END)
+            rows[clear_row:] = target[clear_row:]
+
+        for row, line in enumerate(target[:clear_row]):
+            if line != rows[row]:
+                chunks.append(_row_update(row, rows[row], line))
+                rows[row] = line
+
+        cursor: tuple[int, int] = (len(lines) - 1, text_width(target[len(lines) - 1])) \
+            if prompt is not None else (len(lines), 0)
+        chunks.append(_cursor_to(*cursor))
+
+        self._send(''.join(chunks))
+
+        return cursor
+
+    def _send(self, text: str) -> None:
+        """Write to the terminal"""
+
+        self.bytes_written += len(text.encode('UTF-8'))
+        self.stream.write(text)
+        self.stream.flush()
+
+    # sink ----------------------------------------------------------- #
+
+    def write(self, text: str) -> None:
+
+        self._update_size()
+
+        if self._scrolls():
+            self._send(text)
+            return
+
+        self._add_frame(text)
+        self._render()
+
+    def read_line(self, prompt: str) -> str:
+        return self.write_and_read_line('', prompt)
+
+    def write_and_read_line(self, text: str, prompt: str) -> str:
+
+        self._update_size()
+
+        if self._scrolls():
+            self._send(text + prompt)
+            return self._input_fn('')
+
+        self._add_frame(text)
+        row, _ = self._render(prompt)
+
+        line: str = self._input_fn('')
+
+        # the terminal echoed the answer after the prompt, and moved to the next row
+        self._page.append((prompt + line).rstrip())
+        if self._shown.rows is not None:
+            self._shown.rows[row] = clip(prompt + line, self._geometry.column_count).rstrip()
+
+        return line
+
+    def close(self) -> None:
+
+        if self._shown.rows is None:
+            return
+
+        last_row: int = max((row for row, line in enumerate(self._shown.rows) if len(line) > 0),
+                            default=-1)
+
+        self._send(_cursor_to(last_row + 1))
@@ -5,11 +5,17 @@
 """User Input"""
 
 # imports: project
+from glossanea.cli import backend
 from glossanea.cli import output
 
 
+def read_line(prompt: str = '') -> str:
+    """Read a line of user input, once the pending output is displayed"""
+    return backend.frame.read_line(prompt)
+
+
 def wait_for_enter() -> None:
     """Wait for the user to press ENTER"""
 
     output.empty_line()
-    _ = input('Press ENTER to continue...')
+    _ = read_line('Press ENTER to continue...')
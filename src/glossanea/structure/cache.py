@@ -0,0 +1,208 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Persistent cache of parsed and validated unit data"""
+
+# imports: library
+import hashlib
+import logging
+import os
+import os.path
+import pickle
+import tempfile
+from typing import Any
+
+# imports: dependencies
+from xdg_base_dirs import xdg_cache_home
+
+# imports: project
+from glossanea import version
+
+CACHE_FORMAT_VERSION: int = 3
+CACHE_FILE_EXTENSION: str = '.pickle'
+SIZE_LIMIT: int = 32 * 1024 * 1024
+
+_enabled: bool = True
+
+
+def disable() -> None:
+    """Disable the cache for the rest of the process"""
+
+    global _enabled  # pylint: disable=global-statement
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Get whether the cache is enabled"""
+    return _enabled
+
+
+def cache_dir_path(*subdir_names: str) -> str:
+    """Program cache dir path, created if missing"""
+
+    dir_path: str = os.path.join(xdg_cache_home(), version.PROGRAM_NAME, *subdir_names)
+
+    if not os.path.isdir(dir_path):
+        os.makedirs(dir_path, mode=0o740, exist_ok=True)
+
+    return dir_path
+
+
+def path_key(path: str) -> str:
+    """Cache file name part identifying a file or dir path"""
+    return hashlib.sha256(os.path.abspath(path).encode('UTF-8')).hexdigest()
+
+
+def data_dir_file_path(data_dir_path: str, prefix: str) -> str:
+    """Cache file path of a JSON record kept per data dir"""
+    return os.path.join(cache_dir_path(), f'{prefix}-{path_key(data_dir_path)}.json')
+
+
+def _entry_file_path(full_path: str) -> str:
+    """Cache entry file path for a data file path"""
+    return os.path.join(cache_dir_path('units'), path_key(full_path) + CACHE_FILE_EXTENSION)
+
+
+def _content_hash(full_path: str) -> str:
+    """Content hash of a data file"""
+
+    with open(full_path, 'rb') as fh:
+        return hashlib.sha256(fh.read()).hexdigest()
+
+
+def _read_entry(entry_file_path: str) -> dict[str, Any] | None:
+    """Read a cache entry, ignoring unreadable or outdated ones"""
+
+    try:
+        with open(entry_file_path, 'rb') as fh:
+            entry: Any = pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError) as exc:
+        logging.warning('Ignoring unreadable cache entry "%s": %s', entry_file_path, exc)
+        return None
+
+    if not isinstance(entry, dict):
+        return None
+
+    if entry.get('format') != CACHE_FORMAT_VERSION:
+        return None
+
+    if entry.get('program_version') != version.__version__:
+        return None
+
+    return entry
+
+
+def _write_entry(entry_file_path: str, entry: dict[str, Any]) -> None:
+    """Write a cache entry atomically"""
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry_file_path),
+                                     suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, entry_file_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load(full_path: str) -> tuple[dict[str, Any], str | None] | None:
+    """Load cached unit data for a data file, or None on a miss
+
+    The data comes with the fingerprint of the unit schema it passed, None
+    if it failed validation.
+    """
+
+    if not _enabled:
+        return None
+
+    try:
+        stat: os.stat_result = os.stat(full_path)
+        entry_file_path: str = _entry_file_path(full_path)
+    except OSError:
+        return None
+
+    entry: dict[str, Any] | None = _read_entry(entry_file_path)
+
+    if entry is None:
+        return None
+
+    if entry['path'] != os.path.abspath(full_path) or entry['size'] != stat.st_size:
+        return None
+
+    try:
+        if entry['mtime_ns'] != stat.st_mtime_ns:
+            # touched, but possibly unchanged (e.g. a fresh checkout)
+            if _content_hash(full_path) != entry['content_hash']:
+                return None
+            entry['mtime_ns'] = stat.st_mtime_ns
+            _write_entry(entry_file_path, entry)
+        else:
+            # keep recently used entries at the end of the eviction order
+            os.utime(entry_file_path)
+    except OSError as exc:
+        logging.warning('Failed to refresh cache entry "%s": %s', entry_file_path, exc)
+
+    return entry['unit_data'], entry['schema_fingerprint']
+
+
+def store(full_path: str, unit_data: dict[str, Any], schema_fingerprint: str | None = None) -> None:
+    """Store unit data for a data file, with the fingerprint of the unit schema it passed"""
+
+    if not _enabled:
+        return
+
+    try:
+        stat: os.stat_result = os.stat(full_path)
+        entry: dict[str, Any] = {
+            'format': CACHE_FORMAT_VERSION,
+            'program_version': version.__version__,
+            'path': os.path.abspath(full_path),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'content_hash': _content_hash(full_path),
+            'unit_data': unit_data,
+            'schema_fingerprint': schema_fingerprint,
+        }
+        entry_file_path: str = _entry_file_path(full_path)
+        _write_entry(entry_file_path, entry)
+        _evict(os.path.dirname(entry_file_path))
+    except OSError as exc:
+        logging.warning('Failed to store cache entry for "%s": %s', full_path, exc)
+
+
+def _evict(entry_dir_path: str) -> None:
+    """Remove least recently used entries while the cache is over its size limit"""
+
+    entries: list[tuple[float, int, str]] = []
+    total_size: int = 0
+
+    with os.scandir(entry_dir_path) as it:
+        for dir_entry in it:
+            if not dir_entry.name.endswith(CACHE_FILE_EXTENSION):
+                continue
+            try:
+                stat: os.stat_result = dir_entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+            total_size += stat.st_size
+
+    if total_size <= SIZE_LIMIT:
+        return
+
+    entries.sort()
+    for _, size, path in entries:
+        if total_size <= SIZE_LIMIT:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
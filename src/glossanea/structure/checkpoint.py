@@ -0,0 +1,203 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Checkpoints of unfinished units
+
+Each unit started but not finished has one fixed-size record: the task
+index, the index of the item to resume at and a bit mask of the answered
+items. The records of a data dir live in one small binary file, rewritten
+atomically on every change.
+"""
+
+# imports: library
+import dataclasses
+import logging
+import os
+import os.path
+import struct
+import tempfile
+import threading
+
+# imports: dependencies
+from xdg_base_dirs import xdg_state_home
+
+# imports: project
+from glossanea import version
+from glossanea.structure import cache
+from glossanea.structure import config
+
+CHECKPOINT_FILE_MAGIC: bytes = b'GLCP'
+CHECKPOINT_FORMAT_VERSION: int = 1
+
+# magic, format version, record count
+HEADER: struct.Struct = struct.Struct('<4sBH')
+# week number, unit number, task count, task index, subtask index, answered item mask
+RECORD: struct.Struct = struct.Struct('<HBBBHQ')
+
+MAX_ANSWERED_ITEMS: int = 64
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Checkpoint:
+    """Position within an unfinished unit"""
+
+    task_count: int
+    task_index: int
+    subtask_index: int
+    answered: frozenset[int]
+
+
+_lock: threading.Lock = threading.Lock()
+_file_path: str | None = None
+_checkpoints: dict[tuple[int, int], Checkpoint] = {}
+
+
+def _checkpoint_file_path(data_dir_path: str) -> str:
+    """Checkpoint file path of a data dir"""
+
+    state_dir_path: str = os.path.join(xdg_state_home(), version.PROGRAM_NAME)
+
+    if not os.path.isdir(state_dir_path):
+        os.makedirs(state_dir_path, mode=0o740, exist_ok=True)
+
+    return os.path.join(state_dir_path, f'checkpoints-{cache.path_key(data_dir_path)}.bin')
+
+
+def _answered_mask(answered: frozenset[int]) -> int:
+    """Bit mask of answered item indexes"""
+
+    mask: int = 0
+    for index in answered:
+        if 0 <= index < MAX_ANSWERED_ITEMS:
+            mask |= 1 << index
+
+    return mask
+
+
+def _answered_items(mask: int) -> frozenset[int]:
+    """Answered item indexes of a bit mask"""
+    return frozenset(index for index in range(MAX_ANSWERED_ITEMS) if mask & (1 << index))
+
+
+def encode(checkpoints: dict[tuple[int, int], Checkpoint]) -> bytes:
+    """Encode checkpoints into their on-disk form"""
+
+    chunks: list[bytes] = [HEADER.pack(CHECKPOINT_FILE_MAGIC, CHECKPOINT_FORMAT_VERSION,
+                                       len(checkpoints))]
+
+    for (week_number, unit_number), item in sorted(checkpoints.items()):
+        chunks.append(RECORD.pack(week_number, unit_number, item.task_count, item.task_index,
+                                  item.subtask_index, _answered_mask(item.answered)))
+
+    return b''.join(chunks)
+
+
+def decode(content: bytes) -> dict[tuple[int, int], Checkpoint]:
+    """Decode checkpoints from their on-disk form"""
+
+    magic, format_version, count = HEADER.unpack_from(content, 0)
+
+    if magic != CHECKPOINT_FILE_MAGIC:
+        raise ValueError('Not a checkpoint file')
+
+    if format_version != CHECKPOINT_FORMAT_VERSION:
+        return {}
+
+    if len(content) != HEADER.size + count * RECORD.size:
+        raise ValueError(f'Checkpoint file size does not match its {count} records')
+
+    checkpoints: dict[tuple[int, int], Checkpoint] = {}
+
+    for week_number, unit_number, task_count, task_index, subtask_index, mask \
+            in RECORD.iter_unpack(content[HEADER.size:]):
+        checkpoints[(week_number, unit_number)] = Checkpoint(
+            task_count=task_count,
+            task_index=task_index,
+            subtask_index=subtask_index,
+            answered=_answered_items(mask),
+        )
+
+    return checkpoints
+
+
+def _current_checkpoints() -> dict[tuple[int, int], Checkpoint]:
+    """Checkpoints of the current data dir, read when the data dir changes"""
+
+    global _file_path, _checkpoints  # pylint: disable=global-statement
+
+    try:
+        file_path: str = _checkpoint_file_path(config.data_dir_path())
+    except OSError as exc:
+        logging.warning('Checkpoints unavailable: %s', exc)
+        _file_path = None
+        _checkpoints = {}
+        return _checkpoints
+
+    if file_path == _file_path:
+        return _checkpoints
+
+    _file_path = file_path
+    _checkpoints = {}
+
+    try:
+        with open(file_path, 'rb') as fh:
+            _checkpoints = decode(fh.read())
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, struct.error) as exc:
+        logging.warning('Ignoring unreadable checkpoint file "%s": %s', file_path, exc)
+
+    return _checkpoints
+
+
+def _write() -> None:
+    """Write the checkpoints of the current data dir atomically"""
+
+    if _file_path is None:
+        return
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(_file_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(encode(_checkpoints))
+        os.replace(temp_path, _file_path)
+    except OSError as exc:
+        logging.warning('Failed to write checkpoint file "%s": %s', _file_path, exc)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def load(week_number: int, unit_number: int, task_count: int) -> Checkpoint | None:
+    """Get the checkpoint of a unit, None if it has none or its tasks changed"""
+
+    with _lock:
+        item: Checkpoint | None = _current_checkpoints().get((week_number, unit_number), None)
+
+    if item is None or item.task_count != task_count or item.task_index >= task_count:
+        return None
+
+    return item
+
+
+def save(week_number: int, unit_number: int, item: Checkpoint) -> None:
+    """Record the checkpoint of a unit"""
+
+    with _lock:
+        checkpoints: dict[tuple[int, int], Checkpoint] = _current_checkpoints()
+
+        if checkpoints.get((week_number, unit_number), None) == item:
+            return
+
+        checkpoints[(week_number, unit_number)] = item
+        _write()
+
+
+def clear(week_number: int, unit_number: int) -> None:
+    """Remove the checkpoint of a finished unit"""
+
+    with _lock:
+        if _current_checkpoints().pop((week_number, unit_number), None) is not None:
+            _write()
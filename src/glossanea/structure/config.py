@@ -5,8 +5,12 @@
 """App"""
 
 # imports: library
+import dataclasses
 import json
+import logging
+import os
 import os.path
+import threading
 from typing import Any
 
 # imports: dependencies
@@ -14,12 +18,17 @@ from xdg_base_dirs import xdg_config_home
 
 # imports: project
 from glossanea import version
+from glossanea.cli import user_input
+from glossanea.structure import decoding
+from glossanea.structure.exceptions import DataError
 
 
 config_v1: dict[str, Any] = {}
 
 default: dict[str, Any] = config_v1
 
+ENV_DATA_DIR: str = 'GLOSSANEA_DATA_DIR'
+
 
 def _config_dir_path() -> str:
     """Config dir path"""
@@ -32,56 +41,222 @@ def _config_dir_path() -> str:
     return config_dir_path
 
 
-def _data_folder_path_file_path() -> str:
-    """Data folder path file path"""
-    return os.path.join(_config_dir_path(), 'data-folder.txt')
+def _mtime_ns(file_path: str) -> int | None:
+    """Modification time of a file, None if it does not exist"""
 
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
-def data_dir_path() -> str:
-    """Data dir path"""
 
-    data_folder_path_file_path: str = _data_folder_path_file_path()
+@dataclasses.dataclass(slots=True)
+class SettingsFileTimes:
+    """Modification times of the settings files when they were last read"""
 
-    try:
-        with open(data_folder_path_file_path, 'r', encoding='UTF-8') as fh_data_folder_path_file:
-            data_folder_path: str = fh_data_folder_path_file.read().strip()
-    except FileNotFoundError:
-        data_folder_path: str = ''
+    data_folder_file_mtime_ns: int | None = None
+    config_file_mtime_ns: int | None = None
+
+
+class Settings:
+    """Configuration resolved once and kept for the process
+
+    The data dir comes from, in order: an override (command line),
+    the environment, the data folder file, or the user.
+    """
+
+    def __init__(self) -> None:
+
+        self._lock: threading.RLock = threading.RLock()
+
+        self._config_dir_path: str | None = None
+
+        self._data_dir_override: str | None = None
+        self._data_dir_path: str | None = None
+        self._data_dir_from_file: bool = False
+
+        self._config: dict[str, Any] | None = None
+
+        self._file_times: SettingsFileTimes = SettingsFileTimes()
+
+    # file paths ----------------------------------------------------- #
+
+    @property
+    def config_dir_path(self) -> str:
+        """Get the config dir path, creating the dir on first use"""
+
+        if self._config_dir_path is None:
+            self._config_dir_path = _config_dir_path()
+
+        return self._config_dir_path
+
+    @property
+    def data_folder_file_path(self) -> str:
+        """Get the path of the file storing the data folder path"""
+        return os.path.join(self.config_dir_path, 'data-folder.txt')
+
+    @property
+    def config_file_path(self) -> str:
+        """Get the config file path"""
+        return os.path.join(self.config_dir_path, 'config.json')
+
+    # data dir ------------------------------------------------------- #
+
+    def set_data_dir_override(self, override_path: str | None) -> None:
+        """Use a data dir instead of the configured one"""
+
+        if override_path is not None and not os.path.isdir(override_path):
+            raise DataError(f'Data directory not found: "{override_path}"')
+
+        with self._lock:
+            self._data_dir_override = override_path
+            self._data_dir_path = None
+
+    @property
+    def data_dir_path(self) -> str:
+        """Get the data dir path, resolving it on first use"""
+
+        resolved_path: str | None = self._data_dir_path
+
+        if resolved_path is not None:
+            return resolved_path
+
+        with self._lock:
+            if self._data_dir_path is None:
+                self._data_dir_path = self._resolve_data_dir_path()
+
+            return self._data_dir_path
+
+    def _resolve_data_dir_path(self) -> str:
+        """Resolve the data dir path"""
+
+        self._data_dir_from_file = False
+
+        if self._data_dir_override is not None:
+            return self._data_dir_override
+
+        env_data_dir_path: str = os.environ.get(ENV_DATA_DIR, '')
+        if len(env_data_dir_path) > 0:
+            if os.path.isdir(env_data_dir_path):
+                return env_data_dir_path
+            logging.warning('Ignoring %s, not a directory: "%s"', ENV_DATA_DIR, env_data_dir_path)
+
+        self._data_dir_from_file = True
+
+        data_folder_file_path: str = self.data_folder_file_path
+
+        self._file_times.data_folder_file_mtime_ns = _mtime_ns(data_folder_file_path)
 
-    while not os.path.isdir(data_folder_path):
         try:
-            data_folder_path: str = input('Please specify the location of the data directory: ')
-        except KeyboardInterrupt:
+            with open(data_folder_file_path, 'r', encoding='UTF-8') as fh_data_folder_path_file:
+                data_folder_path: str = fh_data_folder_path_file.read().strip()
+        except FileNotFoundError:
             data_folder_path: str = ''
 
-    with open(data_folder_path_file_path, 'w', encoding='UTF-8') as fh_data_folder_path_file:
-        fh_data_folder_path_file.write(data_folder_path)
+        stored_data_folder_path: str = data_folder_path
 
-    return data_folder_path
+        while not os.path.isdir(data_folder_path):
+            try:
+                data_folder_path: str = user_input.read_line(
+                    'Please specify the location of the data directory: ')
+            except KeyboardInterrupt:
+                data_folder_path: str = ''
 
+        if data_folder_path != stored_data_folder_path:
+            with open(data_folder_file_path, 'w', encoding='UTF-8') as fh_data_folder_path_file:
+                fh_data_folder_path_file.write(data_folder_path)
+            self._file_times.data_folder_file_mtime_ns = _mtime_ns(data_folder_file_path)
 
-def check_data_dir_path() -> None:
-    """Check data dir path"""
-    _ = data_dir_path()
+        return data_folder_path
 
+    # config --------------------------------------------------------- #
 
-def _config_file_path() -> str:
-    """Config file path"""
-    return os.path.join(_config_dir_path(), 'config.json')
+    @property
+    def config(self) -> dict[str, Any]:
+        """Get the config, loading it on first use"""
 
+        config_dict: dict[str, Any] | None = self._config
 
-def config() -> dict[str, Any]:
-    """Config"""
+        if config_dict is not None:
+            return config_dict
 
-    config_file_path: str = _config_file_path()
+        with self._lock:
+            if self._config is None:
+                self._config = self._load_config()
 
-    try:
-        with open(config_file_path, 'r', encoding='UTF-8') as fh_config_file:
-            config_dict: dict = json.load(fh_config_file)
-    except FileNotFoundError:
-        config_dict: dict = default
+            return self._config
+
+    def _load_config(self) -> dict[str, Any]:
+        """Load the config file, creating it with defaults if missing"""
+
+        config_file_path: str = self.config_file_path
+
+        try:
+            config_dict: dict = decoding.load_file(config_file_path)
+        except decoding.DecodeError as exc:
+            msg: str = f'Failed to decode config file: "{config_file_path}"'
+            logging.error(msg)
+            raise DataError(msg) from exc
+        except FileNotFoundError:
+            config_dict: dict = default
+
+            with open(config_file_path, 'w', encoding='UTF-8') as fh_config_file:
+                json.dump(config_dict, fh_config_file, indent=2)
+
+        self._file_times.config_file_mtime_ns = _mtime_ns(config_file_path)
+
+        return config_dict
+
+    # reload --------------------------------------------------------- #
+
+    def reload_config_if_changed(self) -> bool:
+        """Drop the config if its file was modified, return whether it was"""
+
+        with self._lock:
+            if self._config is None \
+                    or _mtime_ns(self.config_file_path) == self._file_times.config_file_mtime_ns:
+                return False
+
+            logging.info('Reloading config file')
+            self._config = None
+
+        return True
+
+    def reload_data_dir_if_changed(self) -> bool:
+        """Resolve the data dir again if its file was modified, return whether it changed"""
 
-        with open(config_file_path, 'w', encoding='UTF-8') as fh_config_file:
-            json.dump(config_dict, fh_config_file, indent=2)
+        with self._lock:
+            if self._data_dir_path is None or not self._data_dir_from_file:
+                return False
 
-    return config_dict
+            if _mtime_ns(self.data_folder_file_path) \
+                    == self._file_times.data_folder_file_mtime_ns:
+                return False
+
+            previous_data_dir_path: str = self._data_dir_path
+            self._data_dir_path = self._resolve_data_dir_path()
+
+        if self._data_dir_path == previous_data_dir_path:
+            return False
+
+        logging.info('Data dir changed: "%s"', self._data_dir_path)
+
+        return True
+
+
+settings: Settings = Settings()
+
+
+def data_dir_path() -> str:
+    """Data dir path"""
+    return settings.data_dir_path
+
+
+def check_data_dir_path() -> None:
+    """Check data dir path"""
+    _ = data_dir_path()
+
+
+def config() -> dict[str, Any]:
+    """Config"""
+    return settings.config
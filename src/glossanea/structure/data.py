@@ -5,14 +5,187 @@
 """App"""
 
 # imports: library
-import json
+import enum
 import logging
 import os.path
-from typing import Any
+import threading
+from typing import Any, Callable, Iterator
+
+# imports: dependencies
+from jsonschema import Draft202012Validator
 
 # imports: project
 from glossanea.structure import config
+from glossanea.structure import database
+from glossanea.structure import decoding
+from glossanea.structure import pack
+from glossanea.structure.database import Database
 from glossanea.structure.exceptions import DataError
+from glossanea.structure.frozen import FrozenDict, freeze
+from glossanea.structure.pack import PackReader
+from glossanea.structure.schema import ValidationToken
+
+# readers of single-file courses, with the same section interface
+SectionSource = PackReader | Database
+
+
+class Backend(enum.Enum):
+    """Enum of unit data sources"""
+    AUTO = 'auto'
+    FILES = 'files'
+    PACK = 'pack'
+    SQLITE = 'sqlite'
+
+
+_backend: Backend = Backend.AUTO
+
+_section_sources: dict[str, SectionSource | None] = {}
+_section_sources_lock: threading.Lock = threading.Lock()
+
+
+class UnitData(FrozenDict):
+    """Read-only unit data, with the token of its unit-level validation
+
+    One loaded unit can serve any number of runs and threads.
+    """
+
+    validation_token: ValidationToken | None = None
+
+    # validation results are memoised per revision, read-only data keeps its first
+    revision: int = 0
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self._plans: dict[str, Any] = {}
+        self._blocks: dict[str, str] = {}
+
+    def task_plan(self, data_key: str, build_fn: Callable[['UnitData'], Any]) -> Any:
+        """Get the plan of a task, building it on first use"""
+
+        task_plan: Any = self._plans.get(data_key, None)
+
+        if task_plan is None:
+            task_plan = self._plans.setdefault(data_key, build_fn(self))
+
+        return task_plan
+
+    def rendered_block(self, name: str, render_fn: Callable[[], str]) -> str:
+        """Get a rendered display block of the unit, rendering it on first use"""
+
+        block: str | None = self._blocks.get(name, None)
+
+        if block is None:
+            block = self._blocks.setdefault(name, render_fn())
+
+        return block
+
+    def __reduce__(self):
+        # pickle as a plain dict, without the token
+        return dict, (dict(self.items()),)
+
+    def is_validated(self, data_validator: Draft202012Validator) -> bool:
+        """Check whether the task data of a validator passed unit-level validation"""
+
+        if self.validation_token is None:
+            return False
+
+        data_key: str | None = self.validation_token.data_key(data_validator)
+
+        if data_key is None or data_key not in self:
+            return False
+
+        return all(key in self for key in data_validator.schema.get('required', []))
+
+
+class LazyUnitData(UnitData):
+    """Unit data decoding each task section on first access
+
+    All keys are known up front, membership tests do not decode sections.
+    Sections are checked as they are decoded, a failed check revokes the
+    validation token.
+    """
+
+    def __init__(self, keys: list[str], loader: Callable[[str], Any]) -> None:
+        super().__init__()
+        self._keys: dict[str, None] = dict.fromkeys(keys)
+        self._loader: Callable[[str], Any] = loader
+        self._section_check: Callable[[str, Any], bool] | None = None
+
+    def __missing__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        value: Any = freeze(self._loader(key))
+        dict.__setitem__(self, key, value)
+        if self._section_check is not None and not self._section_check(key, value):
+            logging.warning('Section failed unit-level validation: %s', key)
+            self.validation_token = None
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self._keys else default
+
+    def keys(self):
+        return self._keys.keys()
+
+    def values(self):
+        return [self[key] for key in self._keys]
+
+    def items(self):
+        return [(key, self[key]) for key in self._keys]
+
+    def without(self, key: str) -> 'LazyUnitData':
+        """Get a view without a key, sharing the decoded sections"""
+
+        view: LazyUnitData = LazyUnitData([other for other in self._keys if other != key],
+                                          self._loader)
+
+        for other, value in dict.items(self):
+            if other != key:
+                dict.__setitem__(view, other, value)
+
+        return view
+
+    def set_validation(self,
+                       validation_token: ValidationToken,
+                       section_check: Callable[[str, Any], bool],
+                       ) -> None:
+        """Set the token and the check of sections decoded from now on"""
+
+        self.validation_token = validation_token
+        self._section_check = section_check
+
+    def is_validated(self, data_validator: Draft202012Validator) -> bool:
+        """Check whether the task data of a validator passed unit-level validation"""
+
+        if not super().is_validated(data_validator):
+            return False
+
+        # decode the sections the validator checks, checking them
+        for key in data_validator.schema.get('properties', {}):
+            if key in self:
+                _ = self[key]
+
+        return self.validation_token is not None
+
+    def is_decoded(self, key: str) -> bool:
+        """Check whether a section is already decoded"""
+        return dict.__contains__(self, key)
+
+
+def set_backend(backend: Backend) -> None:
+    """Select the unit data source"""
+
+    global _backend  # pylint: disable=global-statement
+    _backend = backend
 
 
 def data_file_path(file_subpath: str) -> str:
@@ -30,9 +203,8 @@ def load_json_file(file_subpath: str) -> dict[str, Any]:
     full_path: str = data_file_path(file_subpath)
 
     try:
-        with open(full_path, mode='r', encoding='UTF-8', newline=None) as fh:
-            return json.load(fh)
-    except json.JSONDecodeError as exc:
+        return decoding.load_file(full_path)
+    except decoding.DecodeError as exc:
         msg: str = f'Failed to decode JSON data file: "{file_subpath}"'
         logging.error(msg)
         raise DataError(msg) from exc
@@ -54,3 +226,84 @@ def load_text_file_lines(file_subpath: str) -> list[str]:
         msg: str = f'Data file not found: "{file_subpath}"'
         logging.error(msg)
         raise DataError(msg) from exc
+
+
+def section_source() -> SectionSource | None:
+    """Get the reader of the single-file course in the data folder, if it is used"""
+
+    if _backend == Backend.FILES:
+        return None
+
+    data_dir_path: str = config.data_dir_path()
+
+    with _section_sources_lock:
+        if data_dir_path not in _section_sources:
+            _section_sources[data_dir_path] = _open_section_source(data_dir_path)
+
+        return _section_sources[data_dir_path]
+
+
+def _open_current(data_dir_path: str,
+                  file_path: str,
+                  source_type: type[SectionSource],
+                  ) -> SectionSource | None:
+    """Open a single-file course, unless the automatic backend finds it out of date
+
+    With the automatic backend, a course file which can not be read, or
+    which was built from other data files than those in the folder, is
+    skipped.
+    """
+
+    try:
+        source: SectionSource = source_type(file_path)
+    except DataError as exc:
+        if _backend != Backend.AUTO:
+            raise
+        logging.warning('Skipping course file: %s', exc)
+        return None
+
+    changed_sources: list[str] = source.changed_sources(data_dir_path)
+
+    if len(changed_sources) == 0:
+        return source
+
+    logging.warning('Course file "%s" is out of date, data files changed since it was built: %s',
+                    file_path, ', '.join(changed_sources))
+
+    if _backend != Backend.AUTO:
+        return source
+
+    logging.warning('Using other course data instead, rebuild the course file to use it again')
+    source.close()
+
+    return None
+
+
+def _open_section_source(data_dir_path: str) -> SectionSource | None:
+    """Open the single-file course of the data folder according to the backend"""
+
+    pack_path: str = os.path.join(data_dir_path, pack.PACK_FILE_NAME)
+    database_path: str = os.path.join(data_dir_path, database.DATABASE_FILE_NAME)
+
+    if _backend in (Backend.AUTO, Backend.PACK) and os.path.isfile(pack_path):
+        reader: PackReader | None = _open_current(data_dir_path, pack_path, PackReader)
+        if reader is not None:
+            logging.info('Using course pack: "%s"', pack_path)
+            return reader
+
+    if _backend in (Backend.AUTO, Backend.SQLITE) and os.path.isfile(database_path):
+        course_database: Database | None = _open_current(data_dir_path, database_path, Database)
+        if course_database is not None:
+            logging.info('Using course database: "%s"', database_path)
+            return course_database
+
+    match _backend:
+        case Backend.PACK:
+            msg: str = f'Course pack not found: "{pack.PACK_FILE_NAME}"'
+        case Backend.SQLITE:
+            msg: str = f'Course database not found: "{database.DATABASE_FILE_NAME}"'
+        case _:
+            return None
+
+    logging.error(msg)
+    raise DataError(msg)
@@ -22,10 +22,10 @@ def validate(unit_data: dict[str, Any]) -> tuple[ValidationResult, str]:
     """Validate a data version"""
 
     match schema.validate_unit_data(DATA_VALIDATOR, unit_data):
-        case ValidationResult.OK, _:
+        case ValidationResult.OK:
             pass
-        case result, reason:
-            return result, reason
+        case result:
+            return result, f'Data validation failed: {DATA_KEY}'
 
     data_version: int = unit_data[DATA_KEY]
 
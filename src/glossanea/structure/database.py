@@ -0,0 +1,358 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""SQLite course database"""
+
+# imports: library
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import os.path
+import pathlib
+import queue
+import sqlite3
+import tempfile
+from typing import Any, Iterator
+
+# imports: project
+from glossanea.structure import decoding
+from glossanea.structure import pack
+from glossanea.structure.exceptions import DataError
+
+DATABASE_FILE_NAME: str = 'course.sqlite'
+
+SCHEMA_VERSION: int = 2
+
+DATA_KEY_NEW_WORDS: str = 'new_words'
+
+MAX_POOLED_CONNECTIONS: int = 4
+
+SCHEMA_STATEMENTS: tuple[str, ...] = (
+    'CREATE TABLE meta ('
+    ' key TEXT PRIMARY KEY,'
+    ' value TEXT NOT NULL'
+    ')',
+    'CREATE TABLE sections ('
+    ' week INTEGER NOT NULL,'
+    ' unit INTEGER NOT NULL,'
+    ' position INTEGER NOT NULL,'
+    ' task_key TEXT NOT NULL,'
+    ' data TEXT NOT NULL,'
+    ' PRIMARY KEY (week, unit, task_key)'
+    ')',
+    'CREATE INDEX sections_position ON sections (week, unit, position)',
+    'CREATE TABLE new_words ('
+    ' week INTEGER NOT NULL,'
+    ' unit INTEGER NOT NULL,'
+    ' position INTEGER NOT NULL,'
+    ' regular TEXT,'
+    ' phonetic TEXT,'
+    ' search TEXT'
+    ')',
+    'CREATE INDEX new_words_unit ON new_words (week, unit, position)',
+    'CREATE INDEX new_words_regular ON new_words (regular)',
+    'CREATE INDEX new_words_search ON new_words (search)',
+    'CREATE TABLE sources ('
+    ' week INTEGER NOT NULL,'
+    ' unit INTEGER NOT NULL,'
+    ' size INTEGER NOT NULL,'
+    ' mtime_ns INTEGER NOT NULL,'
+    ' sha256 BLOB NOT NULL,'
+    ' PRIMARY KEY (week, unit)'
+    ')',
+)
+
+
+# building ----------------------------------------------------------- #
+
+def build(data_dir_path: str, database_path: str) -> int:
+    """Compile the unit data files of a data dir into a database, return the unit count"""
+
+    unit_files: list[tuple[int, int, str]] = pack.find_unit_files(data_dir_path)
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(database_path)),
+                                     suffix='.tmp')
+    os.close(fd)
+
+    try:
+        connection: sqlite3.Connection = sqlite3.connect(temp_path)
+        try:
+            with connection:
+                for statement in SCHEMA_STATEMENTS:
+                    connection.execute(statement)
+                connection.execute('INSERT INTO meta VALUES (?, ?)',
+                                   ('schema_version', str(SCHEMA_VERSION)))
+                for week_number, unit_number, full_path in unit_files:
+                    _insert_unit(connection, week_number, unit_number, full_path)
+            connection.execute('ANALYZE')
+        finally:
+            connection.close()
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, database_path)
+    except (OSError, sqlite3.Error, DataError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    logging.info('Stored %s units in "%s"', len(unit_files), database_path)
+
+    return len(unit_files)
+
+
+def _insert_unit(connection: sqlite3.Connection,
+                 week_number: int,
+                 unit_number: int,
+                 full_path: str,
+                 ) -> None:
+    """Insert the task sections and new words of a unit data file, and its source row"""
+
+    with open(full_path, 'rb') as fh:
+        content: bytes = fh.read()
+        file_stat: os.stat_result = os.fstat(fh.fileno())
+
+    connection.execute(
+        'INSERT INTO sources VALUES (?, ?, ?, ?, ?)',
+        (week_number, unit_number, file_stat.st_size, file_stat.st_mtime_ns,
+         hashlib.sha256(content).digest())
+    )
+
+    try:
+        unit_data: Any = decoding.loads(content)
+    except decoding.DecodeError as exc:
+        raise DataError(f'Failed to decode JSON data file: "{full_path}"') from exc
+
+    if not isinstance(unit_data, dict):
+        raise DataError(f'Data file is not a JSON object: "{full_path}"')
+
+    connection.executemany(
+        'INSERT INTO sections VALUES (?, ?, ?, ?, ?)',
+        [
+            (week_number, unit_number, position, key,
+             json.dumps(value, ensure_ascii=False, separators=(',', ':')))
+            for position, (key, value) in enumerate(unit_data.items())
+        ]
+    )
+
+    new_words: Any = unit_data.get(DATA_KEY_NEW_WORDS, [])
+    if not isinstance(new_words, list):
+        return
+
+    connection.executemany(
+        'INSERT INTO new_words VALUES (?, ?, ?, ?, ?, ?)',
+        [
+            (week_number, unit_number, position,
+             item.get('regular'), item.get('phonetic'), item.get('search'))
+            for position, item in enumerate(new_words)
+            if isinstance(item, dict)
+        ]
+    )
+
+
+# reading ------------------------------------------------------------ #
+
+class Database:
+    """Read-only course database with pooled connections"""
+
+    def __init__(self, database_path: str) -> None:
+
+        self._database_path: str = database_path
+        self._pool: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+
+        with self._connection() as connection:
+            try:
+                row: tuple | None = connection.execute(
+                    "SELECT value FROM meta WHERE key = 'schema_version'"
+                ).fetchone()
+            except sqlite3.DatabaseError as exc:
+                raise DataError(f'Not a course database: "{database_path}"') from exc
+
+        if row is None or row[0] != str(SCHEMA_VERSION):
+            raise DataError(
+                f'Incorrect course database version: FOUND "{row[0] if row else None}", '
+                f'REQUIRED: "{SCHEMA_VERSION}" ("{database_path}")'
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new read-only connection"""
+
+        # quoted, so that '?', '#' and '%' in the path are not taken as URI syntax
+        uri: str = pathlib.Path(os.path.abspath(self._database_path)).as_uri() + '?mode=ro'
+
+        try:
+            return sqlite3.connect(uri, uri=True, check_same_thread=False)
+        except sqlite3.Error as exc:
+            raise DataError(f'Failed to open course database: "{self._database_path}"') from exc
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection from the pool"""
+
+        try:
+            connection: sqlite3.Connection = self._pool.get_nowait()
+        except queue.Empty:
+            connection: sqlite3.Connection = self._connect()
+
+        try:
+            yield connection
+        finally:
+            if self._pool.qsize() < MAX_POOLED_CONNECTIONS:
+                self._pool.put(connection)
+            else:
+                connection.close()
+
+    def close(self) -> None:
+        """Close pooled connections"""
+
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def changed_sources(self, data_dir_path: str) -> list[str]:
+        """List the unit data files which differ from those the database was built from"""
+
+        with self._connection() as connection:
+            rows: list[tuple] = connection.execute(
+                'SELECT week, unit, size, mtime_ns, sha256 FROM sources'
+            ).fetchall()
+
+        return pack.changed_sources(data_dir_path, {
+            (week_number, unit_number): (size, mtime_ns, digest)
+            for week_number, unit_number, size, mtime_ns, digest in rows
+        })
+
+    def units(self) -> list[tuple[int, int]]:
+        """List the (week number, unit number) pairs in the database"""
+
+        with self._connection() as connection:
+            return connection.execute(
+                'SELECT DISTINCT week, unit FROM sections ORDER BY week, unit'
+            ).fetchall()
+
+    def has_unit(self, week_number: int, unit_number: int) -> bool:
+        """Check whether a unit is in the database"""
+
+        with self._connection() as connection:
+            return connection.execute(
+                'SELECT 1 FROM sections WHERE week = ? AND unit = ? LIMIT 1',
+                (week_number, unit_number)
+            ).fetchone() is not None
+
+    def unit_keys(self, week_number: int, unit_number: int) -> list[str]:
+        """List the task keys of a unit"""
+
+        with self._connection() as connection:
+            rows: list[tuple] = connection.execute(
+                'SELECT task_key FROM sections WHERE week = ? AND unit = ? ORDER BY position',
+                (week_number, unit_number)
+            ).fetchall()
+
+        if len(rows) == 0:
+            raise DataError(
+                f'Unit not found in course database: Week {week_number} / Unit {unit_number}'
+            )
+
+        return [task_key for (task_key,) in rows]
+
+    def unit_size(self, week_number: int, unit_number: int) -> int:
+        """Get the summed section data size of a unit"""
+
+        with self._connection() as connection:
+            (size,) = connection.execute(
+                'SELECT TOTAL(LENGTH(CAST(data AS BLOB))) FROM sections'
+                ' WHERE week = ? AND unit = ?',
+                (week_number, unit_number)
+            ).fetchone()
+
+        return int(size)
+
+    def unit_hash(self, week_number: int, unit_number: int) -> str:
+        """Get a content hash of a unit, without decoding it"""
+
+        with self._connection() as connection:
+            rows: list[tuple] = connection.execute(
+                'SELECT task_key, data FROM sections WHERE week = ? AND unit = ? ORDER BY position',
+                (week_number, unit_number)
+            ).fetchall()
+
+        content_hash = hashlib.sha256()
+        for key, text in rows:
+            content_hash.update(key.encode('UTF-8'))
+            content_hash.update(text.encode('UTF-8'))
+
+        return content_hash.hexdigest()
+
+    def section(self, week_number: int, unit_number: int, key: str) -> Any:
+        """Decode a single task section of a unit"""
+
+        with self._connection() as connection:
+            row: tuple | None = connection.execute(
+                'SELECT data FROM sections WHERE week = ? AND unit = ? AND task_key = ?',
+                (week_number, unit_number, key)
+            ).fetchone()
+
+        if row is None:
+            raise DataError(
+                f'Task section not found in course database: '
+                f'Week {week_number} / Unit {unit_number} / {key}'
+            )
+
+        return self._decode(row[0], week_number, unit_number, key)
+
+    def unit(self, week_number: int, unit_number: int) -> dict[str, Any]:
+        """Decode all task sections of a unit"""
+
+        with self._connection() as connection:
+            rows: list[tuple] = connection.execute(
+                'SELECT task_key, data FROM sections WHERE week = ? AND unit = ? ORDER BY position',
+                (week_number, unit_number)
+            ).fetchall()
+
+        if len(rows) == 0:
+            raise DataError(
+                f'Unit not found in course database: Week {week_number} / Unit {unit_number}'
+            )
+
+        return {
+            key: self._decode(text, week_number, unit_number, key)
+            for key, text in rows
+        }
+
+    def new_words(self, first_week: int, last_week: int) -> list[dict[str, Any]]:
+        """List the new words of all units in a range of weeks"""
+
+        with self._connection() as connection:
+            rows: list[tuple] = connection.execute(
+                'SELECT week, unit, regular, phonetic, search FROM new_words'
+                ' WHERE week BETWEEN ? AND ? ORDER BY week, unit, position',
+                (first_week, last_week)
+            ).fetchall()
+
+        return [
+            {
+                'week': week_number,
+                'unit': unit_number,
+                'regular': regular,
+                'phonetic': phonetic,
+                'search': search,
+            }
+            for week_number, unit_number, regular, phonetic, search in rows
+        ]
+
+    @staticmethod
+    def _decode(text: str, week_number: int, unit_number: int, key: str) -> Any:
+        """Decode the JSON of a task section"""
+
+        try:
+            return decoding.loads(text)
+        except decoding.DecodeError as exc:
+            raise DataError(
+                f'Failed to decode course database section: '
+                f'Week {week_number} / Unit {unit_number} / {key}'
+            ) from exc
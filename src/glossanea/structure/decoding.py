@@ -0,0 +1,91 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""JSON decoding with optional faster backends"""
+
+# imports: library
+import json
+import logging
+from typing import Any, Callable
+
+# imports: dependencies (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+BACKEND_ORJSON: str = 'orjson'
+BACKEND_MSGSPEC: str = 'msgspec'
+BACKEND_STDLIB: str = 'json'
+
+
+class DecodeError(ValueError):
+    """JSON decoding error of any backend"""
+
+
+def _backends() -> dict[str, tuple[Callable[[bytes | str], Any], tuple[type[Exception], ...]]]:
+    """Available backends in order of preference, with their decode errors"""
+
+    backends: dict[str, tuple[Callable[[bytes | str], Any], tuple[type[Exception], ...]]] = {}
+
+    if orjson is not None:
+        backends[BACKEND_ORJSON] = (orjson.loads, (orjson.JSONDecodeError, UnicodeDecodeError))
+
+    if msgspec is not None:
+        backends[BACKEND_MSGSPEC] = (msgspec.json.decode, (msgspec.DecodeError, UnicodeDecodeError))
+
+    backends[BACKEND_STDLIB] = (json.loads, (json.JSONDecodeError, UnicodeDecodeError))
+
+    return backends
+
+
+BACKENDS: dict[str, tuple[Callable[[bytes | str], Any], tuple[type[Exception], ...]]] = _backends()
+
+_backend_name: str = next(iter(BACKENDS))
+_decode, _decode_errors = BACKENDS[_backend_name]
+
+
+def available() -> list[str]:
+    """List the available backends in order of preference"""
+    return list(BACKENDS.keys())
+
+
+def backend() -> str:
+    """Get the name of the selected backend"""
+    return _backend_name
+
+
+def select(backend_name: str) -> None:
+    """Select a backend by name"""
+
+    global _backend_name, _decode, _decode_errors  # pylint: disable=global-statement
+
+    if backend_name not in BACKENDS:
+        raise ValueError(f'JSON backend not available: {backend_name}')
+
+    _backend_name = backend_name
+    _decode, _decode_errors = BACKENDS[backend_name]
+
+    logging.info('JSON backend: %s', backend_name)
+
+
+def loads(content: bytes | str) -> Any:
+    """Decode a JSON document"""
+
+    try:
+        return _decode(content)
+    except _decode_errors as exc:
+        raise DecodeError(str(exc)) from exc
+
+
+def load_file(full_path: str) -> Any:
+    """Read a JSON file in one call and decode it"""
+
+    with open(full_path, 'rb') as fh:
+        return loads(fh.read())
@@ -0,0 +1,84 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Read-only containers for decoded unit data
+
+They subclass dict and list, so schema validation, JSON encoding and
+the task code read them unchanged, while any mutation raises.
+"""
+
+# imports: library
+from typing import Any, NoReturn
+
+
+def _read_only(*_: Any, **__: Any) -> NoReturn:
+    """Reject a mutation"""
+    raise TypeError('Unit data is read-only')
+
+
+class FrozenDict(dict):
+    """Read-only dict"""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __copy__(self) -> 'FrozenDict':
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'FrozenDict':
+        return self
+
+
+class FrozenList(list):
+    """Read-only list"""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __copy__(self) -> 'FrozenList':
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'FrozenList':
+        return self
+
+
+def freeze(value: Any) -> Any:
+    """Convert decoded JSON into read-only containers, reusing frozen parts"""
+
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+
+    if isinstance(value, list):
+        return FrozenList([freeze(item) for item in value])
+
+    return value
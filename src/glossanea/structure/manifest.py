@@ -0,0 +1,294 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Course manifest"""
+
+# imports: library
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+from typing import Any
+
+# imports: project
+from glossanea.structure import cache
+from glossanea.structure import config
+from glossanea.structure import data
+from glossanea.structure import data_version
+from glossanea.structure import decoding
+from glossanea.structure import pack
+from glossanea.structure import unit
+from glossanea.structure.exceptions import DataError
+from glossanea.tasks.t_1_new_words_common import DATA_KEY_NEW_WORDS_EXTENSION
+
+MANIFEST_FORMAT_VERSION: int = 1
+
+UNIT_TYPE_DAY: str = 'day'
+UNIT_TYPE_WEEKLY_REVIEW: str = 'WR'
+
+NON_TASK_KEYS: frozenset[str] = frozenset([data_version.DATA_KEY, DATA_KEY_NEW_WORDS_EXTENSION])
+
+
+@dataclasses.dataclass(frozen=True)
+class ManifestEntry:
+    """Manifest entry of a unit"""
+
+    week_number: int
+    unit_number: int
+    task_names: tuple[str, ...]
+    size: int
+    content_hash: str
+
+    @property
+    def key(self) -> tuple[int, int]:
+        """Get the (week number, unit number) pair"""
+        return self.week_number, self.unit_number
+
+    @property
+    def is_weekly_review(self) -> bool:
+        """Get whether the unit is a Weekly Review"""
+        return self.unit_number == unit.WEEKLY_REVIEW_INDEX
+
+    @property
+    def unit_type(self) -> str:
+        """Get the unit type"""
+        return UNIT_TYPE_WEEKLY_REVIEW if self.is_weekly_review else UNIT_TYPE_DAY
+
+
+def _course_order(key: tuple[int, int]) -> tuple[int, int]:
+    """Sort key placing the Weekly Review after the days of its week"""
+
+    week_number, unit_number = key
+
+    if unit_number == unit.WEEKLY_REVIEW_INDEX:
+        return week_number, unit.UNITS_PER_WEEK
+
+    return week_number, unit_number
+
+
+class Manifest:
+    """Index of the available units in course order"""
+
+    def __init__(self, entries: list[ManifestEntry]) -> None:
+
+        if len(entries) == 0:
+            raise DataError('No units found in the data folder')
+
+        ordered: list[ManifestEntry] = sorted(entries, key=lambda entry: _course_order(entry.key))
+
+        self._entries: dict[tuple[int, int], ManifestEntry] = {
+            entry.key: entry for entry in ordered
+        }
+        self._order: list[tuple[int, int]] = list(self._entries.keys())
+        self._positions: dict[tuple[int, int], int] = {
+            key: position for position, key in enumerate(self._order)
+        }
+        self._by_type: dict[str, list[tuple[int, int]]] = {
+            UNIT_TYPE_DAY: [entry.key for entry in ordered if not entry.is_weekly_review],
+            UNIT_TYPE_WEEKLY_REVIEW: [entry.key for entry in ordered if entry.is_weekly_review],
+        }
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, key: tuple[int, int]) -> bool:
+        return key in self._entries
+
+    def entries(self) -> list[ManifestEntry]:
+        """List the entries in course order"""
+        return list(self._entries.values())
+
+    def entry(self, week_number: int, unit_number: int) -> ManifestEntry | None:
+        """Get the entry of a unit"""
+        return self._entries.get((week_number, unit_number), None)
+
+    def first_unit(self, skip_weekly_reviews: bool = False) -> tuple[int, int]:
+        """Get the first unit of the course"""
+
+        for key in self._order:
+            if not (skip_weekly_reviews and self._entries[key].is_weekly_review):
+                return key
+
+        raise DataError('No units found in the data folder')
+
+    def next_unit(self,
+                  week_number: int,
+                  unit_number: int,
+                  skip_weekly_reviews: bool = False,
+                  ) -> tuple[int, int] | None:
+        """Get the unit after a unit, or None at the end of the course"""
+
+        position: int | None = self._positions.get((week_number, unit_number), None)
+
+        if position is None:
+            raise ValueError(f'Unit not found: Week {week_number} / Unit {unit_number}')
+
+        for next_position in range(position + 1, len(self._order)):
+            key: tuple[int, int] = self._order[next_position]
+            if not (skip_weekly_reviews and self._entries[key].is_weekly_review):
+                return key
+
+        return None
+
+    def random_unit(self, unit_type: str, skip_weekly_reviews: bool = False) -> tuple[int, int]:
+        """Pick a random unit of a type, or of any type if it is empty"""
+
+        match unit_type:
+            case '':
+                if skip_weekly_reviews:
+                    candidates: list[tuple[int, int]] = self._by_type[UNIT_TYPE_DAY]
+                else:
+                    candidates: list[tuple[int, int]] = self._order
+            case 'day':
+                candidates: list[tuple[int, int]] = self._by_type[UNIT_TYPE_DAY]
+            case 'WR':
+                candidates: list[tuple[int, int]] = self._by_type[UNIT_TYPE_WEEKLY_REVIEW]
+            case _:
+                raise ValueError('Incorrect unit type.')
+
+        if len(candidates) == 0:
+            raise ValueError(f'No units of type: {unit_type}')
+
+        return random.choice(candidates)
+
+
+# building ----------------------------------------------------------- #
+
+def _task_names(keys: list[str]) -> tuple[str, ...]:
+    """Task names of a unit from its data keys"""
+    return tuple(key for key in keys if key not in NON_TASK_KEYS)
+
+
+def _build_from_source(source: data.SectionSource) -> Manifest:
+    """Build a manifest from the index of a single-file course"""
+
+    return Manifest([
+        ManifestEntry(
+            week_number=week_number,
+            unit_number=unit_number,
+            task_names=_task_names(source.unit_keys(week_number, unit_number)),
+            size=source.unit_size(week_number, unit_number),
+            content_hash=source.unit_hash(week_number, unit_number),
+        )
+        for week_number, unit_number in source.units()
+    ])
+
+
+def _cache_file_path(data_dir_path: str) -> str:
+    """Manifest cache file path of a data dir"""
+    return cache.data_dir_file_path(data_dir_path, 'manifest')
+
+
+def _read_cached_files(cache_file_path: str) -> dict[str, dict[str, Any]]:
+    """Read the cached per-file manifest records"""
+
+    try:
+        with open(cache_file_path, 'r', encoding='UTF-8') as fh:
+            cached: Any = json.load(fh)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as exc:
+        logging.warning('Ignoring unreadable manifest cache "%s": %s', cache_file_path, exc)
+        return {}
+
+    if not isinstance(cached, dict) or cached.get('format') != MANIFEST_FORMAT_VERSION:
+        return {}
+
+    return cached.get('files', {})
+
+
+def _file_record(full_path: str, stat: os.stat_result) -> dict[str, Any]:
+    """Manifest record of a data file, read from its content"""
+
+    with open(full_path, 'rb') as fh:
+        content: bytes = fh.read()
+
+    try:
+        keys: list[str] = list(decoding.loads(content).keys())
+    except (decoding.DecodeError, AttributeError) as exc:
+        raise DataError(f'Failed to decode JSON data file: "{full_path}"') from exc
+
+    return {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'content_hash': hashlib.sha256(content).hexdigest(),
+        'task_names': list(_task_names(keys)),
+    }
+
+
+def _write_cached_files(cache_file_path: str, files: dict[str, dict[str, Any]]) -> None:
+    """Write the per-file manifest records"""
+
+    try:
+        with open(cache_file_path, 'w', encoding='UTF-8') as fh:
+            json.dump({'format': MANIFEST_FORMAT_VERSION, 'files': files}, fh)
+    except OSError as exc:
+        logging.warning('Failed to write manifest cache "%s": %s', cache_file_path, exc)
+
+
+def _build_from_files(data_dir_path: str) -> Manifest:
+    """Build a manifest from the data files, reusing records of unchanged files"""
+
+    use_cache: bool = cache.is_enabled()
+    cache_file_path: str = _cache_file_path(data_dir_path) if use_cache else ''
+    cached_files: dict[str, dict[str, Any]] = \
+        _read_cached_files(cache_file_path) if use_cache else {}
+
+    files: dict[str, dict[str, Any]] = {}
+    entries: list[ManifestEntry] = []
+    changed: bool = False
+
+    for week_number, unit_number, full_path in pack.find_unit_files(data_dir_path):
+        stat: os.stat_result = os.stat(full_path)
+        record: dict[str, Any] | None = cached_files.get(full_path, None)
+
+        if record is None \
+                or record['mtime_ns'] != stat.st_mtime_ns \
+                or record['size'] != stat.st_size:
+            record = _file_record(full_path, stat)
+            changed = True
+
+        files[full_path] = record
+        entries.append(ManifestEntry(
+            week_number=week_number,
+            unit_number=unit_number,
+            task_names=tuple(record['task_names']),
+            size=record['size'],
+            content_hash=record['content_hash'],
+        ))
+
+    if use_cache and (changed or files.keys() != cached_files.keys()):
+        _write_cached_files(cache_file_path, files)
+
+    return Manifest(entries)
+
+
+_manifests: dict[str, Manifest] = {}
+_manifests_lock: threading.Lock = threading.Lock()
+
+
+def current() -> Manifest:
+    """Get the manifest of the data folder, building it on first use"""
+
+    data_dir_path: str = config.data_dir_path()
+
+    with _manifests_lock:
+        if data_dir_path not in _manifests:
+            source: data.SectionSource | None = data.section_source()
+            if source is not None:
+                _manifests[data_dir_path] = _build_from_source(source)
+            else:
+                _manifests[data_dir_path] = _build_from_files(data_dir_path)
+
+        return _manifests[data_dir_path]
+
+
+def clear() -> None:
+    """Drop the built manifests, they are built again on next use"""
+
+    with _manifests_lock:
+        _manifests.clear()
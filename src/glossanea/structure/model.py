@@ -0,0 +1,301 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Compact in-memory course model
+
+Slotted records for holding every unit of a course resident in memory.
+Ids and words repeat across units, so they are interned.
+
+This is a library API for tools working on a whole course, such as
+benchmarks/course_memory.py. The CLI does not use it, it runs tasks on
+the unit data of the unit repository.
+"""
+
+# imports: library
+import dataclasses
+import sys
+from typing import Any
+
+# imports: project
+from glossanea.structure import data_version
+from glossanea.structure import decoding
+from glossanea.structure import pack
+from glossanea.structure import schema
+from glossanea.structure import unit_schema
+from glossanea.structure.exceptions import DataError
+from glossanea.structure.frozen import freeze
+from glossanea.structure.unit import WEEKLY_REVIEW_INDEX
+
+DATA_KEY_TITLE: str = 'title'
+DATA_KEY_INTRO_TEXT: str = 'intro_text'
+DATA_KEY_NEW_WORDS: str = 'new_words'
+DATA_KEY_NEW_WORDS_EXTENSION: str = 'new_words_extension'
+DATA_KEY_SAMPLE_SENTENCES: str = 'sample_sentences'
+
+# tasks pairing items with words, by data key -> key of their items
+PAIRING_TASKS: dict[str, str] = {
+    'definitions': 'definitions',
+    'matching': 'sentences',
+}
+
+# Weekly Review tasks sharing the question list shape
+QUESTION_TASKS: frozenset[str] = frozenset([
+    'wr_definitions', 'wr_skeletons', 'wr_substitution', 'wr_translation',
+])
+
+
+def _string(value: Any, field_name: str) -> str:
+    """Check the value of a string field"""
+
+    if not isinstance(value, str):
+        raise DataError(f'Field is missing or not a string: {field_name}')
+
+    return value
+
+
+def _intern(item: dict[str, Any], key: str) -> str:
+    """Interned value of a required string field repeating across units"""
+    return sys.intern(_string(item.get(key, None), key))
+
+
+def _text(item: dict[str, Any], key: str, is_optional: bool = False) -> str:
+    """Value of a string field, empty if it is optional and missing"""
+
+    if is_optional and key not in item:
+        return ''
+
+    return _string(item.get(key, None), key)
+
+
+def _answer_pair(answer: Any) -> tuple[str, str]:
+    """Item id and word id of an answer"""
+
+    if not isinstance(answer, list) or len(answer) != 2:
+        raise DataError(f'Answer is not an item id and word id pair: {answer}')
+
+    return sys.intern(_string(answer[0], 'answers')), sys.intern(_string(answer[1], 'answers'))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class NewWord:
+    """New word"""
+
+    regular: str
+    phonetic: str
+    search: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class IdText:
+    """Item with an id, of definitions and matching"""
+
+    id: str
+    text: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Sentence:
+    """Sample sentence with a blank"""
+
+    id: str
+    beginning: str
+    answer: str
+    end: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SentenceTask:
+    """Sample sentences task"""
+
+    prompt: str
+    sentences: tuple[Sentence, ...]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PairingTask:
+    """Task pairing items with words: definitions and matching"""
+
+    data_key: str
+    name: str
+    prompt: str
+    items: tuple[IdText, ...]
+    words: tuple[IdText, ...]
+    answers: tuple[tuple[str, str], ...]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Question:
+    """Weekly Review question"""
+
+    id: str
+    question: str
+    answer: str
+    accept: tuple[str, ...]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class QuestionTask:
+    """Weekly Review task made of questions"""
+
+    data_key: str
+    task_number: int
+    prompt: str
+    scoring: str
+    items: tuple[Question, ...]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class UnitRecord:  # pylint: disable=too-many-instance-attributes
+    """Unit of a course
+
+    Sections without a record type are kept as read-only data.
+    """
+
+    week_number: int
+    unit_number: int
+    task_names: tuple[str, ...]
+    title: str
+    intro_text: tuple[str, ...]
+    new_words: tuple[NewWord, ...]
+    new_words_extension: tuple[str, ...]
+    sample_sentences: SentenceTask | None
+    pairing_tasks: tuple[PairingTask, ...]
+    question_tasks: tuple[QuestionTask, ...]
+    other_sections: tuple[tuple[str, Any], ...]
+
+
+# loading ------------------------------------------------------------ #
+
+def _id_text(item: dict[str, Any]) -> IdText:
+    """Id/text item record"""
+    return IdText(id=_intern(item, 'id'), text=_intern(item, 'text'))
+
+
+def _pairing_task(data_key: str, task_data: dict[str, Any]) -> PairingTask:
+    """Pairing task record"""
+
+    return PairingTask(
+        data_key=sys.intern(data_key),
+        name=_text(task_data, 'name', is_optional=True),
+        prompt=_text(task_data, 'prompt'),
+        items=tuple(_id_text(item) for item in task_data.get(PAIRING_TASKS[data_key], [])),
+        words=tuple(_id_text(item) for item in task_data.get('words', [])),
+        answers=tuple(_answer_pair(answer) for answer in task_data.get('answers', [])),
+    )
+
+
+def _question_task(data_key: str, task_data: dict[str, Any]) -> QuestionTask:
+    """Question task record"""
+
+    return QuestionTask(
+        data_key=sys.intern(data_key),
+        task_number=task_data.get('task_number', 0),
+        prompt=_text(task_data, 'prompt'),
+        scoring=_text(task_data, 'scoring', is_optional=True),
+        items=tuple(
+            Question(
+                id=_intern(item, 'id'),
+                question=_text(item, 'question'),
+                answer=_intern(item, 'answer'),
+                accept=tuple(sys.intern(_string(text, 'accept'))
+                             for text in item.get('accept', [])),
+            )
+            for item in task_data.get('items', [])
+        ),
+    )
+
+
+def _sentence_task(task_data: dict[str, Any]) -> SentenceTask:
+    """Sample sentences task record"""
+
+    return SentenceTask(
+        prompt=_text(task_data, 'prompt'),
+        sentences=tuple(
+            Sentence(
+                id=_intern(item, 'id'),
+                beginning=_text(item, 'beginning'),
+                answer=_intern(item, 'answer'),
+                end=_intern(item, 'end'),
+            )
+            for item in task_data.get('sentences', [])
+        ),
+    )
+
+
+def load_unit(week_number: int, unit_number: int, unit_data: dict[str, Any]) -> UnitRecord:
+    """Build the record of a unit from its data, validating it"""
+
+    unit_type: str = unit_schema.UNIT_TYPE_WEEKLY_REVIEW if unit_number == WEEKLY_REVIEW_INDEX \
+        else unit_schema.UNIT_TYPE_DAY
+
+    errors: list[str] = schema.unit_data_errors(data_version.DATA_VALIDATOR, unit_data) \
+        or unit_schema.registry.errors(unit_type, unit_data)
+    if len(errors) > 0:
+        raise DataError(f'Unit data validation failed: Week {week_number} / Unit {unit_number}: '
+                        + '; '.join(errors))
+
+    try:
+        return _unit_record(week_number, unit_number, unit_data)
+    except DataError as exc:
+        raise DataError(
+            f'Unit data incomplete: Week {week_number} / Unit {unit_number}: {exc}'
+        ) from exc
+
+
+def _unit_record(week_number: int, unit_number: int, unit_data: dict[str, Any]) -> UnitRecord:
+    """Build the record of validated unit data"""
+
+    pairing_tasks: list[PairingTask] = []
+    question_tasks: list[QuestionTask] = []
+    other_sections: list[tuple[str, Any]] = []
+
+    for key, value in unit_data.items():
+        if key in PAIRING_TASKS:
+            pairing_tasks.append(_pairing_task(key, value))
+        elif key in QUESTION_TASKS:
+            question_tasks.append(_question_task(key, value))
+        elif key not in (data_version.DATA_KEY, DATA_KEY_TITLE, DATA_KEY_INTRO_TEXT,
+                         DATA_KEY_NEW_WORDS, DATA_KEY_NEW_WORDS_EXTENSION,
+                         DATA_KEY_SAMPLE_SENTENCES):
+            other_sections.append((sys.intern(key), freeze(value)))
+
+    sample_sentences: dict[str, Any] | None = unit_data.get(DATA_KEY_SAMPLE_SENTENCES, None)
+
+    return UnitRecord(
+        week_number=week_number,
+        unit_number=unit_number,
+        task_names=tuple(sys.intern(key) for key in unit_data
+                         if key not in (data_version.DATA_KEY, DATA_KEY_NEW_WORDS_EXTENSION)),
+        title=_text(unit_data, DATA_KEY_TITLE),
+        intro_text=tuple(unit_data.get(DATA_KEY_INTRO_TEXT, [])),
+        new_words=tuple(
+            NewWord(
+                regular=_intern(item, 'regular'),
+                phonetic=_intern(item, 'phonetic'),
+                search=_intern(item, 'search'),
+            )
+            for item in unit_data.get(DATA_KEY_NEW_WORDS, [])
+        ),
+        new_words_extension=tuple(unit_data.get(DATA_KEY_NEW_WORDS_EXTENSION, [])),
+        sample_sentences=_sentence_task(sample_sentences) if sample_sentences is not None else None,
+        pairing_tasks=tuple(pairing_tasks),
+        question_tasks=tuple(question_tasks),
+        other_sections=tuple(other_sections),
+    )
+
+
+def load_course(data_dir_path: str) -> dict[tuple[int, int], UnitRecord]:
+    """Load the records of every unit of a data dir"""
+
+    course: dict[tuple[int, int], UnitRecord] = {}
+
+    for week_number, unit_number, full_path in pack.find_unit_files(data_dir_path):
+        try:
+            unit_data: Any = decoding.load_file(full_path)
+        except decoding.DecodeError as exc:
+            raise DataError(f'Failed to decode JSON data file: "{full_path}"') from exc
+
+        course[(week_number, unit_number)] = load_unit(week_number, unit_number, unit_data)
+
+    return course
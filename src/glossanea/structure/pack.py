@@ -0,0 +1,371 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Single-file course pack
+
+Layout (little-endian):
+    header:  magic, format version, entry count, index size, source count
+    index:   per task section: week, unit, key size, key,
+             payload offset, payload length, CRC32 of payload
+    sources: per unit data file: week, unit, size, modification time,
+             SHA-256 of its content
+    payload: compact JSON of each task section
+
+The index keeps the key order of the data files. The sources tell
+whether the data files changed since the pack was built.
+"""
+
+# imports: library
+import hashlib
+import json
+import logging
+import mmap
+import os
+import os.path
+import re
+import struct
+import tempfile
+import zlib
+from typing import Any
+
+# imports: project
+from glossanea.structure import decoding
+from glossanea.structure.exceptions import DataError
+
+PACK_FILE_NAME: str = 'course.pack'
+
+MAGIC: bytes = b'GLOSPACK'
+FORMAT_VERSION: int = 2
+
+HEADER = struct.Struct('<8sHIII')
+ENTRY_HEAD = struct.Struct('<HHH')
+ENTRY_TAIL = struct.Struct('<QII')
+SOURCE = struct.Struct('<HHQQ32s')
+
+WEEK_DIR_PATTERN = re.compile(r'week_(\d+)')
+DAY_FILE_PATTERN = re.compile(r'day_(\d+)\.json')
+WEEKLY_REVIEW_FILE_NAME: str = 'weekly_review.json'
+WEEKLY_REVIEW_INDEX: int = 0
+
+# (week number, unit number) -> task key -> (offset, length, checksum)
+PackIndex = dict[tuple[int, int], dict[str, tuple[int, int, int]]]
+
+# (week number, unit number) -> (size, modification time in ns, SHA-256 digest)
+PackSources = dict[tuple[int, int], tuple[int, int, bytes]]
+
+
+# building ----------------------------------------------------------- #
+
+def find_unit_files(data_dir_path: str) -> list[tuple[int, int, str]]:
+    """Find unit data files as (week number, unit number, full path)"""
+
+    found: list[tuple[int, int, str]] = []
+
+    for dir_name in sorted(os.listdir(data_dir_path)):
+        dir_match: re.Match | None = WEEK_DIR_PATTERN.fullmatch(dir_name)
+        dir_path: str = os.path.join(data_dir_path, dir_name)
+        if dir_match is None or not os.path.isdir(dir_path):
+            continue
+        week_number: int = int(dir_match.group(1))
+
+        for file_name in sorted(os.listdir(dir_path)):
+            if file_name == WEEKLY_REVIEW_FILE_NAME:
+                unit_number: int = WEEKLY_REVIEW_INDEX
+            else:
+                file_match: re.Match | None = DAY_FILE_PATTERN.fullmatch(file_name)
+                if file_match is None:
+                    continue
+                unit_number: int = int(file_match.group(1))
+
+            found.append((week_number, unit_number, os.path.join(dir_path, file_name)))
+
+    return found
+
+
+def _collect_sections(unit_files: list[tuple[int, int, str]],
+                      ) -> tuple[list[tuple[int, int, bytes, bytes]], bytearray]:
+    """Read unit data files into (week, unit, key, compact JSON) sections and source rows"""
+
+    sections: list[tuple[int, int, bytes, bytes]] = []
+    sources: bytearray = bytearray()
+
+    for week_number, unit_number, full_path in unit_files:
+        with open(full_path, 'rb') as fh:
+            content: bytes = fh.read()
+            file_stat: os.stat_result = os.fstat(fh.fileno())
+
+        sources += SOURCE.pack(week_number, unit_number, file_stat.st_size,
+                               file_stat.st_mtime_ns, hashlib.sha256(content).digest())
+
+        try:
+            unit_data: Any = decoding.loads(content)
+        except decoding.DecodeError as exc:
+            raise DataError(f'Failed to decode JSON data file: "{full_path}"') from exc
+
+        if not isinstance(unit_data, dict):
+            raise DataError(f'Data file is not a JSON object: "{full_path}"')
+
+        for key, value in unit_data.items():
+            sections.append((week_number, unit_number, key.encode('UTF-8'),
+                             json.dumps(value, ensure_ascii=False,
+                                        separators=(',', ':')).encode('UTF-8')))
+
+    return sections, sources
+
+
+def _build_index(sections: list[tuple[int, int, bytes, bytes]], payload_start: int) -> bytearray:
+    """Build the index of sections whose payloads follow each other from an offset"""
+
+    index: bytearray = bytearray()
+    offset: int = payload_start
+
+    for week_number, unit_number, key, payload in sections:
+        index += ENTRY_HEAD.pack(week_number, unit_number, len(key))
+        index += key
+        index += ENTRY_TAIL.pack(offset, len(payload), zlib.crc32(payload))
+        offset += len(payload)
+
+    return index
+
+
+def _write_file(file_path: str, parts: list[bytes]) -> None:
+    """Write a file from its parts, replacing it atomically"""
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)),
+                                     suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            for part in parts:
+                fh.write(part)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, file_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def build(data_dir_path: str, pack_path: str) -> int:
+    """Compile the unit data files of a data dir into a pack, return the unit count"""
+
+    unit_files: list[tuple[int, int, str]] = find_unit_files(data_dir_path)
+
+    sections, sources = _collect_sections(unit_files)
+
+    index_size: int = sum(ENTRY_HEAD.size + len(key) + ENTRY_TAIL.size
+                          for _, _, key, _ in sections)
+    index: bytearray = _build_index(sections, HEADER.size + index_size + len(sources))
+
+    _write_file(pack_path, [
+        HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), index_size, len(unit_files)),
+        index,
+        sources,
+        *(payload for _, _, _, payload in sections),
+    ])
+
+    logging.info('Packed %s units into "%s"', len(unit_files), pack_path)
+
+    return len(unit_files)
+
+
+# reading ------------------------------------------------------------ #
+
+def _source_matches(full_path: str, source: tuple[int, int, bytes]) -> bool:
+    """Check whether a data file is the one a pack was built from
+
+    The content is only hashed when the modification time differs.
+    """
+
+    size, mtime_ns, digest = source
+
+    try:
+        file_stat: os.stat_result = os.stat(full_path)
+        if file_stat.st_size != size:
+            return False
+        if file_stat.st_mtime_ns == mtime_ns:
+            return True
+        with open(full_path, 'rb') as fh:
+            return hashlib.sha256(fh.read()).digest() == digest
+    except OSError:
+        return False
+
+
+def changed_sources(data_dir_path: str, sources: PackSources) -> list[str]:
+    """List the unit data files which differ from the sources a course was built from
+
+    A data folder without unit data files has only the built course, which
+    is then current.
+    """
+
+    unit_files: dict[tuple[int, int], str] = {
+        (week_number, unit_number): full_path
+        for week_number, unit_number, full_path in find_unit_files(data_dir_path)
+    }
+
+    if len(unit_files) == 0:
+        return []
+
+    changed: list[str] = [
+        f'Week {week_number} / Unit {unit_number} (removed)'
+        for week_number, unit_number in sorted(sources.keys() - unit_files.keys())
+    ]
+
+    for key, full_path in unit_files.items():
+        source: tuple[int, int, bytes] | None = sources.get(key, None)
+        if source is None or not _source_matches(full_path, source):
+            changed.append(os.path.relpath(full_path, data_dir_path))
+
+    return changed
+
+
+class PackReader:
+    """Memory-mapped course pack with lazy decoding of task sections"""
+
+    def __init__(self, pack_path: str) -> None:
+
+        self._pack_path: str = pack_path
+
+        with open(pack_path, 'rb') as fh:
+            try:
+                self._mmap: mmap.mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:
+                raise DataError(f'Empty course pack: "{pack_path}"') from exc
+
+        self._sources: PackSources = {}
+
+        try:
+            self._index: PackIndex = self._read_index()
+        except (struct.error, UnicodeDecodeError) as exc:
+            self.close()
+            raise DataError(f'Corrupt course pack: "{pack_path}"') from exc
+        except DataError:
+            self.close()
+            raise
+
+    def _read_index(self) -> PackIndex:
+        """Read the header and the index, then the sources"""
+
+        magic, format_version, entry_count, index_size, source_count = \
+            HEADER.unpack_from(self._mmap, 0)
+
+        if magic != MAGIC:
+            raise DataError(f'Not a course pack: "{self._pack_path}"')
+
+        if format_version != FORMAT_VERSION:
+            raise DataError(
+                f'Incorrect course pack version: FOUND "{format_version}", '
+                f'REQUIRED: "{FORMAT_VERSION}" ("{self._pack_path}")'
+            )
+
+        index: PackIndex = {}
+        position: int = HEADER.size
+        index_end: int = HEADER.size + index_size
+
+        for _ in range(entry_count):
+            week_number, unit_number, key_size = ENTRY_HEAD.unpack_from(self._mmap, position)
+            position += ENTRY_HEAD.size
+            key: str = self._mmap[position:position + key_size].decode('UTF-8')
+            position += key_size
+            index.setdefault((week_number, unit_number), {})[key] = \
+                ENTRY_TAIL.unpack_from(self._mmap, position)
+            position += ENTRY_TAIL.size
+
+        if position != index_end:
+            raise DataError(f'Corrupt course pack index: "{self._pack_path}"')
+
+        self._read_sources(index_end, source_count)
+
+        return index
+
+    def _read_sources(self, position: int, source_count: int) -> None:
+        """Read the sources following the index"""
+
+        sources_end: int = position + source_count * SOURCE.size
+
+        if sources_end > len(self._mmap):
+            raise DataError(f'Corrupt course pack sources: "{self._pack_path}"')
+
+        for week_number, unit_number, size, mtime_ns, digest in \
+                SOURCE.iter_unpack(self._mmap[position:sources_end]):
+            self._sources[(week_number, unit_number)] = (size, mtime_ns, digest)
+
+    def close(self) -> None:
+        """Unmap the pack file"""
+        self._mmap.close()
+
+    def changed_sources(self, data_dir_path: str) -> list[str]:
+        """List the unit data files which differ from those the pack was built from"""
+        return changed_sources(data_dir_path, self._sources)
+
+    def units(self) -> list[tuple[int, int]]:
+        """List the (week number, unit number) pairs in the pack"""
+        return list(self._index.keys())
+
+    def has_unit(self, week_number: int, unit_number: int) -> bool:
+        """Check whether a unit is in the pack"""
+        return (week_number, unit_number) in self._index
+
+    def unit_keys(self, week_number: int, unit_number: int) -> list[str]:
+        """List the task keys of a unit"""
+        return list(self._unit_index(week_number, unit_number).keys())
+
+    def unit_size(self, week_number: int, unit_number: int) -> int:
+        """Get the summed payload size of a unit"""
+        return sum(length for _, length, _ in self._unit_index(week_number, unit_number).values())
+
+    def unit_hash(self, week_number: int, unit_number: int) -> str:
+        """Get a content hash of a unit, without decoding it"""
+
+        content_hash = hashlib.sha256()
+        for key, (offset, length, _) in self._unit_index(week_number, unit_number).items():
+            content_hash.update(key.encode('UTF-8'))
+            content_hash.update(self._mmap[offset:offset + length])
+
+        return content_hash.hexdigest()
+
+    def section(self, week_number: int, unit_number: int, key: str) -> Any:
+        """Decode a single task section of a unit"""
+
+        try:
+            offset, length, checksum = self._unit_index(week_number, unit_number)[key]
+        except KeyError as exc:
+            raise DataError(
+                f'Task section not found in course pack: '
+                f'Week {week_number} / Unit {unit_number} / {key}'
+            ) from exc
+
+        payload: bytes = self._mmap[offset:offset + length]
+
+        if zlib.crc32(payload) != checksum:
+            raise DataError(
+                f'Checksum mismatch in course pack: Week {week_number} / Unit {unit_number} / {key}'
+            )
+
+        try:
+            return decoding.loads(payload)
+        except decoding.DecodeError as exc:
+            raise DataError(
+                f'Failed to decode course pack section: '
+                f'Week {week_number} / Unit {unit_number} / {key}'
+            ) from exc
+
+    def unit(self, week_number: int, unit_number: int) -> dict[str, Any]:
+        """Decode all task sections of a unit"""
+
+        return {
+            key: self.section(week_number, unit_number, key)
+            for key in self._unit_index(week_number, unit_number)
+        }
+
+    def _unit_index(self, week_number: int, unit_number: int) -> dict[str, tuple[int, int, int]]:
+        """Get the index entries of a unit"""
+
+        try:
+            return self._index[(week_number, unit_number)]
+        except KeyError as exc:
+            raise DataError(
+                f'Unit not found in course pack: Week {week_number} / Unit {unit_number}'
+            ) from exc
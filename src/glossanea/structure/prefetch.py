@@ -0,0 +1,103 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Background prefetch of units"""
+
+# imports: library
+import logging
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Callable
+
+# imports: project
+from glossanea import version
+from glossanea.structure.unit import Unit
+
+MAX_PENDING: int = 4
+
+
+class Prefetcher:
+    """Load units on a worker thread and hand them over on request
+
+    Only the thread that schedules units may take them.
+    """
+
+    def __init__(self,
+                 loader: Callable[[int, int], Unit] = Unit,
+                 max_pending: int = MAX_PENDING,
+                 ) -> None:
+
+        self._loader: Callable[[int, int], Unit] = loader
+        self._max_pending: int = max_pending
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: OrderedDict[tuple[int, int], Future] = OrderedDict()
+
+    def __contains__(self, key: tuple[int, int]) -> bool:
+        return key in self._pending
+
+    def schedule(self, week_number: int, unit_number: int) -> None:
+        """Start loading a unit in the background"""
+
+        key: tuple[int, int] = (week_number, unit_number)
+
+        if key in self._pending:
+            self._pending.move_to_end(key)
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f'{version.PROGRAM_NAME}-prefetch')
+
+        self._pending[key] = self._executor.submit(self._loader, week_number, unit_number)
+
+        while len(self._pending) > self._max_pending:
+            _, future = self._pending.popitem(last=False)
+            future.cancel()
+
+    def take(self, week_number: int, unit_number: int) -> Unit | None:
+        """Take a prefetched unit, waiting for it if it is still loading
+
+        Returns None if the unit was not scheduled or failed to load,
+        in which case it should be loaded synchronously.
+        """
+
+        future: Future | None = self._pending.pop((week_number, unit_number), None)
+
+        if future is None:
+            return None
+
+        try:
+            return future.result()
+        except CancelledError:
+            return None
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logging.warning('Prefetch of Week %s / Unit %s failed: %s',
+                            week_number, unit_number, exc)
+            return None
+
+    def discard(self, week_number: int, unit_number: int) -> None:
+        """Forget a scheduled unit"""
+
+        future: Future | None = self._pending.pop((week_number, unit_number), None)
+
+        if future is not None:
+            future.cancel()
+
+    def clear(self) -> None:
+        """Forget all scheduled units, keeping the worker thread"""
+
+        for future in self._pending.values():
+            future.cancel()
+
+        self._pending.clear()
+
+    def shutdown(self) -> None:
+        """Cancel scheduled units and stop the worker thread"""
+
+        self._pending.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
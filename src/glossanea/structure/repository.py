@@ -0,0 +1,193 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit repository"""
+
+# imports: library
+import dataclasses
+from collections import OrderedDict
+from typing import Any
+
+# imports: project
+from glossanea.structure import config
+from glossanea.structure.prefetch import Prefetcher
+from glossanea.structure.unit import Unit
+
+CONFIG_KEY_MAX_ENTRIES: str = 'unit_cache_max_entries'
+CONFIG_KEY_MAX_BYTES: str = 'unit_cache_max_bytes'
+
+DEFAULT_MAX_ENTRIES: int = 16
+DEFAULT_MAX_BYTES: int = 0
+
+
+@dataclasses.dataclass(slots=True)
+class RepositoryStats:
+    """Lookup counters of a unit repository"""
+
+    hits: int = 0
+    misses: int = 0
+    prefetch_hits: int = 0
+
+
+class UnitRepository:
+    """Bounded LRU cache of loaded units
+
+    A capacity of 0 means no limit for that dimension.
+    Unit sizes are measured by the size of their data files.
+    """
+
+    def __init__(self,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 prefetcher: Prefetcher | None = None,
+                 ) -> None:
+
+        self._max_entries: int = 0
+        self._max_bytes: int = 0
+
+        self._units: OrderedDict[tuple[int, int], Unit] = OrderedDict()
+        self._size: int = 0
+
+        self._prefetcher: Prefetcher | None = prefetcher
+
+        self.counters: RepositoryStats = RepositoryStats()
+
+        self.resize(max_entries, max_bytes)
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def __contains__(self, key: tuple[int, int]) -> bool:
+        return key in self._units
+
+    @property
+    def size(self) -> int:
+        """Get the summed data size of the cached units"""
+        return self._size
+
+    def resize(self, max_entries: int, max_bytes: int) -> None:
+        """Change capacities, evicting units if needed"""
+
+        if not isinstance(max_entries, int) or not isinstance(max_bytes, int):
+            raise ValueError('Unit repository capacity is not an integer!')
+
+        if max_entries < 0 or max_bytes < 0:
+            raise ValueError('Unit repository capacity can not be negative!')
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._evict()
+
+    def get(self, week_number: int, unit_number: int) -> Unit:
+        """Get a unit, loading it on a miss"""
+
+        key: tuple[int, int] = (week_number, unit_number)
+
+        if key in self._units:
+            self.counters.hits += 1
+            self._units.move_to_end(key)
+            return self._units[key]
+
+        self.counters.misses += 1
+
+        unit_obj: Unit | None = None
+        if self._prefetcher is not None:
+            unit_obj = self._prefetcher.take(week_number, unit_number)
+
+        if unit_obj is None:
+            unit_obj = Unit(week_number, unit_number)
+        else:
+            self.counters.prefetch_hits += 1
+
+        self.put(unit_obj)
+
+        return unit_obj
+
+    def prefetch(self, week_number: int, unit_number: int) -> None:
+        """Load a unit in the background unless it is already cached"""
+
+        if self._prefetcher is None or (week_number, unit_number) in self._units:
+            return
+
+        self._prefetcher.schedule(week_number, unit_number)
+
+    def close(self) -> None:
+        """Stop background loading"""
+
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown()
+
+    def put(self, unit_obj: Unit) -> None:
+        """Add a loaded unit"""
+
+        key: tuple[int, int] = (unit_obj.week_number, unit_obj.unit_number)
+
+        self.invalidate(*key)
+
+        self._units[key] = unit_obj
+        self._size += unit_obj.data_size
+
+        self._evict()
+
+    def invalidate(self, week_number: int, unit_number: int) -> None:
+        """Drop a single unit"""
+
+        unit_obj: Unit | None = self._units.pop((week_number, unit_number), None)
+
+        if unit_obj is not None:
+            self._size -= unit_obj.data_size
+
+        if self._prefetcher is not None:
+            self._prefetcher.discard(week_number, unit_number)
+
+    def clear(self) -> None:
+        """Drop all units, including those loading in the background"""
+
+        self._units.clear()
+        self._size = 0
+
+        if self._prefetcher is not None:
+            self._prefetcher.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Get usage counters"""
+
+        return {
+            'entries': len(self._units),
+            'bytes': self._size,
+            **dataclasses.asdict(self.counters),
+        }
+
+    def _is_over_capacity(self) -> bool:
+        """Check whether a capacity limit is exceeded"""
+
+        if 0 < self._max_entries < len(self._units):
+            return True
+
+        if 0 < self._max_bytes < self._size:
+            return True
+
+        return False
+
+    def _evict(self) -> None:
+        """Drop least recently used units, but never the most recent one"""
+
+        while len(self._units) > 1 and self._is_over_capacity():
+            _, unit_obj = self._units.popitem(last=False)
+            self._size -= unit_obj.data_size
+
+
+units: UnitRepository = UnitRepository(prefetcher=Prefetcher())
+
+
+def configure() -> None:
+    """Apply capacities from the config file to the shared unit repository"""
+
+    config_dict: dict[str, Any] = config.config()
+
+    units.resize(
+        max_entries=config_dict.get(CONFIG_KEY_MAX_ENTRIES, DEFAULT_MAX_ENTRIES),
+        max_bytes=config_dict.get(CONFIG_KEY_MAX_BYTES, DEFAULT_MAX_BYTES),
+    )
@@ -5,13 +5,23 @@
 """Data schema"""
 
 # imports: library
+import dataclasses
 import enum
+import functools
+import hashlib
+import json
 import logging
-from typing import Any
+import threading
+import time
+import weakref
+from typing import Any, Callable
 
 # imports: dependencies
 from jsonschema import ValidationError, SchemaError, Draft202012Validator
 
+# imports: project
+from glossanea.structure import schema_compiler
+
 
 class ValidationResult(enum.Enum):
     """Data validation """
@@ -22,6 +32,24 @@ class ValidationResult(enum.Enum):
     VERSION_INCORRECT = enum.auto()
 
 
+@dataclasses.dataclass(frozen=True, eq=False)
+class ValidationToken:
+    """Proof that unit data passed a composed unit schema"""
+
+    unit_type: str
+    schema_fingerprint: str
+    task_validators: tuple[tuple[Draft202012Validator, str], ...]
+
+    def data_key(self, data_validator: Draft202012Validator) -> str | None:
+        """Get the data key a task validator was composed for, None if it was not"""
+
+        for task_validator, data_key in self.task_validators:
+            if task_validator is data_validator:
+                return data_key
+
+        return None
+
+
 def _validate_schema(data_validator: Draft202012Validator) -> bool:
     """Validate data schema"""
 
@@ -33,22 +61,226 @@ def _validate_schema(data_validator: Draft202012Validator) -> bool:
     return True
 
 
+# registration and memo ---------------------------------------------- #
+
+_lock: threading.Lock = threading.Lock()
+
+# validators are kept referenced, so their ids stay unique
+_registered: dict[int, Draft202012Validator] = {}
+
+# (weak reference, data revision, results by id(validator))
+_MemoEntry = tuple[weakref.ref, int, dict[int, ValidationResult]]
+
+# id(data) -> memo entry
+_memo: dict[int, _MemoEntry] = {}
+
+_stats: dict[str, int | float] = {}
+
+
+def reset_stats() -> None:
+    """Reset the validation counters"""
+
+    with _lock:
+        _stats.update({
+            'token_hits': 0,
+            'memo_hits': 0,
+            'memo_misses': 0,
+            'validations': 0,
+            'failures': 0,
+            'seconds': 0.0,
+        })
+
+
+reset_stats()
+
+
+def stats() -> dict[str, int | float]:
+    """Get the validation counters
+
+    Hits are answered by a validation token or the memo, every miss is
+    validated, and seconds is the time spent validating.
+    """
+
+    with _lock:
+        return dict(_stats)
+
+
+def register_validator(data_validator: Draft202012Validator) -> None:
+    """Register a validator, checking its schema once"""
+
+    with _lock:
+        if _registered.get(id(data_validator), None) is data_validator:
+            return
+
+        assert _validate_schema(data_validator), "Failed to validate unit data schema"
+
+        _registered[id(data_validator)] = data_validator
+
+
+def _check_function(data_validator: Draft202012Validator) -> schema_compiler.CheckFunction:
+    """Get the compiled check of a validator, registering it on first use"""
+
+    if _registered.get(id(data_validator), None) is not data_validator:
+        register_validator(data_validator)
+
+    return schema_compiler.check_function(data_validator)
+
+
+def _forget(data_id: int, _: weakref.ref) -> None:
+    """Drop the memo entry of collected data
+
+    Collection can happen while the lock is held, so the entry is dropped
+    without it, in a single atomic dict operation.
+    """
+    _memo.pop(data_id, None)
+
+
+def _memo_get(data_validator: Draft202012Validator, data: Any) -> ValidationResult | None:
+    """Get a memoised result, None if there is none for this data revision"""
+
+    revision: int | None = getattr(data, 'revision', None)
+    if revision is None:
+        return None
+
+    with _lock:
+        entry: _MemoEntry | None = _memo.get(id(data), None)
+
+        if entry is None or entry[0]() is not data or entry[1] != revision:
+            _stats['memo_misses'] += 1
+            return None
+
+        result: ValidationResult | None = entry[2].get(id(data_validator), None)
+        _stats['memo_hits' if result is not None else 'memo_misses'] += 1
+
+        return result
+
+
+def _memo_put(data_validator: Draft202012Validator, data: Any, result: ValidationResult) -> None:
+    """Memoise a result for the current data revision"""
+
+    revision: int | None = getattr(data, 'revision', None)
+    if revision is None:
+        return
+
+    with _lock:
+        entry: _MemoEntry | None = _memo.get(id(data), None)
+
+        if entry is None or entry[0]() is not data or entry[1] != revision:
+            entry = (weakref.ref(data, functools.partial(_forget, id(data))), revision, {})
+            _memo[id(data)] = entry
+
+        entry[2][id(data_validator)] = result
+
+
+# validation --------------------------------------------------------- #
+
 def validate_unit_data(data_validator: Draft202012Validator,
                        data: dict | list,
                        ) -> ValidationResult:
     """Validate unit data"""
 
-    assert _validate_schema(data_validator), "Failed to validate unit data schema"
+    # unit data validated as a whole at load
+    is_validated: Callable[[Draft202012Validator], bool] | None = \
+        getattr(data, 'is_validated', None)
+    if is_validated is not None and is_validated(data_validator):
+        with _lock:
+            _stats['token_hits'] += 1
+        return ValidationResult.OK
 
-    try:
-        data_validator.validate(data)
-    except ValidationError:
-        logging.warning('Validation Error(s):')
-        for error in data_validator.iter_errors(data):
-            logging.warning(error.message)
-        return ValidationResult.VALIDATION_FAILED
+    memoised: ValidationResult | None = _memo_get(data_validator, data)
+    if memoised is not None:
+        return memoised
+
+    start: float = time.perf_counter()
+
+    # fast path: compiled check, jsonschema only runs to report errors
+    if _check_function(data_validator)(data):
+        result: ValidationResult = ValidationResult.OK
+    else:
+        errors: list[ValidationError] = list(data_validator.iter_errors(data))
+        if len(errors) > 0:
+            logging.warning('Validation Error(s):')
+            for error in errors:
+                logging.warning(error.message)
+            result: ValidationResult = ValidationResult.VALIDATION_FAILED
+        else:
+            result: ValidationResult = ValidationResult.OK
+
+    with _lock:
+        _stats['validations'] += 1
+        _stats['failures'] += result != ValidationResult.OK
+        _stats['seconds'] += time.perf_counter() - start
+
+    _memo_put(data_validator, data, result)
+
+    return result
+
+
+def unit_data_errors(data_validator: Draft202012Validator, data: dict | list) -> list[str]:
+    """List all validation errors, prefixed with their location in the data"""
+
+    start: float = time.perf_counter()
+
+    errors: list[str] = [] if _check_function(data_validator)(data) else [
+        '/'.join(str(part) for part in error.absolute_path) + ': ' + error.message
+        if len(error.absolute_path) > 0 else error.message
+        for error in data_validator.iter_errors(data)
+    ]
+
+    with _lock:
+        _stats['validations'] += 1
+        _stats['failures'] += len(errors) > 0
+        _stats['seconds'] += time.perf_counter() - start
+
+    return errors
+
+
+def validator_fingerprint(data_validator: Draft202012Validator) -> str:
+    """Hash of a validator's schema, changing whenever the schema does"""
 
-    return ValidationResult.OK
+    schema_text: str = json.dumps(data_validator.schema, sort_keys=True, default=str)
+
+    return hashlib.sha256(schema_text.encode('UTF-8')).hexdigest()
+
+
+# shared shapes, composed unit schemas refer to them through $defs --- #
+
+SCHEMA_ID_TEXT: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "text": {"type": "string"},
+    },
+}
+
+SCHEMA_WR_QUESTIONS: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "task_number": {
+            "type": "integer",
+            "minimum": 1,
+        },
+        "prompt": {"type": "string"},
+        "scoring": {"type": "string"},
+        "items": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "question": {"type": "string"},
+                    "answer": {"type": "string"},
+                    "accept": {
+                        "type": "array",
+                        "minItems": 0,
+                        "items": {"type": "string"},
+                    },
+                },
+            },
+        },
+    },
+}
 
 
 def schema_text_single(data_key: str) -> dict[str, Any]:
@@ -86,33 +318,6 @@ def schema_wr_questions(data_key: str) -> dict[str, Any]:
         "type": "object",
         "required": [data_key],
         "properties": {
-            data_key: {
-                "type": "object",
-                "properties": {
-                    "task_number": {
-                        "type": "integer",
-                        "minimum": 1,
-                    },
-                    "prompt": {"type": "string"},
-                    "scoring": {"type": "string"},
-                    "items": {
-                        "type": "array",
-                        "minItems": 1,
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "id": {"type": "string"},
-                                "question": {"type": "string"},
-                                "answer": {"type": "string"},
-                                "accept": {
-                                    "type": "array",
-                                    "minItems": 0,
-                                    "items": {"type": "string"},
-                                },
-                            },
-                        },
-                    },
-                },
-            },
+            data_key: SCHEMA_WR_QUESTIONS,
         },
     }
@@ -0,0 +1,260 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Compilation of data schemas into Python check functions
+
+The generated functions only answer whether data is valid. Error
+messages still come from jsonschema, once a check has failed.
+"""
+
+# imports: library
+import logging
+import threading
+from typing import Any, Callable
+
+# imports: dependencies
+from jsonschema import Draft202012Validator
+
+SUPPORTED_KEYWORDS: frozenset[str] = frozenset([
+    'type', 'required', 'properties', 'dependentSchemas', 'items', 'minItems', 'maxItems',
+    'minimum', 'maximum', 'allOf', '$ref', '$defs',
+])
+
+REF_PREFIX_DEFS: str = '#/$defs/'
+
+ANNOTATION_KEYWORDS: frozenset[str] = frozenset([
+    '$schema', '$id', '$comment', 'title', 'description', 'default', 'examples',
+])
+
+TYPE_CHECKS: dict[str, str] = {
+    'object': 'isinstance({0}, dict)',
+    'array': 'isinstance({0}, list)',
+    'string': 'isinstance({0}, str)',
+    'integer': '(type({0}) is int or (type({0}) is float and {0}.is_integer()))',
+    'number': 'type({0}) in (int, float)',
+    'boolean': 'type({0}) is bool',
+    'null': '{0} is None',
+}
+
+CheckFunction = Callable[[Any], bool]
+
+
+class SchemaCompileError(ValueError):
+    """Schema uses features the compiler does not support"""
+
+
+class _Generator:
+    """Python source generator for a single schema"""
+
+    def __init__(self, root: dict[str, Any]) -> None:
+
+        self.lines: list[str] = []
+        self._variable_count: int = 0
+        self._defs: dict[str, Any] = root.get('$defs', {})
+        self._active_refs: list[str] = []
+
+    def variable(self) -> str:
+        """Get a new local variable name"""
+
+        self._variable_count += 1
+
+        return f'v{self._variable_count}'
+
+    def emit(self, depth: int, line: str) -> None:
+        """Add a source line"""
+        self.lines.append('    ' * depth + line)
+
+    def fail_unless(self, depth: int, condition: str) -> None:
+        """Add a check returning False if a condition does not hold"""
+        self.emit(depth, f'if not ({condition}):')
+        self.emit(depth + 1, 'return False')
+
+    def schema(self, node: Any, value: str, depth: int) -> None:
+        """Add the checks of a schema node for the value in a variable"""
+
+        if node is True or node == {}:
+            return
+
+        if not isinstance(node, dict):
+            raise SchemaCompileError(f'Unsupported schema node: {node!r}')
+
+        unsupported: set[str] = set(node) - SUPPORTED_KEYWORDS - ANNOTATION_KEYWORDS
+        if len(unsupported) > 0:
+            raise SchemaCompileError(f'Unsupported schema keywords: {sorted(unsupported)}')
+
+        if '$ref' in node:
+            self._ref(node['$ref'], value, depth)
+
+        for subnode in node.get('allOf', []):
+            self.schema(subnode, value, depth)
+
+        types: list[str] = self._types(node)
+
+        if len(types) > 0:
+            self.fail_unless(depth, ' or '.join(TYPE_CHECKS[name].format(value) for name in types))
+
+        self._object(node, value, depth, types)
+        self._array(node, value, depth, types)
+        self._numeric(node, value, depth, types)
+
+    def _ref(self, ref: str, value: str, depth: int) -> None:
+        """Add the checks of a referenced definition, inlined"""
+
+        if not ref.startswith(REF_PREFIX_DEFS) or ref[len(REF_PREFIX_DEFS):] not in self._defs:
+            raise SchemaCompileError(f'Unsupported schema reference: {ref!r}')
+
+        if ref in self._active_refs:
+            raise SchemaCompileError(f'Recursive schema reference: {ref!r}')
+
+        self._active_refs.append(ref)
+        self.schema(self._defs[ref[len(REF_PREFIX_DEFS):]], value, depth)
+        self._active_refs.pop()
+
+    @staticmethod
+    def _types(node: dict[str, Any]) -> list[str]:
+        """Type names of a schema node"""
+
+        types: Any = node.get('type', [])
+        if isinstance(types, str):
+            types = [types]
+
+        for name in types:
+            if name not in TYPE_CHECKS:
+                raise SchemaCompileError(f'Unsupported schema type: {name!r}')
+
+        return types
+
+    def _guarded(self, value: str, depth: int, types: list[str], json_type: str) -> int:
+        """Open a type guard unless the node only allows that type, return the new depth"""
+
+        if types == [json_type]:
+            return depth
+
+        self.emit(depth, f'if {TYPE_CHECKS[json_type].format(value)}:')
+
+        return depth + 1
+
+    def _object(self, node: dict[str, Any], value: str, depth: int, types: list[str]) -> None:
+        """Add object keyword checks"""
+
+        required: list[str] = node.get('required', [])
+        properties: dict[str, Any] = node.get('properties', {})
+        dependent_schemas: dict[str, Any] = node.get('dependentSchemas', {})
+
+        if len(required) == 0 and len(properties) == 0 and len(dependent_schemas) == 0:
+            return
+
+        depth = self._guarded(value, depth, types, 'object')
+
+        for key in required:
+            self.fail_unless(depth, f'{key!r} in {value}')
+
+        for key, subnode in properties.items():
+            if subnode is True or subnode == {}:
+                continue
+            item: str = self.variable()
+            if key in required:
+                self.emit(depth, f'{item} = {value}[{key!r}]')
+                self.schema(subnode, item, depth)
+            else:
+                self.emit(depth, f'if {key!r} in {value}:')
+                self.emit(depth + 1, f'{item} = {value}[{key!r}]')
+                self.schema(subnode, item, depth + 1)
+
+        for key, subnode in dependent_schemas.items():
+            if subnode is True or subnode == {}:
+                continue
+            self.emit(depth, f'if {key!r} in {value}:')
+            # keeps the block valid when the subschema adds no checks
+            self.emit(depth + 1, 'pass')
+            self.schema(subnode, value, depth + 1)
+
+    def _array(self, node: dict[str, Any], value: str, depth: int, types: list[str]) -> None:
+        """Add array keyword checks"""
+
+        if not any(keyword in node for keyword in ('items', 'minItems', 'maxItems')):
+            return
+
+        depth = self._guarded(value, depth, types, 'array')
+
+        if 'minItems' in node and node['minItems'] > 0:
+            self.fail_unless(depth, f'len({value}) >= {int(node["minItems"])}')
+
+        if 'maxItems' in node:
+            self.fail_unless(depth, f'len({value}) <= {int(node["maxItems"])}')
+
+        subnode: Any = node.get('items', True)
+        if subnode is True or subnode == {}:
+            return
+
+        item: str = self.variable()
+        self.emit(depth, f'for {item} in {value}:')
+        self.schema(subnode, item, depth + 1)
+
+    def _numeric(self, node: dict[str, Any], value: str, depth: int, types: list[str]) -> None:
+        """Add numeric keyword checks"""
+
+        if 'minimum' not in node and 'maximum' not in node:
+            return
+
+        if types not in (['integer'], ['number']):
+            depth = self._guarded(value, depth, types, 'number')
+
+        if 'minimum' in node:
+            self.fail_unless(depth, f'{value} >= {node["minimum"]!r}')
+
+        if 'maximum' in node:
+            self.fail_unless(depth, f'{value} <= {node["maximum"]!r}')
+
+
+def source(schema_dict: dict[str, Any], function_name: str = 'check') -> str:
+    """Generate the source of a check function for a schema"""
+
+    generator: _Generator = _Generator(schema_dict)
+
+    generator.emit(0, f'def {function_name}(v0):')
+    generator.schema(schema_dict, 'v0', 1)
+    generator.emit(1, 'return True')
+
+    return '\n'.join(generator.lines) + '\n'
+
+
+def compile_schema(schema_dict: dict[str, Any]) -> CheckFunction:
+    """Compile a schema into a check function"""
+
+    namespace: dict[str, Any] = {}
+
+    exec(compile(source(schema_dict), '<schema>', 'exec'), namespace)  # pylint: disable=exec-used
+
+    return namespace['check']
+
+
+_compiled: dict[int, tuple[Draft202012Validator, CheckFunction]] = {}
+_compiled_lock: threading.Lock = threading.Lock()
+
+
+def check_function(data_validator: Draft202012Validator) -> CheckFunction:
+    """Get the compiled check function of a validator, compiling it on first use
+
+    Schemas the compiler does not support fall back to jsonschema's own
+    is_valid.
+    """
+
+    entry: tuple[Draft202012Validator, CheckFunction] | None = \
+        _compiled.get(id(data_validator), None)
+
+    if entry is not None and entry[0] is data_validator:
+        return entry[1]
+
+    with _compiled_lock:
+        try:
+            check: CheckFunction = compile_schema(data_validator.schema)
+        except SchemaCompileError as exc:
+            logging.info('Schema not compiled, using jsonschema: %s', exc)
+            check: CheckFunction = data_validator.is_valid
+
+        # the validator is kept referenced, so its id stays unique
+        _compiled[id(data_validator)] = (data_validator, check)
+
+    return check
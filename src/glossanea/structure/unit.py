@@ -5,18 +5,22 @@
 """Unit"""
 
 # imports: library
+import functools
 import os.path
 from typing import Any
 
 # imports: project
+from glossanea.structure import cache
 from glossanea.structure import data
 from glossanea.structure import data_version
+from glossanea.structure import unit_schema
 from glossanea.structure.exceptions import DataError
+from glossanea.structure.frozen import freeze
+from glossanea.structure.schema import ValidationToken
 from glossanea.tasks.t_1_new_words_common import DATA_KEY_NEW_WORDS_EXTENSION
 
 
 MIN_WEEK_NUMBER: int = 1
-MAX_WEEK_NUMBER: int = 12
 UNITS_PER_WEEK: int = 7
 MIN_DAY_NUMBER: int = 1
 MAX_DAY_NUMBER: int = 6
@@ -48,11 +52,30 @@ class Unit:
 
         return f'{self._unit_number}'
 
+    @property
+    def data_size(self) -> int:
+        """Get the size of the data file in bytes"""
+        return self._data_size
+
     @property
     def is_weekly_review(self) -> bool:
         """Get whether unit is a Weekly Review"""
         return self._unit_number == WEEKLY_REVIEW_INDEX
 
+    @property
+    def unit_type(self) -> str:
+        """Get the unit type, which selects the unit schema"""
+
+        if self.is_weekly_review:
+            return unit_schema.UNIT_TYPE_WEEKLY_REVIEW
+
+        return unit_schema.UNIT_TYPE_DAY
+
+    @property
+    def validation_token(self) -> ValidationToken | None:
+        """Get the token of the unit-level validation, None if the unit failed it"""
+        return getattr(self.unit_data, 'validation_token', None)
+
     # content getters ------------------------------------------------ #
 
     @property
@@ -85,11 +108,52 @@ class Unit:
         else:
             file_path: str = build_path_day(self._week_number, self._unit_number)
 
-        self.unit_data: dict[str, Any] = data.load_json_file(file_path)
+        source: data.SectionSource | None = data.section_source()
+
+        if source is not None:
+            # only the top-level keys are read here, sections decode on first access
+            lazy_unit_data: data.LazyUnitData = data.LazyUnitData(
+                source.unit_keys(self._week_number, self._unit_number),
+                functools.partial(source.section, self._week_number, self._unit_number),
+            )
+            self._validate_data_version(lazy_unit_data)
+            self.unit_data: data.UnitData = unit_schema.registry.attach(
+                self.unit_type, lazy_unit_data.without(data_version.DATA_KEY)
+            )
+            self._data_size: int = source.unit_size(self._week_number, self._unit_number)
+            return
+
+        full_path: str = data.data_file_path(file_path)
+
+        cached: tuple[dict[str, Any], str | None] | None = cache.load(full_path)
+
+        if cached is None:
+            loaded_unit_data: dict[str, Any] = data.load_json_file(file_path)
+            self._validate_data_version(loaded_unit_data)
+            unit_data: dict[str, Any] = freeze({
+                key: value for key, value in loaded_unit_data.items()
+                if key != data_version.DATA_KEY
+            })
+            self.unit_data: data.UnitData = unit_schema.registry.attach(
+                self.unit_type, data.UnitData(unit_data)
+            )
+            cache.store(full_path, unit_data, None if self.validation_token is None
+                        else self.validation_token.schema_fingerprint)
+        else:
+            # data which passed the current unit schema is not validated again
+            unit_data, schema_fingerprint = cached
+            self.unit_data: data.UnitData = unit_schema.registry.attach(
+                self.unit_type, data.UnitData(freeze(unit_data)), schema_fingerprint
+            )
+
+        self._data_size: int = os.path.getsize(full_path)
+
+    def _validate_data_version(self, unit_data: dict[str, Any]) -> None:
+        """Validate the data version of loaded unit data"""
 
-        match data_version.validate(self.unit_data):
+        match data_version.validate(unit_data):
             case data_version.ValidationResult.OK, _:
-                del self.unit_data[data_version.DATA_KEY]
+                pass
             case _, reason:
                 msg: str = f'{reason} (Week {self._week_number} / Day {self.unit_number_display})'
                 raise DataError(msg)
@@ -103,7 +167,7 @@ def validate_week_number(week_number: int) -> bool:
     if not isinstance(week_number, int):
         raise ValueError('Given week number value is not an integer!')
 
-    if week_number < MIN_WEEK_NUMBER or week_number > MAX_WEEK_NUMBER:
+    if week_number < MIN_WEEK_NUMBER:
         raise ValueError('Wrong week number!')
 
     return True
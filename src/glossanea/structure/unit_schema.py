@@ -0,0 +1,263 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit-level schemas composed from the task schemas"""
+
+# imports: library
+import copy
+import logging
+import threading
+from types import ModuleType
+from typing import Any
+
+# imports: dependencies
+from jsonschema import Draft202012Validator
+
+# imports: project
+from glossanea import tasks
+from glossanea.structure import data
+from glossanea.structure import data_version
+from glossanea.structure import schema
+from glossanea.structure import schema_compiler
+from glossanea.structure.schema import ValidationToken
+
+UNIT_TYPE_DAY: str = 'day'
+UNIT_TYPE_WEEKLY_REVIEW: str = 'WR'
+UNIT_TYPES: tuple[str, ...] = (UNIT_TYPE_DAY, UNIT_TYPE_WEEKLY_REVIEW)
+
+# task module name prefix -> unit types using the task
+TASK_MODULE_PREFIXES: dict[str, tuple[str, ...]] = {
+    'c_': (UNIT_TYPE_DAY, UNIT_TYPE_WEEKLY_REVIEW),
+    't_': (UNIT_TYPE_DAY,),
+    'wr_': (UNIT_TYPE_WEEKLY_REVIEW,),
+}
+
+SHARED_DEFS: dict[str, dict[str, Any]] = {
+    'id_text': schema.SCHEMA_ID_TEXT,
+    'wr_questions': schema.SCHEMA_WR_QUESTIONS,
+}
+
+
+def _share_defs(node: Any, used_defs: set[str]) -> Any:
+    """Copy a schema node, replacing shared shapes with references"""
+
+    for def_name, def_schema in SHARED_DEFS.items():
+        if node == def_schema:
+            used_defs.add(def_name)
+            return {'$ref': f'{schema_compiler.REF_PREFIX_DEFS}{def_name}'}
+
+    if isinstance(node, dict):
+        return {key: _share_defs(value, used_defs) for key, value in node.items()}
+
+    if isinstance(node, list):
+        return [_share_defs(value, used_defs) for value in node]
+
+    return node
+
+
+def _property_schemas(unit_schema: dict[str, Any], data_key: str) -> list[Any]:
+    """Schemas checking a key of a composed unit schema, from any of its tasks"""
+
+    found: list[Any] = []
+
+    def collect(node: Any) -> None:
+        """Collect the property schemas of an object schema and its parts"""
+        if not isinstance(node, dict):
+            return
+        property_schema: Any = node.get('properties', {}).get(data_key, None)
+        if property_schema is not None and property_schema not in found:
+            found.append(property_schema)
+        for subnode in node.get('allOf', []):
+            collect(subnode)
+
+    collect(unit_schema)
+    for task_schema in unit_schema.get('dependentSchemas', {}).values():
+        collect(task_schema)
+
+    return found
+
+
+class SchemaRegistry:
+    """Task schemas by unit type, and the unit schemas composed from them"""
+
+    def __init__(self) -> None:
+
+        self._lock: threading.Lock = threading.Lock()
+
+        self._tasks: dict[str, dict[str, list[Draft202012Validator]]] = {
+            unit_type: {} for unit_type in UNIT_TYPES
+        }
+
+        self._validators: dict[str, Draft202012Validator] = {}
+        self._section_checks: dict[str, dict[str, schema_compiler.CheckFunction]] = {}
+        self._tokens: dict[str, ValidationToken] = {}
+
+    def register(self, unit_type: str, data_key: str, data_validator: Draft202012Validator) -> None:
+        """Register the validator of a task for a unit type"""
+
+        if unit_type not in UNIT_TYPES:
+            raise ValueError(f'Incorrect unit type: {unit_type}')
+
+        schema.register_validator(data_validator)
+
+        with self._lock:
+            validators: list[Draft202012Validator] = \
+                self._tasks[unit_type].setdefault(data_key, [])
+            if not any(validator is data_validator for validator in validators):
+                validators.append(data_validator)
+
+            # recompose on next use
+            self._validators.pop(unit_type, None)
+            self._section_checks.pop(unit_type, None)
+            self._tokens.pop(unit_type, None)
+
+    def compose(self, unit_type: str) -> dict[str, Any]:
+        """Compose the schema of a unit type
+
+        Task keys are optional, as a unit only runs the tasks it has. The
+        whole schema of a task, with its other required and checked keys,
+        applies when the unit has the task key.
+        """
+
+        properties: dict[str, Any] = {
+            data_version.DATA_KEY: data_version.SCHEMA['properties'][data_version.DATA_KEY],
+        }
+
+        dependent_schemas: dict[str, Any] = {}
+
+        for data_key, validators in self._tasks[unit_type].items():
+            subschemas: list[Any] = []
+            for validator in validators:
+                if validator.schema not in subschemas:
+                    subschemas.append(validator.schema)
+            dependent_schemas[data_key] = subschemas[0] if len(subschemas) == 1 \
+                else {'allOf': subschemas}
+
+        used_defs: set[str] = set()
+        properties = _share_defs(properties, used_defs)
+        dependent_schemas = _share_defs(dependent_schemas, used_defs)
+
+        return {
+            '$defs': {def_name: copy.deepcopy(SHARED_DEFS[def_name])
+                      for def_name in sorted(used_defs)},
+            'type': 'object',
+            'properties': properties,
+            'dependentSchemas': dependent_schemas,
+        }
+
+    def validator(self, unit_type: str) -> Draft202012Validator:
+        """Get the validator of a unit type, composing its schema on first use"""
+
+        with self._lock:
+            if unit_type not in self._validators:
+                unit_validator: Draft202012Validator = Draft202012Validator(self.compose(unit_type))
+                schema.register_validator(unit_validator)
+                self._validators[unit_type] = unit_validator
+
+            return self._validators[unit_type]
+
+    def token(self, unit_type: str) -> ValidationToken:
+        """Get the token handed to units of a type which passed validation"""
+
+        unit_validator: Draft202012Validator = self.validator(unit_type)
+
+        with self._lock:
+            if unit_type not in self._tokens:
+                self._tokens[unit_type] = ValidationToken(
+                    unit_type=unit_type,
+                    schema_fingerprint=schema.validator_fingerprint(unit_validator),
+                    task_validators=tuple(
+                        (validator, data_key)
+                        for data_key, validators in self._tasks[unit_type].items()
+                        for validator in validators
+                    ),
+                )
+
+            return self._tokens[unit_type]
+
+    def section_check(self, unit_type: str, data_key: str, value: Any) -> bool:
+        """Check a single section against the composed schema of a unit type"""
+
+        unit_validator: Draft202012Validator = self.validator(unit_type)
+
+        with self._lock:
+            section_checks: dict[str, schema_compiler.CheckFunction] = \
+                self._section_checks.setdefault(unit_type, {})
+
+            if data_key not in section_checks:
+                section_validator: Draft202012Validator = Draft202012Validator({
+                    '$defs': unit_validator.schema['$defs'],
+                    'allOf': _property_schemas(unit_validator.schema, data_key),
+                })
+                schema.register_validator(section_validator)
+                section_checks[data_key] = schema_compiler.check_function(section_validator)
+
+        return section_checks[data_key](value)
+
+    def errors(self, unit_type: str, unit_data: dict[str, Any]) -> list[str]:
+        """Validate unit data against the composed schema of its type"""
+        return schema.unit_data_errors(self.validator(unit_type), unit_data)
+
+    def attach(self,
+               unit_type: str,
+               unit_data: data.UnitData,
+               schema_fingerprint: str | None = None,
+               ) -> data.UnitData:
+        """Validate unit data once, return it carrying a token if it passed
+
+        Data which passed a schema with the given fingerprint before, e.g.
+        when it was cached, is not validated again while the schema is the same.
+        """
+
+        if isinstance(unit_data, data.LazyUnitData):
+            # sections are checked as they decode
+            unit_data.set_validation(
+                self.token(unit_type),
+                lambda data_key, value: self.section_check(unit_type, data_key, value),
+            )
+            return unit_data
+
+        validation_token: ValidationToken = self.token(unit_type)
+
+        if schema_fingerprint == validation_token.schema_fingerprint:
+            unit_data.validation_token = validation_token
+            return unit_data
+
+        errors: list[str] = self.errors(unit_type, unit_data)
+
+        if len(errors) > 0:
+            logging.warning('Unit failed unit-level validation, tasks check their own data')
+            for error in errors:
+                logging.warning(error)
+            return unit_data
+
+        unit_data.validation_token = validation_token
+
+        return unit_data
+
+
+def _register_tasks(schema_registry: SchemaRegistry) -> None:
+    """Register the validators of all task modules"""
+
+    for task_name in dir(tasks):
+        task_module: Any = getattr(tasks, task_name)
+
+        if not isinstance(task_module, ModuleType):
+            continue
+
+        data_validator: Draft202012Validator | None = getattr(task_module, 'DATA_VALIDATOR', None)
+        if data_validator is None:
+            continue
+
+        module_name: str = task_module.__name__.rsplit('.', 1)[-1]
+
+        for prefix, unit_types in TASK_MODULE_PREFIXES.items():
+            if module_name.startswith(prefix):
+                for unit_type in unit_types:
+                    schema_registry.register(unit_type, task_module.DATA_KEY, data_validator)
+
+
+registry: SchemaRegistry = SchemaRegistry()
+
+_register_tasks(registry)
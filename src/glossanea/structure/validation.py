@@ -0,0 +1,346 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Whole-course data validation"""
+
+# imports: library
+import hashlib
+import json
+import logging
+import os
+import os.path
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Any, Callable
+
+# imports: dependencies
+from jsonschema import Draft202012Validator
+
+# imports: project
+from glossanea import tasks
+from glossanea import version
+from glossanea.structure import cache
+from glossanea.structure import data_version
+from glossanea.structure import decoding
+from glossanea.structure import pack
+from glossanea.structure import schema
+from glossanea.structure.schema import ValidationResult
+from glossanea.tasks.t_1_new_words_common import DATA_KEY_NEW_WORDS_EXTENSION
+
+NON_TASK_KEYS: frozenset[str] = frozenset([data_version.DATA_KEY, DATA_KEY_NEW_WORDS_EXTENSION])
+
+MANIFEST_FORMAT_VERSION: int = 1
+
+FINGERPRINT_UNKNOWN_TASK: str = 'unknown'
+FINGERPRINT_NO_VALIDATOR: str = 'none'
+
+
+# unit checks -------------------------------------------------------- #
+
+def validate_unit_data(unit_data: Any) -> list[tuple[str, str]]:
+    """Validate decoded unit data, return (task name, message) pairs"""
+
+    errors: list[tuple[str, str]] = [
+        (data_version.DATA_KEY, message)
+        for message in schema.unit_data_errors(data_version.DATA_VALIDATOR, unit_data)
+    ]
+
+    if len(errors) > 0:
+        return errors
+
+    match data_version.validate(unit_data):
+        case ValidationResult.OK, _:
+            pass
+        case _, reason:
+            errors.append((data_version.DATA_KEY, reason))
+
+    for task_name in unit_data:
+        if task_name in NON_TASK_KEYS:
+            continue
+
+        task_module: ModuleType | None = getattr(tasks, task_name, None)
+        if task_module is None:
+            errors.append((task_name, f'Unrecognized task type: {task_name}'))
+            continue
+
+        data_validator: Draft202012Validator | None = getattr(task_module, 'DATA_VALIDATOR', None)
+        if data_validator is not None:
+            task_errors: list[str] = schema.unit_data_errors(data_validator, unit_data)
+            if len(task_errors) > 0:
+                errors += [(task_name, message) for message in task_errors]
+                continue
+
+        semantic_errors: Callable[[dict[str, Any]], list[str]] | None = \
+            getattr(task_module, 'semantic_errors', None)
+        if semantic_errors is not None:
+            errors += [(task_name, message) for message in semantic_errors(unit_data)]
+
+    return errors
+
+
+def _check_unit_file(full_path: str) -> tuple[list[tuple[str, str]], list[str]]:
+    """Validate a unit data file, return its errors and task names"""
+
+    try:
+        unit_data: Any = decoding.load_file(full_path)
+    except decoding.DecodeError as exc:
+        return [('', f'Failed to decode JSON data file: {exc}')], []
+    except OSError as exc:
+        return [('', f'Failed to read data file: {exc}')], []
+
+    task_names: list[str] = [key for key in unit_data if key not in NON_TASK_KEYS] \
+        if isinstance(unit_data, dict) else []
+
+    return validate_unit_data(unit_data), task_names
+
+
+def _unit_report(week_number: int,
+                 unit_number: int,
+                 full_path: str,
+                 errors: list[tuple[str, str]],
+                 ) -> dict[str, Any]:
+    """Report of a unit"""
+
+    return {
+        'week': week_number,
+        'unit': unit_number,
+        'path': full_path,
+        'errors': [{'task': task_name, 'message': message} for task_name, message in errors],
+    }
+
+
+def validate_unit_file(week_number: int, unit_number: int, full_path: str) -> dict[str, Any]:
+    """Validate a unit data file, return its report"""
+
+    errors, _ = _check_unit_file(full_path)
+
+    return _unit_report(week_number, unit_number, full_path, errors)
+
+
+# fingerprints ------------------------------------------------------- #
+
+def _task_fingerprint(task_name: str) -> str:
+    """Fingerprint of the validator of a task"""
+
+    task_module: ModuleType | None = getattr(tasks, task_name, None)
+    if task_module is None:
+        return FINGERPRINT_UNKNOWN_TASK
+
+    data_validator: Draft202012Validator | None = getattr(task_module, 'DATA_VALIDATOR', None)
+    if data_validator is None:
+        return FINGERPRINT_NO_VALIDATOR
+
+    return schema.validator_fingerprint(data_validator)
+
+
+def _schema_fingerprint(task_names: list[str], task_fingerprints: dict[str, str]) -> str:
+    """Fingerprint of every schema a unit with these tasks is validated against"""
+
+    fingerprint = hashlib.sha256()
+
+    fingerprint.update(f'{version.REQUIRED_DATA_VERSION}\n'.encode('UTF-8'))
+    fingerprint.update(schema.validator_fingerprint(data_version.DATA_VALIDATOR).encode('UTF-8'))
+
+    for task_name in sorted(task_names):
+        if task_name not in task_fingerprints:
+            task_fingerprints[task_name] = _task_fingerprint(task_name)
+        fingerprint.update(f'\n{task_name}:{task_fingerprints[task_name]}'.encode('UTF-8'))
+
+    return fingerprint.hexdigest()
+
+
+# incremental manifest ----------------------------------------------- #
+
+def _manifest_file_path(data_dir_path: str) -> str:
+    """Validation manifest file path of a data dir"""
+    return cache.data_dir_file_path(data_dir_path, 'validation')
+
+
+def _read_manifest(manifest_file_path: str) -> dict[str, dict[str, Any]]:
+    """Read the per-file records of a validation manifest"""
+
+    try:
+        with open(manifest_file_path, 'rb') as fh:
+            manifest: Any = decoding.loads(fh.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, decoding.DecodeError) as exc:
+        logging.warning('Ignoring unreadable validation manifest "%s": %s', manifest_file_path, exc)
+        return {}
+
+    if not isinstance(manifest, dict) \
+            or manifest.get('format') != MANIFEST_FORMAT_VERSION \
+            or manifest.get('program_version') != version.__version__:
+        return {}
+
+    return manifest.get('files', {})
+
+
+def _write_manifest(manifest_file_path: str, files: dict[str, dict[str, Any]]) -> None:
+    """Write a validation manifest atomically"""
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(manifest_file_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='UTF-8') as fh:
+            json.dump({
+                'format': MANIFEST_FORMAT_VERSION,
+                'program_version': version.__version__,
+                'files': files,
+            }, fh, ensure_ascii=False)
+        os.replace(temp_path, manifest_file_path)
+    except OSError as exc:
+        logging.warning('Failed to write validation manifest "%s": %s', manifest_file_path, exc)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def _content_hash(full_path: str) -> str | None:
+    """Content hash of a data file, None if it cannot be read"""
+
+    try:
+        with open(full_path, 'rb') as fh:
+            return hashlib.sha256(fh.read()).hexdigest()
+    except OSError:
+        return None
+
+
+# course ------------------------------------------------------------- #
+
+def _partition(full_paths: list[str],
+               previous_files: dict[str, dict[str, Any]],
+               task_fingerprints: dict[str, str],
+               ) -> tuple[list[str], dict[str, str | None], dict[str, dict[str, Any]]]:
+    """Split data files into those to check and those whose previous record still holds
+
+    Returns the paths to check, the content hashes of all paths and the
+    reused manifest records.
+    """
+
+    pending: list[str] = []
+    content_hashes: dict[str, str | None] = {}
+    reused: dict[str, dict[str, Any]] = {}
+
+    for full_path in full_paths:
+        content_hash: str | None = _content_hash(full_path)
+        content_hashes[full_path] = content_hash
+        record: dict[str, Any] | None = previous_files.get(full_path, None)
+
+        if content_hash is not None and record is not None \
+                and record['content_hash'] == content_hash \
+                and record['schema_fingerprint'] == _schema_fingerprint(record['task_names'],
+                                                                        task_fingerprints):
+            reused[full_path] = record
+        else:
+            pending.append(full_path)
+
+    return pending, content_hashes, reused
+
+
+def _check_unit_files(full_paths: list[str],
+                      jobs: int,
+                      ) -> list[tuple[list[tuple[str, str]], list[str]]]:
+    """Validate unit data files, in a process pool with more than one job"""
+
+    if jobs == 1:
+        return [_check_unit_file(full_path) for full_path in full_paths]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(
+            _check_unit_file,
+            full_paths,
+            chunksize=max(1, len(full_paths) // (jobs * 4)),
+        ))
+
+
+def _manifest_record(content_hash: str,
+                     errors: list[tuple[str, str]],
+                     task_names: list[str],
+                     task_fingerprints: dict[str, str],
+                     ) -> dict[str, Any]:
+    """Validation manifest record of a checked data file"""
+
+    return {
+        'content_hash': content_hash,
+        'task_names': task_names,
+        'schema_fingerprint': _schema_fingerprint(task_names, task_fingerprints),
+        'errors': [list(error) for error in errors],
+    }
+
+
+def validate_course(data_dir_path: str,
+                    jobs: int | None = None,
+                    incremental: bool = False,
+                    ) -> dict[str, Any]:
+    """Validate every unit data file of a data dir, return the report
+
+    With more than one job, units are validated in a process pool.
+    Incrementally, units whose content and schemas match the manifest
+    of the previous run reuse its result instead of being validated.
+    """
+
+    start: float = time.perf_counter()
+
+    unit_files: list[tuple[int, int, str]] = pack.find_unit_files(data_dir_path)
+    full_paths: list[str] = [full_path for _, _, full_path in unit_files]
+
+    task_fingerprints: dict[str, str] = {}
+    manifest_file_path: str = _manifest_file_path(data_dir_path) if incremental else ''
+
+    if incremental:
+        pending, content_hashes, files = _partition(
+            full_paths, _read_manifest(manifest_file_path), task_fingerprints)
+    else:
+        pending, content_hashes, files = full_paths, {}, {}
+
+    results: dict[str, list[tuple[str, str]]] = {
+        full_path: [tuple(error) for error in record['errors']]
+        for full_path, record in files.items()
+    }
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    jobs = max(1, min(jobs, len(pending)))
+
+    checked: dict[str, tuple[list[tuple[str, str]], list[str]]] = \
+        dict(zip(pending, _check_unit_files(pending, jobs)))
+
+    results.update({full_path: errors for full_path, (errors, _) in checked.items()})
+    files.update({
+        full_path: _manifest_record(content_hashes[full_path], errors, task_names,
+                                    task_fingerprints)
+        for full_path, (errors, task_names) in checked.items()
+        if content_hashes.get(full_path, None) is not None
+    })
+
+    if incremental:
+        _write_manifest(manifest_file_path, files)
+
+    failed_reports: list[dict[str, Any]] = [
+        _unit_report(week_number, unit_number, full_path, results[full_path])
+        for week_number, unit_number, full_path in unit_files
+        if len(results[full_path]) > 0
+    ]
+
+    report: dict[str, Any] = {
+        'data_dir': data_dir_path,
+        'units': len(unit_files),
+        'failed': len(failed_reports),
+        'error_count': sum(len(unit_report['errors']) for unit_report in failed_reports),
+        'jobs': jobs,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+    if incremental:
+        report['checked'] = len(pending)
+        report['skipped'] = len(unit_files) - len(pending)
+        report['checked_paths'] = pending
+
+    report['results'] = failed_reports
+
+    return report
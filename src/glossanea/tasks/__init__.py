@@ -4,7 +4,7 @@
 
 """Tasks"""
 
-from glossanea.tasks._common import TaskResult
+from glossanea.tasks._common import TaskProgress, TaskResult
 
 # Common
 import glossanea.tasks.c_1_title as title
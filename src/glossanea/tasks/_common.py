@@ -5,7 +5,9 @@
 """Tasks"""
 
 # imports: library
+import dataclasses
 import enum
+import functools
 import logging
 from typing import Any, Callable
 
@@ -15,8 +17,11 @@ from jsonschema import Draft202012Validator
 # imports: project
 from glossanea.cli import output
 from glossanea.cli import user_input
+from glossanea.cli.commands import CommandRegistry, PluginCommand, Resolution
 from glossanea.structure import schema
 from glossanea.structure.schema import ValidationResult
+from glossanea.tasks import _matcher
+from glossanea.tasks._matcher import AnswerMatcher, MatchResult
 from glossanea.tasks import t_1_new_words_common as new_words
 
 
@@ -72,13 +77,15 @@ COMMAND_TEXTS: dict[str, Command] = {
     'words': Command.WORDS,
 }
 
+COMMANDS: CommandRegistry = CommandRegistry(COMMAND_TEXTS)
+
 COMMAND_PREFIXES: list[str] = ['cmd ', '/']
 
 
 def get_answer(prompt: str) -> tuple[InputType, str]:
     """Get user input - answer"""
 
-    input_text: str = input(prompt)
+    input_text: str = user_input.read_line(prompt)
 
     for command_prefix in COMMAND_PREFIXES:
         if input_text.startswith(command_prefix):
@@ -98,29 +105,26 @@ def help_cmd_in_task() -> None:
         [Command.PREVIOUS.value, 'Leave task and jump back to the previous one.'],
         [Command.EXIT.value, 'Leave task an exit to top program level.']
     ]
+    collection.extend([plugin.name, plugin.help_text] for plugin in COMMANDS.plugins)
 
     output.empty_line()
     output.simple('Within the task, the following commands are available:')
     output.value_pair_list(collection)
 
 
-def answer_cycle(prompt: str,
-                 l_pr_question: Callable[[], None],
-                 answers: list[str],
-                 l_pr_answer: Callable[[], None],
-                 unit_data: dict[str, Any],
-                 ) -> TaskResult:
+def answer_cycle(subtask: 'SubtaskPlan', unit_data: dict[str, Any]) -> TaskResult:
     """Answer cycle"""
 
     while True:
         output.empty_line()
-        a_type, a_content = get_answer(prompt)
+        a_type, a_content = get_answer(subtask.prompt)
 
         match a_type:
             case InputType.ANSWER:
-                task_result = process_answer(a_content, answers, l_pr_answer)
+                task_result = process_answer(a_content, subtask.matcher, subtask.show_answer)
             case InputType.COMMAND:
-                task_result = process_command(a_content, answers, unit_data, l_pr_question)
+                task_result = process_command(a_content, subtask.answers, unit_data,
+                                              subtask.show_question, subtask.solution)
             case _:
                 error_msg: str = f'Unknown answer type: {a_type}'
                 logging.error(error_msg)
@@ -135,16 +139,20 @@ def answer_cycle(prompt: str,
 
 
 def process_answer(input_text: str,
-                   answers: list[str],
+                   matcher: AnswerMatcher,
                    l_pr_answer: Callable[[], None],
                    ) -> TaskResult:
     """Process an answer"""
 
-    if input_text not in answers:
-        output.warning('Incorrect, try again.')
-        return TaskResult.SUBTASK_WRONG_ANSWER
+    match matcher.match(input_text):
+        case MatchResult.EXACT:
+            output.simple('Correct!')
+        case MatchResult.CLOSE:
+            output.simple('Correct, but mind the spelling!')
+        case _:
+            output.warning('Incorrect, try again.')
+            return TaskResult.SUBTASK_WRONG_ANSWER
 
-    output.simple('Correct!')
     output.empty_line()
     l_pr_answer()
     user_input.wait_for_enter()
@@ -154,31 +162,28 @@ def process_answer(input_text: str,
 
 # pylint: disable=too-many-return-statements
 def process_command(input_text: str,
-                    answers: list[str],
+                    answers: tuple[str, ...] | list[str],
                     unit_data: dict[str, Any],
                     l_pr_question: Callable[[], None],
+                    solution: str | None = None,
                     ) -> TaskResult:
     """Process a command"""
 
-    command: Command = Command.EMPTY
-    if input_text in COMMAND_TEXTS:
-        command = COMMAND_TEXTS[input_text]
-    else:
-        for key, value in COMMAND_TEXTS.items():
-            try:
-                if key.index(input_text) == 0:
-                    command = value
-            except ValueError:
-                pass
-
-    match command:
+    input_elements: list[str] = input_text.split()
+    resolution: Resolution = COMMANDS.resolve(input_elements[0] if len(input_elements) > 0 else '')
+
+    if resolution.is_ambiguous:
+        output.warning(f'Ambiguous command: {input_text} ({", ".join(resolution.candidates)})')
+        return TaskResult.SUBTASK_RETRY
+
+    match resolution.command:
         case Command.WORDS:
             new_words.new_words(unit_data)
             output.empty_line()
             l_pr_question()
             return TaskResult.SUBTASK_RETRY
         case Command.SOLUTION:
-            output.simple('HINT: ' + ' / '.join([f'"{answer}"' for answer in answers]))
+            output.simple(solution if solution is not None else solution_text(answers))
             return TaskResult.SUBTASK_RETRY
         case Command.NEXT:
             return TaskResult.SUBTASK_SKIP_TO_NEXT
@@ -191,29 +196,221 @@ def process_command(input_text: str,
         case Command.HELP:
             help_cmd_in_task()
             return TaskResult.SUBTASK_RETRY
+        case PluginCommand():
+            resolution.command.handler(input_elements[1:])
+            return TaskResult.SUBTASK_RETRY
         case _:
             output.warning(f'Invalid command: {input_text}')
             return TaskResult.SUBTASK_RETRY
 
 
+# task plans --------------------------------------------------------- #
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SubtaskPlan:
+    """Ready-to-run item of a task"""
+
+    prompt: str
+    answers: tuple[str, ...]
+    matcher: AnswerMatcher
+    solution: str
+    show_question: Callable[[], None]
+    show_answer: Callable[[], None]
+
+
+@dataclasses.dataclass(slots=True)
+class TaskProgress:
+    """Position within a task, kept while its unit runs"""
+
+    subtask_index: int = 0
+    answered: set[int] = dataclasses.field(default_factory=set)
+    on_change: Callable[['TaskProgress'], None] | None = None
+
+    @property
+    def is_resumed(self) -> bool:
+        """Get whether the task continues past its first item"""
+        return self.subtask_index > 0 or len(self.answered) > 0
+
+    def move_to(self, subtask_index: int, answered_index: int | None = None) -> None:
+        """Record the current item, and an item answered before moving to it"""
+
+        self.subtask_index = subtask_index
+        if answered_index is not None:
+            self.answered.add(answered_index)
+
+        if self.on_change is not None:
+            self.on_change(self)
+
+
+def solution_text(answers: tuple[str, ...] | list[str]) -> str:
+    """Solution hint of a list of answers"""
+    return 'HINT: ' + ' / '.join([f'"{answer}"' for answer in answers])
+
+
+def task_plan(unit_data: dict[str, Any],
+              data_key: str,
+              build_fn: Callable[[dict[str, Any]], Any],
+              ) -> Any:
+    """Get the plan of a task, cached with the unit data when it supports it"""
+
+    cached_task_plan: Callable[[str, Callable[[dict[str, Any]], Any]], Any] | None = \
+        getattr(unit_data, 'task_plan', None)
+
+    if cached_task_plan is None:
+        return build_fn(unit_data)
+
+    return cached_task_plan(data_key, build_fn)
+
+
+def _first_subtask_index(subtask_count: int, progress: TaskProgress) -> int:
+    """Index of the item to resume a task at
+
+    A task left after its last item resumes at its first unanswered item,
+    or at its last item when all were answered.
+    """
+
+    if progress.subtask_index < subtask_count:
+        return progress.subtask_index
+
+    for index in range(subtask_count):
+        if index not in progress.answered:
+            return index
+
+    return max(0, subtask_count - 1)
+
+
+def run_subtasks(subtasks: tuple[SubtaskPlan, ...],
+                 unit_data: dict[str, Any],
+                 l_before_question: Callable[[], None],
+                 progress: TaskProgress | None = None,
+                 ) -> TaskResult:
+    """Run the answer cycles of planned items, from the progress of the task if given"""
+
+    if progress is None:
+        progress = TaskProgress()
+
+    first_index: int = _first_subtask_index(len(subtasks), progress)
+
+    for index in range(first_index, len(subtasks)):
+
+        # items answered before leaving the task are not asked again
+        if index != first_index and index in progress.answered:
+            continue
+
+        subtask: SubtaskPlan = subtasks[index]
+
+        progress.move_to(index)
+
+        l_before_question()
+        subtask.show_question()
+
+        task_result: TaskResult = answer_cycle(subtask, unit_data)
+        match task_result:
+            case TaskResult.SUBTASK_CORRECT_ANSWER:
+                progress.move_to(index + 1, index)
+                continue
+            case TaskResult.SUBTASK_SKIP_TO_NEXT:
+                progress.move_to(index + 1)
+                continue
+            case _:
+                return task_result
+
+    progress.move_to(len(subtasks))
+
+    return TaskResult.FINISHED
+
+
+def _show_pair(item_id: str, item_text: str, answer_id: str, answer_text: str) -> None:
+    """Display an item with its answer"""
+    output.numbered_sentence(item_id, item_text)
+    output.numbered_sentence(answer_id, answer_text)
+
+
+def pairing_subtasks(task_data: dict[str, Any], items_key: str) -> tuple[SubtaskPlan, ...]:
+    """Plan the items of a task pairing items with words"""
+
+    answer_ids: dict[str, str] = {}
+    for item_id, word_id in task_data['answers']:
+        answer_ids.setdefault(item_id, word_id)
+
+    word_texts: dict[str, str] = {}
+    for word in task_data['words']:
+        word_texts.setdefault(word['id'], word['text'])
+
+    subtasks: list[SubtaskPlan] = []
+
+    for item in task_data[items_key]:
+        try:
+            answer_id: str = answer_ids[item['id']]
+            answer_text: str = word_texts[answer_id]
+        except KeyError as exc:
+            raise IndexError(f'No answer for {items_key} item: {item["id"]}') from exc
+
+        answers: tuple[str, ...] = (answer_id, answer_text)
+
+        subtasks.append(SubtaskPlan(
+            prompt=f'{item["id"]}. ',
+            answers=answers,
+            matcher=_matcher.compile_matcher(answers),
+            solution=solution_text(answers),
+            show_question=functools.partial(output.numbered_sentence, item['id'], item['text']),
+            show_answer=functools.partial(_show_pair, item['id'], item['text'],
+                                          answer_id, answer_text),
+        ))
+
+    return tuple(subtasks)
+
+
+def answer_reference_errors(task_data: dict[str, Any], items_key: str) -> list[str]:
+    """Cross-check the answers of a task pairing items with words"""
+
+    errors: list[str] = []
+
+    id_lists: dict[str, list[Any]] = {
+        key: [item.get('id') for item in task_data.get(key, [])]
+        for key in (items_key, 'words')
+    }
+
+    for key, ids in id_lists.items():
+        if None in ids:
+            errors.append(f'{key}: item without id')
+        for item_id in sorted({item_id for item_id in ids if ids.count(item_id) > 1}, key=str):
+            errors.append(f'{key}: duplicate id "{item_id}"')
+
+    item_ids: set[Any] = set(id_lists[items_key])
+    word_ids: set[Any] = set(id_lists['words'])
+    answer_counts: dict[Any, int] = dict.fromkeys(item_ids, 0)
+
+    for item_id, word_id in task_data.get('answers', []):
+        if item_id not in item_ids:
+            errors.append(f'answers: unknown {items_key} id "{item_id}"')
+        else:
+            answer_counts[item_id] += 1
+        if word_id not in word_ids:
+            errors.append(f'answers: unknown words id "{word_id}"')
+
+    for item_id in id_lists[items_key]:
+        if item_id is not None and answer_counts[item_id] != 1:
+            errors.append(f'answers: {answer_counts[item_id]} answers for {items_key}'
+                          f' id "{item_id}", expected exactly 1')
+
+    return errors
+
+
 def validate_unit_data_on_task(
         data_validator: Draft202012Validator,
-) -> Callable[
-    [Callable[[dict[str, Any]], TaskResult]],
-    Callable[[dict[str, Any]], TaskResult]
-]:
+) -> Callable[[Callable[..., TaskResult]], Callable[..., TaskResult]]:
     """Decorator to run unit data validation on tasks"""
 
-    def parameter_wrapper(task: Callable[[dict[str, Any]], TaskResult]
-                          ) -> Callable[[dict[str, Any]], TaskResult]:
+    def parameter_wrapper(task: Callable[..., TaskResult]) -> Callable[..., TaskResult]:
         """Parameter wrapper"""
 
-        def function_wrapper(unit_data: dict[str, Any]) -> TaskResult:
+        def function_wrapper(unit_data: dict[str, Any], *args: Any) -> TaskResult:
             """Function wrapper"""
 
             match schema.validate_unit_data(data_validator, unit_data):
                 case ValidationResult.OK:
-                    return task(unit_data)
+                    return task(unit_data, *args)
                 case _:
                     return TaskResult.DATA_VALIDATION_FAILED
 
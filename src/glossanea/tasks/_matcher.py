@@ -0,0 +1,201 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Answer matching
+
+The answers of an item are normalised once into a set, so grading an
+attempt is a single lookup. An optional edit distance tolerance compares
+the attempt with each long enough answer, giving up as soon as the bound
+is exceeded.
+"""
+
+# imports: library
+import dataclasses
+import enum
+import unicodedata
+from typing import Any, Iterable
+
+# imports: project
+from glossanea.structure import config
+from glossanea.structure.exceptions import DataError
+
+
+class Punctuation(enum.Enum):
+    """Punctuation policy of answer matching"""
+
+    # punctuation must match
+    STRICT = 'strict'
+    # punctuation around the answer is ignored
+    EDGES = 'edges'
+    # all punctuation is ignored
+    IGNORE = 'ignore'
+
+
+class MatchResult(enum.Enum):
+    """Result of matching an attempt"""
+
+    NO_MATCH = enum.auto()
+    EXACT = enum.auto()
+    CLOSE = enum.auto()
+
+
+CONFIG_KEY_PUNCTUATION: str = 'answer_punctuation'
+CONFIG_KEY_TOLERANCE: str = 'answer_tolerance'
+
+DEFAULT_PUNCTUATION: Punctuation = Punctuation.EDGES
+DEFAULT_TOLERANCE: int = 0
+
+# answers shorter than this are only matched exactly, e.g. item ids
+FUZZY_MIN_LENGTH: int = 5
+
+TYPOGRAPHIC_CHARACTERS: dict[int, str] = str.maketrans({
+    '‘': "'", '’': "'", '‚': "'", '‛': "'", '′': "'", '´': "'",
+    '“': '"', '”': '"', '„': '"', '‟': '"', '″': '"',
+    '«': '"', '»': '"',
+    '‐': '-', '‑': '-', '‒': '-', '–': '-', '—': '-', '−': '-',
+})
+
+
+def _is_punctuation(character: str) -> bool:
+    """Get whether a character is punctuation"""
+    return unicodedata.category(character).startswith('P')
+
+
+def normalise(text: str, punctuation: Punctuation = DEFAULT_PUNCTUATION) -> str:
+    """Normalise an answer or an attempt for comparison"""
+
+    text = unicodedata.normalize('NFKC', text).translate(TYPOGRAPHIC_CHARACTERS).casefold()
+
+    match punctuation:
+        case Punctuation.IGNORE:
+            text = ''.join(' ' if _is_punctuation(character) else character for character in text)
+        case Punctuation.EDGES:
+            text = text.strip()
+            start: int = 0
+            end: int = len(text)
+            while start < end and _is_punctuation(text[start]):
+                start += 1
+            while end > start and _is_punctuation(text[end - 1]):
+                end -= 1
+            text = text[start:end]
+
+    return ' '.join(text.split())
+
+
+def within_distance(first: str, second: str, bound: int) -> bool:
+    """Get whether the edit distance of two texts is at most a bound
+
+    Only a band of 2 * bound + 1 cells per row is computed, and the
+    computation stops at the first row exceeding the bound.
+    """
+
+    if abs(len(first) - len(second)) > bound:
+        return False
+
+    if first == second:
+        return True
+
+    over: int = bound + 1
+
+    previous: list[int] = [column if column <= bound else over for column in range(len(first) + 1)]
+
+    for row in range(1, len(second) + 1):
+        current: list[int] = [over] * (len(first) + 1)
+        current[0] = row if row <= bound else over
+        row_min: int = current[0]
+        character: str = second[row - 1]
+
+        for column in range(max(1, row - bound), min(len(first), row + bound) + 1):
+            value: int = min(previous[column - 1] + (first[column - 1] != character),
+                             previous[column] + 1,
+                             current[column - 1] + 1,
+                             over)
+            current[column] = value
+            row_min = min(row_min, value)
+
+        if row_min > bound:
+            return False
+
+        previous = current
+
+    return previous[len(first)] <= bound
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class AnswerMatcher:
+    """Precompiled answers of an item"""
+
+    accepted: frozenset[str]
+    punctuation: Punctuation
+    tolerance: int
+    fuzzy_candidates: tuple[str, ...]
+
+    def match(self, attempt: str) -> MatchResult:
+        """Match an attempt against the answers"""
+
+        text: str = normalise(attempt, self.punctuation)
+
+        if text in self.accepted:
+            return MatchResult.EXACT
+
+        if len(text) >= FUZZY_MIN_LENGTH:
+            for candidate in self.fuzzy_candidates:
+                if within_distance(text, candidate, self.tolerance):
+                    return MatchResult.CLOSE
+
+        return MatchResult.NO_MATCH
+
+
+def _configured_punctuation() -> Punctuation:
+    """Punctuation policy from the config file"""
+
+    try:
+        return Punctuation(config.config().get(CONFIG_KEY_PUNCTUATION, DEFAULT_PUNCTUATION.value))
+    except ValueError:
+        return DEFAULT_PUNCTUATION
+
+
+def _configured_tolerance() -> int:
+    """Edit distance tolerance from the config file"""
+
+    tolerance: Any = config.config().get(CONFIG_KEY_TOLERANCE, DEFAULT_TOLERANCE)
+
+    if isinstance(tolerance, bool) or not isinstance(tolerance, int) or tolerance < 0:
+        return DEFAULT_TOLERANCE
+
+    return tolerance
+
+
+def compile_matcher(answers: Iterable[str],
+                    accept: Iterable[str] = (),
+                    punctuation: Punctuation | None = None,
+                    tolerance: int | None = None,
+                    ) -> AnswerMatcher:
+    """Compile the canonical answers and accepted variants of an item
+
+    The punctuation policy and tolerance default to the config file.
+    An answer left empty by normalisation, e.g. only punctuation with the
+    default policy, would accept an empty attempt, so it is a data error.
+    """
+
+    if punctuation is None:
+        punctuation = _configured_punctuation()
+
+    if tolerance is None:
+        tolerance = _configured_tolerance()
+
+    texts: list[str] = [*answers, *accept]
+    accepted: frozenset[str] = frozenset(normalise(text, punctuation) for text in texts)
+
+    if '' in accepted:
+        raise DataError(f'Answer is empty after normalisation with {punctuation.value} '
+                        f'punctuation: {texts}')
+
+    return AnswerMatcher(
+        accepted=accepted,
+        punctuation=punctuation,
+        tolerance=tolerance,
+        fuzzy_candidates=tuple(sorted(text for text in accepted if len(text) >= FUZZY_MIN_LENGTH))
+        if tolerance > 0 else (),
+    )
@@ -30,7 +30,8 @@ def task(unit_data: dict[str, Any]) -> TaskResult:
     parts: list[str] = unit_data[DATA_KEY]
 
     output.empty_line()
-    output.framed(parts, INTRO_TEXT_WIDTH_FRACTION)
+    output.unit_block(unit_data, DATA_KEY,
+                      lambda: output.framed(parts, INTRO_TEXT_WIDTH_FRACTION))
 
     user_input.wait_for_enter()
 
@@ -13,6 +13,9 @@ from glossanea.cli import user_input
 from glossanea.tasks._common import TaskResult
 from glossanea.tasks import t_1_new_words_common as new_words
 
+DATA_KEY: str = new_words.DATA_KEY
+DATA_VALIDATOR = new_words.DATA_VALIDATOR
+
 TITLE: str = 'new words'.upper()
 
 
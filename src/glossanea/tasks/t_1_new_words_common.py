@@ -59,7 +59,7 @@ def new_words_full(unit_data: dict[str, Any]) -> None:
     phonetic: list[str] = [item['phonetic'] for item in word_data]
 
     output.empty_line()
-    output.words_table(regular, phonetic)
+    output.unit_block(unit_data, f'{DATA_KEY}_full', lambda: output.words_table(regular, phonetic))
 
 
 def new_words(unit_data: dict[str, Any]) -> None:
@@ -77,7 +77,6 @@ def new_words(unit_data: dict[str, Any]) -> None:
 
     word_data: list[dict[str, str]] = unit_data[DATA_KEY]
 
-    regular: list[str] = [item['regular'] for item in word_data]
-
     output.empty_line()
-    output.words_table(regular)
+    output.unit_block(unit_data, DATA_KEY,
+                      lambda: output.words_table([item['regular'] for item in word_data]))
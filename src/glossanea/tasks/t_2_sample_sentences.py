@@ -5,6 +5,8 @@
 """Other new words"""
 
 # imports: library
+import dataclasses
+import functools
 from typing import Any
 
 # imports: dependencies
@@ -12,7 +14,11 @@ from jsonschema import Draft202012Validator
 
 # imports: project
 from glossanea.cli import output
-from glossanea.tasks._common import TaskResult, answer_cycle, validate_unit_data_on_task
+from glossanea.tasks import _common
+from glossanea.tasks import _matcher
+from glossanea.tasks._common import SubtaskPlan, TaskProgress, TaskResult
+from glossanea.tasks._common import validate_unit_data_on_task
+from glossanea.tasks._common import run_subtasks, solution_text
 from glossanea.tasks import t_1_new_words_common as new_words
 
 DATA_KEY: str = 'sample_sentences'
@@ -50,68 +56,87 @@ DATA_SCHEMA = {
 
 DATA_VALIDATOR = Draft202012Validator(DATA_SCHEMA)
 
+# the task resumes at the item it was left at
+RESUMABLE: bool = True
 
-@validate_unit_data_on_task(data_validator=DATA_VALIDATOR)
-def task(unit_data: dict[str, Any]) -> TaskResult:
-    """Display 'sample sentences' task"""
 
-    task_data: dict[str, Any] = unit_data[DATA_KEY]
-    new_words_extension: list[str] = unit_data[new_words.DATA_KEY_NEW_WORDS_EXTENSION]
+@dataclasses.dataclass(frozen=True, slots=True)
+class SampleSentencesPlan:
+    """Ready-to-run 'sample sentences' task"""
 
-    output.section_title(TITLE)
+    prompt: str
+    sentences: tuple[tuple[str, str], ...]
+    new_words_extension: tuple[str, ...]
+    subtasks: tuple[SubtaskPlan, ...]
 
-    output.empty_line()
-    output.simple(task_data['prompt'])
 
-    output.empty_line()
+def _full_answer(sentence: dict[str, str]) -> str:
+    """Sentence with its blank filled in"""
 
-    for sentence in task_data['sentences']:
-        output.numbered_sentence(sentence['id'],
-                                 sentence['beginning'] + output.BLANK + sentence['end'],
-                                 output.Formatting.INDENTED)
+    full_answer: str = sentence['answer']
+    if len(sentence['beginning']) > 0:
+        full_answer = f'{sentence["beginning"]} {full_answer}'
+    if len(sentence['end']) > 0:
+        if sentence['end'] not in ['.', '!', '?', '?!', '!?']:
+            full_answer += ' '
+        full_answer += sentence['end']
 
-    output.new_words_extension(new_words_extension)
+    return full_answer
 
-    output.empty_line()
 
-    for sentence in task_data['sentences']:
+def plan(unit_data: dict[str, Any]) -> SampleSentencesPlan:
+    """Build the plan of the task from its data"""
+
+    task_data: dict[str, Any] = unit_data[DATA_KEY]
+
+    sentences: tuple[tuple[str, str], ...] = tuple(
+        (sentence['id'], sentence['beginning'] + output.BLANK + sentence['end'])
+        for sentence in task_data['sentences']
+    )
+
+    return SampleSentencesPlan(
+        prompt=task_data['prompt'],
+        sentences=sentences,
+        new_words_extension=tuple(unit_data[new_words.DATA_KEY_NEW_WORDS_EXTENSION]),
+        subtasks=tuple(
+            SubtaskPlan(
+                prompt=f'{sentence["id"]}. ',
+                answers=(sentence['answer'],),
+                matcher=_matcher.compile_matcher((sentence['answer'],)),
+                solution=solution_text((sentence['answer'],)),
+                show_question=functools.partial(output.numbered_sentence, *question),
+                show_answer=functools.partial(output.simple, _full_answer(sentence)),
+            )
+            for sentence, question in zip(task_data['sentences'], sentences)
+        ),
+    )
 
-        prompt: str = f'{sentence["id"]}. '
 
-        def l_pr_question() -> None:
-            """l_pr_question"""
-            return output.numbered_sentence(sentence['id'],
-                                            sentence['beginning'] + output.BLANK + sentence['end'])
+@validate_unit_data_on_task(data_validator=DATA_VALIDATOR)
+def task(unit_data: dict[str, Any], progress: TaskProgress | None = None) -> TaskResult:
+    """Display 'sample sentences' task"""
+
+    task_plan: SampleSentencesPlan = _common.task_plan(unit_data, DATA_KEY, plan)
+
+    output.section_title(TITLE)
 
-        answers: list[str] = [sentence['answer']]
+    # a resumed task only repeats its title
+    if progress is None or not progress.is_resumed:
+        output.empty_line()
+        output.simple(task_plan.prompt)
 
-        full_answer: str = sentence['answer']
-        if len(sentence['beginning']) > 0:
-            full_answer = f'{sentence["beginning"]} {full_answer}'
-        if len(sentence['end']) > 0:
-            if sentence['end'] not in ['.', '!', '?', '?!', '!?']:
-                full_answer += ' '
-            full_answer += sentence['end']
+        output.empty_line()
 
-        def l_pr_answer() -> None:
-            """l_pr_answer"""
-            return output.simple(full_answer)
+        for sentence_id, sentence_text in task_plan.sentences:
+            output.numbered_sentence(sentence_id, sentence_text, output.Formatting.INDENTED)
 
-        # answer cycle
+        output.new_words_extension(task_plan.new_words_extension)
 
+    output.empty_line()
+
+    def l_before_question() -> None:
+        """l_before_question"""
         new_words.new_words(unit_data)
         output.empty_line()
-        l_pr_question()
-
-        task_result: TaskResult = answer_cycle(prompt,
-                                               l_pr_question,
-                                               answers,
-                                               l_pr_answer,
-                                               unit_data)
-        match task_result:
-            case TaskResult.SUBTASK_CORRECT_ANSWER | TaskResult.SUBTASK_SKIP_TO_NEXT:
-                continue
-            case _:
-                return task_result
-
-    return TaskResult.FINISHED
+
+    return run_subtasks(task_plan.subtasks, unit_data, l_before_question, progress)
@@ -5,6 +5,7 @@
 """Other new words"""
 
 # imports: library
+import dataclasses
 from typing import Any
 
 # imports: dependencies
@@ -13,8 +14,11 @@ from jsonschema import Draft202012Validator
 # imports: project
 from glossanea.cli import output
 from glossanea.cli.output import Formatting
-from glossanea.tasks._common import TaskResult, answer_cycle, validate_unit_data_on_task
-from glossanea.tasks import t_1_new_words_common as new_words
+from glossanea.structure import schema
+from glossanea.tasks import _common
+from glossanea.tasks._common import SubtaskPlan, TaskProgress, TaskResult
+from glossanea.tasks._common import validate_unit_data_on_task
+from glossanea.tasks._common import answer_reference_errors, pairing_subtasks, run_subtasks
 
 DATA_KEY: str = 'definitions'
 TITLE: str = 'definitions'.upper()
@@ -31,25 +35,13 @@ DATA_SCHEMA = {
                     "type": "array",
                     "minItems": 5,
                     "maxItems": 5,
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "text": {"type": "string"},
-                        },
-                    },
+                    "items": schema.SCHEMA_ID_TEXT,
                 },
                 "words": {
                     "type": "array",
                     "minItems": 5,
                     "maxItems": 5,
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "text": {"type": "string"},
-                        },
-                    },
+                    "items": schema.SCHEMA_ID_TEXT,
                 },
                 "answers": {
                     "type": "array",
@@ -69,73 +61,62 @@ DATA_SCHEMA = {
 
 DATA_VALIDATOR = Draft202012Validator(DATA_SCHEMA)
 
+# the task resumes at the item it was left at
+RESUMABLE: bool = True
+
+
+def semantic_errors(unit_data: dict[str, Any]) -> list[str]:
+    """Cross-checks the data schema can not express"""
+    return answer_reference_errors(unit_data[DATA_KEY], 'definitions')
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DefinitionsPlan:
+    """Ready-to-run 'definitions' task"""
+
+    prompt: str
+    definitions: tuple[tuple[str, str], ...]
+    word_ids: tuple[str, ...]
+    word_texts: tuple[str, ...]
+    subtasks: tuple[SubtaskPlan, ...]
+
+
+def plan(unit_data: dict[str, Any]) -> DefinitionsPlan:
+    """Build the plan of the task from its data"""
+
+    task_data: dict[str, Any] = unit_data[DATA_KEY]
+
+    return DefinitionsPlan(
+        prompt=task_data['prompt'],
+        definitions=tuple((definition['id'], definition['text'])
+                          for definition in task_data['definitions']),
+        word_ids=tuple(word['id'] for word in task_data['words']),
+        word_texts=tuple(word['text'] for word in task_data['words']),
+        subtasks=pairing_subtasks(task_data, 'definitions'),
+    )
+
 
 @validate_unit_data_on_task(data_validator=DATA_VALIDATOR)
-def task(unit_data: dict[str, Any]) -> TaskResult:
+def task(unit_data: dict[str, Any], progress: TaskProgress | None = None) -> TaskResult:
     """Display 'definitions' task"""
 
-    task_data: dict[str, Any] = unit_data[DATA_KEY]
-    data_for_new_words: list[dict[str, str]] = unit_data[new_words.DATA_KEY]
+    task_plan: DefinitionsPlan = _common.task_plan(unit_data, DATA_KEY, plan)
 
     output.section_title(TITLE)
 
-    output.empty_line()
-    output.simple(task_data['prompt'])
-
-    output.empty_line()
-    for definition in task_data['definitions']:
-        output.numbered_sentence(definition['id'], definition['text'], Formatting.INDENTED)
-
-    def l_words() -> None:
-        """l_words"""
-        output.words_table(
-            [word['id'] for word in task_data['words']],
-            [word['text'] for word in task_data['words']],
-        )
-
-    for definition in task_data['definitions']:
-
-        prompt: str = f'{definition["id"]}. '
-
-        def l_pr_question() -> None:
-            """l_pr_question"""
-            output.numbered_sentence(definition['id'], definition['text'])
-
-        answers: list[str] = []
-        answer_id: str = [
-            value
-            for (item_id, value) in task_data['answers']
-            if item_id == definition['id']
-        ][0]
-        answers.append(answer_id)
-        answer_text: str = [
-            item['text']
-            for item in task_data['words']
-            if item['id'] == answer_id
-        ][0]
-        answers.append(answer_text)
-
-        def l_pr_answer() -> None:
-            """l_pr_answer"""
-            l_pr_question()
-            output.numbered_sentence(answer_id, answer_text)
-
-        # answer cycle
+    # a resumed task only repeats its title
+    if progress is None or not progress.is_resumed:
+        output.empty_line()
+        output.simple(task_plan.prompt)
 
         output.empty_line()
-        l_words()
+        for definition_id, definition_text in task_plan.definitions:
+            output.numbered_sentence(definition_id, definition_text, Formatting.INDENTED)
+
+    def l_before_question() -> None:
+        """l_before_question"""
         output.empty_line()
-        l_pr_question()
-
-        task_result: TaskResult = answer_cycle(prompt,
-                                               l_pr_question,
-                                               answers,
-                                               l_pr_answer,
-                                               data_for_new_words)
-        match task_result:
-            case TaskResult.SUBTASK_CORRECT_ANSWER | TaskResult.SUBTASK_SKIP_TO_NEXT:
-                continue
-            case _:
-                return task_result
-
-    return TaskResult.FINISHED
+        output.words_table(task_plan.word_ids, task_plan.word_texts)
+        output.empty_line()
+
+    return run_subtasks(task_plan.subtasks, unit_data, l_before_question, progress)
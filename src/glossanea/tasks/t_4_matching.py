@@ -5,6 +5,7 @@
 """Other new words"""
 
 # imports: library
+import dataclasses
 from typing import Any
 
 # imports: dependencies
@@ -12,7 +13,11 @@ from jsonschema import Draft202012Validator
 
 # imports: project
 from glossanea.cli import output
-from glossanea.tasks._common import TaskResult, answer_cycle, validate_unit_data_on_task
+from glossanea.structure import schema
+from glossanea.tasks import _common
+from glossanea.tasks._common import SubtaskPlan, TaskProgress, TaskResult
+from glossanea.tasks._common import validate_unit_data_on_task
+from glossanea.tasks._common import answer_reference_errors, pairing_subtasks, run_subtasks
 
 DATA_KEY: str = 'matching'
 
@@ -27,25 +32,13 @@ DATA_SCHEMA = {
                 "prompt": {"type": "string"},
                 "sentences": {
                     "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "text": {"type": "string"},
-                        },
-                    },
+                    "items": schema.SCHEMA_ID_TEXT,
                     "minItems": 5,
                     "maxItems": 5,
                 },
                 "words": {
                     "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "string"},
-                            "text": {"type": "string"},
-                        },
-                    },
+                    "items": schema.SCHEMA_ID_TEXT,
                     "minItems": 5,
                     "maxItems": 5,
                 },
@@ -67,70 +60,62 @@ DATA_SCHEMA = {
 
 DATA_VALIDATOR = Draft202012Validator(DATA_SCHEMA)
 
+# the task resumes at the item it was left at
+RESUMABLE: bool = True
 
-@validate_unit_data_on_task(data_validator=DATA_VALIDATOR)
-def task(unit_data: dict[str, Any]) -> TaskResult:
-    """Display 'matching' task"""
 
-    task_data: dict[str, Any] = unit_data[DATA_KEY]
+def semantic_errors(unit_data: dict[str, Any]) -> list[str]:
+    """Cross-checks the data schema can not express"""
+    return answer_reference_errors(unit_data[DATA_KEY], 'sentences')
+
 
-    output.section_title(task_data['name'].upper())
+@dataclasses.dataclass(frozen=True, slots=True)
+class MatchingPlan:
+    """Ready-to-run 'matching' task"""
 
-    output.empty_line()
-    output.simple(task_data['prompt'])
+    title: str
+    prompt: str
+    sentences: tuple[tuple[str, str], ...]
+    words: tuple[tuple[str, str], ...]
+    subtasks: tuple[SubtaskPlan, ...]
 
-    output.empty_line()
-    for sentence in task_data['sentences']:
-        output.numbered_sentence(sentence['id'], sentence['text'], output.Formatting.INDENTED)
 
-    def l_words() -> None:
-        """l_words"""
-        for word in task_data['words']:
-            output.numbered_sentence(word['id'], word['text'], output.Formatting.INDENTED)
+def plan(unit_data: dict[str, Any]) -> MatchingPlan:
+    """Build the plan of the task from its data"""
 
-    for sentence in task_data['sentences']:
+    task_data: dict[str, Any] = unit_data[DATA_KEY]
+
+    return MatchingPlan(
+        title=task_data['name'].upper(),
+        prompt=task_data['prompt'],
+        sentences=tuple((sentence['id'], sentence['text']) for sentence in task_data['sentences']),
+        words=tuple((word['id'], word['text']) for word in task_data['words']),
+        subtasks=pairing_subtasks(task_data, 'sentences'),
+    )
 
-        prompt: str = f'{sentence["id"]}. '
 
-        def l_pr_question() -> None:
-            """l_pr_question"""
-            output.numbered_sentence(sentence['id'], sentence['text'])
+@validate_unit_data_on_task(data_validator=DATA_VALIDATOR)
+def task(unit_data: dict[str, Any], progress: TaskProgress | None = None) -> TaskResult:
+    """Display 'matching' task"""
+
+    task_plan: MatchingPlan = _common.task_plan(unit_data, DATA_KEY, plan)
 
-        answers: list[str] = []
-        answer_id: str = [
-            value
-            for (item_id, value) in task_data['answers']
-            if item_id == sentence['id']
-        ][0]
-        answers.append(answer_id)
-        answer_text: str = [
-            item['text']
-            for item in task_data['words']
-            if item['id'] == answer_id
-        ][0]
-        answers.append(answer_text)
+    output.section_title(task_plan.title)
 
-        def l_pr_answer() -> None:
-            """l_pr_answer"""
-            l_pr_question()
-            output.numbered_sentence(answer_id, answer_text)
+    # a resumed task only repeats its title
+    if progress is None or not progress.is_resumed:
+        output.empty_line()
+        output.simple(task_plan.prompt)
 
-        # answer cycle
+        output.empty_line()
+        for sentence_id, sentence_text in task_plan.sentences:
+            output.numbered_sentence(sentence_id, sentence_text, output.Formatting.INDENTED)
 
+    def l_before_question() -> None:
+        """l_before_question"""
         output.empty_line()
-        l_words()
+        for word_id, word_text in task_plan.words:
+            output.numbered_sentence(word_id, word_text, output.Formatting.INDENTED)
         output.empty_line()
-        l_pr_question()
-
-        task_result: TaskResult = answer_cycle(prompt,
-                                               l_pr_question,
-                                               answers,
-                                               l_pr_answer,
-                                               unit_data)
-        match task_result:
-            case TaskResult.SUBTASK_CORRECT_ANSWER | TaskResult.SUBTASK_SKIP_TO_NEXT:
-                continue
-            case _:
-                return task_result
-
-    return TaskResult.FINISHED
+
+    return run_subtasks(task_plan.subtasks, unit_data, l_before_question, progress)
@@ -12,6 +12,7 @@ from jsonschema import Draft202012Validator
 
 # imports: project
 from glossanea.cli import output
+from glossanea.cli import user_input
 from glossanea.tasks._common import TaskResult, validate_unit_data_on_task
 
 DATA_KEY: str = 'other_new_words'
@@ -45,7 +46,7 @@ def task(unit_data: dict[str, Any]) -> TaskResult:
     output.simple(task_data['prompt'])
 
     output.empty_line()
-    _ = input()
+    _ = user_input.read_line()
 
     output.empty_line()
 
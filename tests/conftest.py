@@ -0,0 +1,98 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Shared test fixtures"""
+
+# imports: library
+import json
+import os
+from typing import Any
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure import config
+from glossanea.version import REQUIRED_DATA_VERSION
+
+WORDS: tuple[str, ...] = ('apple', 'brave', 'candle', 'drift', 'eager')
+LETTERS: str = 'abcde'
+
+
+def make_day_unit() -> dict[str, Any]:
+    """Data of a day unit using every day task"""
+
+    return {
+        'version': REQUIRED_DATA_VERSION,
+        'title': 'Week 1 Day 1: apple',
+        'intro_text': ['Some intro text', ' centered ', 'More text'],
+        'new_words': [{'regular': word, 'phonetic': 'ˈ' + word, 'search': word}
+                      for word in WORDS],
+        'sample_sentences': {
+            'prompt': 'Fill in the blanks.',
+            'sentences': [{'id': str(index + 1), 'beginning': f'The {word} was',
+                           'answer': word, 'end': '.'}
+                          for index, word in enumerate(WORDS)],
+        },
+        'new_words_extension': [f'{word} - also {word}s' for word in WORDS[:2]],
+        'definitions': {
+            'prompt': 'Match definitions.',
+            'definitions': [{'id': str(index + 1), 'text': f'definition of {word}'}
+                            for index, word in enumerate(WORDS)],
+            'words': [{'id': letter, 'text': word} for letter, word in zip(LETTERS, WORDS)],
+            'answers': [[str(index + 1), letter] for index, letter in enumerate(LETTERS)],
+        },
+        'matching': {
+            'name': 'Matching',
+            'prompt': 'Match the halves.',
+            'sentences': [{'id': str(index + 1), 'text': f'first half {index}'}
+                          for index in range(len(LETTERS))],
+            'words': [{'id': letter, 'text': f'second half {index}'}
+                      for index, letter in enumerate(LETTERS)],
+            'answers': [[str(index + 1), letter] for index, letter in enumerate(LETTERS)],
+        },
+        'other_new_words': {'prompt': 'Write other new words.'},
+    }
+
+
+@pytest.fixture
+def day_unit() -> dict[str, Any]:
+    """Data of a day unit, decoded from JSON"""
+    return make_day_unit()
+
+
+def write_course(data_dir_path: str, title: str, day_count: int = 2) -> str:
+    """Write a one-week course of day units, with titles starting with a text"""
+
+    week_dir_path: str = os.path.join(data_dir_path, 'week_01')
+    os.makedirs(week_dir_path, exist_ok=True)
+
+    for day_number in range(1, day_count + 1):
+        unit_data: dict[str, Any] = make_day_unit()
+        unit_data['title'] = f'{title} Day {day_number}'
+        with open(os.path.join(week_dir_path, f'day_{day_number}.json'), 'w',
+                  encoding='UTF-8') as fh:
+            json.dump(unit_data, fh)
+
+    return data_dir_path
+
+
+@pytest.fixture
+def xdg_dirs(tmp_path, monkeypatch) -> None:
+    """Config, cache and state dirs under a temporary dir"""
+
+    for variable in ('XDG_CONFIG_HOME', 'XDG_CACHE_HOME', 'XDG_STATE_HOME'):
+        monkeypatch.setenv(variable, str(tmp_path / variable.lower()))
+
+
+@pytest.fixture
+def settings(xdg_dirs, monkeypatch) -> config.Settings:
+    """Fresh settings, with the config, cache and state dirs under a temporary dir"""
+
+    monkeypatch.delenv(config.ENV_DATA_DIR, raising=False)
+
+    fresh_settings: config.Settings = config.Settings()
+    monkeypatch.setattr(config, 'settings', fresh_settings)
+
+    return fresh_settings
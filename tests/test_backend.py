@@ -0,0 +1,102 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the output backend"""
+
+# imports: library
+from typing import Iterator
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.cli import backend
+from glossanea.cli import output
+from glossanea.cli import user_input
+from glossanea.structure.data import UnitData
+from glossanea.tasks import t_3_definitions
+from glossanea.tasks._common import TaskResult
+
+
+@pytest.fixture
+def sink() -> Iterator[backend.CaptureSink]:
+    """Capturing sink of scripted input, set for the test"""
+
+    capture_sink: backend.CaptureSink = backend.CaptureSink(['first', 'second'])
+    previous_sink: backend.Sink = backend.set_sink(capture_sink)
+
+    yield capture_sink
+
+    backend.set_sink(previous_sink)
+
+
+def test_frame_is_written_once_before_input(sink):
+    output.simple('one')
+    output.simple('two')
+    output.warning('three')
+
+    assert sink.write_count == 0
+
+    assert user_input.read_line('> ') == 'first'
+
+    assert sink.write_count == 1
+    assert sink.text.startswith('one')
+    assert sink.text.endswith('three\n> first\n')
+
+
+def test_empty_frame_is_not_written(sink):
+    output.flush()
+    assert user_input.read_line() == 'first'
+    output.flush()
+
+    assert sink.write_count == 0
+    assert sink.text == 'first\n'
+
+
+def test_pending_frame_goes_to_the_previous_sink(sink):
+    output.simple('pending')
+
+    other_sink: backend.CaptureSink = backend.CaptureSink()
+    assert backend.set_sink(other_sink) is sink
+    output.simple('other')
+    backend.set_sink(sink)
+
+    assert 'pending' in sink.text
+    assert 'other' in other_sink.text
+    assert 'other' not in sink.text
+
+
+@pytest.mark.parametrize('sink_class', [backend.CaptureSink, backend.NullSink])
+def test_scripted_input_runs_out(sink_class):
+    scripted_sink: backend.Sink = sink_class(['only'])
+
+    assert scripted_sink.read_line('') == 'only'
+    with pytest.raises(EOFError):
+        scripted_sink.read_line('')
+
+
+def test_task_writes_a_frame_per_input(day_unit):
+    input_lines: list[str] = ['a', '', 'b', '', 'c', '', 'd', '', 'e', '']
+    capture_sink: backend.CaptureSink = backend.CaptureSink(input_lines)
+
+    previous_sink: backend.Sink = backend.set_sink(capture_sink)
+    try:
+        task_result: TaskResult = t_3_definitions.task(UnitData(day_unit))
+        output.flush()
+    finally:
+        backend.set_sink(previous_sink)
+
+    assert task_result == TaskResult.FINISHED
+    assert capture_sink.write_count == len(input_lines)
+    assert capture_sink.text.count('Correct!') == 5
+
+
+def test_task_runs_on_null_sink(day_unit):
+    previous_sink: backend.Sink = backend.set_sink(backend.NullSink(['a', '', '/exit']))
+    try:
+        task_result: TaskResult = t_3_definitions.task(UnitData(day_unit))
+    finally:
+        backend.set_sink(previous_sink)
+
+    assert task_result == TaskResult.EXIT_TASK
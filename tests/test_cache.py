@@ -0,0 +1,207 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the persistent unit cache"""
+
+# pylint: disable=protected-access
+
+# imports: library
+import os
+import sys
+from typing import Any
+
+# imports: dependencies
+import libmonty_logging
+import libmonty_logging.message as logging_message
+import pytest
+
+# imports: project
+from glossanea import __main__ as glossanea_main
+from glossanea.cli import cli
+from glossanea.structure import cache
+from glossanea.structure import config
+from glossanea.structure import schema
+from glossanea.structure.unit import Unit
+
+from conftest import write_course
+
+UNIT_DATA: dict[str, Any] = {'title': 'Week 1 Day 1', 'new_words': ['apple', 'brave']}
+
+
+@pytest.fixture
+def data_file_path(tmp_path, xdg_dirs, monkeypatch) -> str:
+    """Data file in a temporary dir, with an enabled cache under a temporary dir"""
+
+    monkeypatch.setattr(cache, '_enabled', True)
+
+    file_path: str = str(tmp_path / 'day_1.json')
+    _write(file_path, '{"title": "Week 1 Day 1"}')
+
+    return file_path
+
+
+def _write(file_path: str, content: str, mtime_ns: int | None = None) -> None:
+    """Write a file, optionally with a given modification time"""
+
+    with open(file_path, 'w', encoding='UTF-8') as fh:
+        fh.write(content)
+
+    if mtime_ns is not None:
+        os.utime(file_path, ns=(mtime_ns, mtime_ns))
+
+
+def _entry_mtime_ns(file_path: str) -> int:
+    """Modification time of the cache entry of a data file"""
+    return os.stat(cache._entry_file_path(file_path)).st_mtime_ns
+
+
+def test_stored_data_is_loaded(data_file_path):
+    assert cache.load(data_file_path) is None
+
+    cache.store(data_file_path, UNIT_DATA)
+
+    assert cache.load(data_file_path) == (UNIT_DATA, None)
+
+
+def test_changed_size_is_a_miss(data_file_path):
+    mtime_ns: int = os.stat(data_file_path).st_mtime_ns
+    cache.store(data_file_path, UNIT_DATA)
+
+    _write(data_file_path, '{"title": "Week 1 Day 1", "extra": 1}', mtime_ns)
+
+    assert cache.load(data_file_path) is None
+
+
+def test_touched_file_with_same_content_is_a_hit(data_file_path):
+    cache.store(data_file_path, UNIT_DATA)
+    mtime_ns: int = os.stat(data_file_path).st_mtime_ns + 10**9
+    os.utime(data_file_path, ns=(mtime_ns, mtime_ns))
+
+    assert cache.load(data_file_path) == (UNIT_DATA, None)
+    # the entry now carries the new modification time
+    assert cache._read_entry(cache._entry_file_path(data_file_path))['mtime_ns'] == mtime_ns
+
+
+def test_changed_content_of_same_size_is_a_miss(data_file_path):
+    cache.store(data_file_path, UNIT_DATA)
+    mtime_ns: int = os.stat(data_file_path).st_mtime_ns + 10**9
+
+    _write(data_file_path, '{"title": "Week 1 Day 2"}', mtime_ns)
+
+    assert cache.load(data_file_path) is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, data_file_path, monkeypatch):
+    file_paths: list[str] = [data_file_path]
+    for day_number in (2, 3):
+        file_paths.append(str(tmp_path / f'day_{day_number}.json'))
+        _write(file_paths[-1], f'{{"day": {day_number}}}')
+
+    cache.store(file_paths[0], UNIT_DATA)
+    cache.store(file_paths[1], UNIT_DATA)
+
+    # the first entry is used last, so the second one is the oldest
+    for index, mtime_ns in enumerate((2 * 10**18, 10**18)):
+        os.utime(cache._entry_file_path(file_paths[index]), ns=(mtime_ns, mtime_ns))
+
+    monkeypatch.setattr(cache, 'SIZE_LIMIT', os.stat(cache._entry_file_path(file_paths[0])).st_size
+                        + os.stat(cache._entry_file_path(file_paths[1])).st_size)
+    cache.store(file_paths[2], UNIT_DATA)
+
+    assert cache.load(file_paths[0]) == (UNIT_DATA, None)
+    assert cache.load(file_paths[1]) is None
+    assert cache.load(file_paths[2]) == (UNIT_DATA, None)
+
+
+def test_stored_schema_fingerprint_is_loaded(data_file_path):
+    cache.store(data_file_path, UNIT_DATA, 'fingerprint')
+
+    assert cache.load(data_file_path) == (UNIT_DATA, 'fingerprint')
+
+
+def test_warm_load_skips_unit_level_validation(tmp_path, xdg_dirs, monkeypatch):
+    monkeypatch.setattr(cache, '_enabled', True)
+    data_dir_path: str = write_course(str(tmp_path / 'course'), 'Course', day_count=1)
+    monkeypatch.setattr(config, 'data_dir_path', lambda: data_dir_path)
+
+    assert Unit(1, 1).validation_token is not None
+
+    schema.reset_stats()
+    unit_obj: Unit = Unit(1, 1)
+
+    assert unit_obj.validation_token is not None
+    assert unit_obj.unit_data['title'] == 'Course Day 1'
+    assert schema.stats()['validations'] == 0
+
+
+def test_warm_load_under_another_schema_is_validated(tmp_path, xdg_dirs, monkeypatch):
+    monkeypatch.setattr(cache, '_enabled', True)
+    data_dir_path: str = write_course(str(tmp_path / 'course'), 'Course', day_count=1)
+    monkeypatch.setattr(config, 'data_dir_path', lambda: data_dir_path)
+
+    full_path: str = os.path.join(data_dir_path, 'week_01', 'day_1.json')
+    Unit(1, 1)
+    cache.store(full_path, cache.load(full_path)[0], 'fingerprint of another schema')
+
+    schema.reset_stats()
+
+    assert Unit(1, 1).validation_token is not None
+    assert schema.stats()['validations'] == 1
+
+
+def test_hit_marks_the_entry_as_recently_used(data_file_path):
+    cache.store(data_file_path, UNIT_DATA)
+    os.utime(cache._entry_file_path(data_file_path), ns=(10**18, 10**18))
+
+    cache.load(data_file_path)
+
+    assert _entry_mtime_ns(data_file_path) > 10**18
+
+
+def test_disabled_cache_neither_stores_nor_loads(data_file_path):
+    cache.store(data_file_path, UNIT_DATA)
+
+    cache.disable()
+
+    assert not cache.is_enabled()
+    assert cache.load(data_file_path) is None
+
+    os.remove(cache._entry_file_path(data_file_path))
+    cache.store(data_file_path, UNIT_DATA)
+    assert not os.path.exists(cache._entry_file_path(data_file_path))
+
+
+def test_no_cache_argument_disables_the_cache(monkeypatch):
+    monkeypatch.setattr(cache, '_enabled', True)
+    monkeypatch.setattr(sys, 'argv', ['glossanea', '--no-cache'])
+    monkeypatch.setattr(libmonty_logging, 'apply_default_file_only', lambda *_: None)
+    monkeypatch.setattr(logging_message, 'program_header', lambda *_: None)
+    monkeypatch.setattr(config, 'check_data_dir_path', lambda: None)
+
+    enabled_in_mainloop: list[bool] = []
+    monkeypatch.setattr(cli, 'mainloop', lambda: enabled_in_mainloop.append(cache.is_enabled()))
+
+    glossanea_main.main()
+
+    assert enabled_in_mainloop == [False]
+
+
+@pytest.mark.parametrize('content', [b'', b'not a pickle', b'\x80\x05\x95'])
+def test_corrupt_entry_is_a_miss_and_replaced(data_file_path, content):
+    cache.store(data_file_path, UNIT_DATA)
+    with open(cache._entry_file_path(data_file_path), 'wb') as fh:
+        fh.write(content)
+
+    assert cache.load(data_file_path) is None
+
+    cache.store(data_file_path, UNIT_DATA)
+    assert cache.load(data_file_path) == (UNIT_DATA, None)
+
+
+def test_entry_of_another_format_is_a_miss(data_file_path, monkeypatch):
+    cache.store(data_file_path, UNIT_DATA)
+
+    monkeypatch.setattr(cache, 'CACHE_FORMAT_VERSION', cache.CACHE_FORMAT_VERSION + 1)
+
+    assert cache.load(data_file_path) is None
@@ -0,0 +1,64 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of unit checkpoints"""
+
+# imports: library
+import builtins
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.cli import cli
+from glossanea.cli import cli_unit
+from glossanea.structure import checkpoint
+from glossanea.structure.checkpoint import Checkpoint
+from glossanea.structure.unit import Unit
+
+from conftest import write_course
+
+
+@pytest.fixture
+def course_unit(tmp_path, settings) -> Unit:
+    """First unit of a course in a temporary data folder"""
+
+    settings.set_data_dir_override(write_course(str(tmp_path / 'course'), 'Course'))
+
+    return Unit(1, 1)
+
+
+def _run_until_input(unit_obj: Unit, start_over: bool) -> None:
+    """Run a unit until it waits for input"""
+
+    with pytest.raises(EOFError):
+        cli_unit.run(unit_obj, start_over)
+
+
+def _no_input(_: str = '') -> str:
+    """Input of a closed terminal"""
+    raise EOFError
+
+
+def test_start_resumes_and_start_over_discards_checkpoint(course_unit, monkeypatch):
+    monkeypatch.setattr(builtins, 'input', _no_input)
+
+    task_count: int = len(course_unit.task_names)
+    checkpoint.save(1, 1, Checkpoint(task_count=task_count, task_index=3,
+                                     subtask_index=2, answered=frozenset({0, 1})))
+
+    _run_until_input(course_unit, start_over=False)
+    assert checkpoint.load(1, 1, task_count).task_index == 3
+
+    _run_until_input(course_unit, start_over=True)
+    assert checkpoint.load(1, 1, task_count) == Checkpoint(
+        task_count=task_count, task_index=0, subtask_index=0, answered=frozenset())
+
+
+def test_start_arguments():
+    assert not cli.is_start_over([])
+    assert cli.is_start_over([cli.START_OVER_ARGUMENT])
+
+    with pytest.raises(ValueError):
+        cli.is_start_over(['again'])
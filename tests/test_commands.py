@@ -0,0 +1,115 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the command registry"""
+
+# imports: library
+import enum
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.cli import cli
+from glossanea.cli.commands import CommandRegistry, PluginCommand, Resolution
+
+
+class Command(enum.Enum):
+    """Commands of the tests"""
+    START = 'start'
+    STOP = 'stop'
+    SOLUTION = 'solution'
+
+
+COMMAND_TEXTS: dict[str, Command] = {
+    'start': Command.START,
+    'begin': Command.START,  # alias
+    'stop': Command.STOP,
+    'solution': Command.SOLUTION,
+    'solve': Command.SOLUTION,  # alias
+    'soltuion': Command.SOLUTION,  # typo option
+}
+
+
+@pytest.fixture
+def registry() -> CommandRegistry:
+    """Registry of the test commands"""
+    return CommandRegistry(COMMAND_TEXTS)
+
+
+@pytest.mark.parametrize('text, command', [
+    ('start', Command.START),
+    ('begin', Command.START),
+    ('b', Command.START),
+    ('sta', Command.START),
+    ('sto', Command.STOP),
+    ('solve', Command.SOLUTION),
+    ('soltuion', Command.SOLUTION),
+    ('sol', Command.SOLUTION),
+])
+def test_texts_and_unambiguous_prefixes_resolve(registry, text, command):
+    assert registry.resolve(text).command == command
+
+
+def test_prefix_of_several_commands_is_ambiguous(registry):
+    resolution: Resolution = registry.resolve('st')
+
+    assert resolution.is_ambiguous
+    assert resolution.command is None
+    assert resolution.candidates == ('start', 'stop')
+
+    # aliases of one command are listed by the command name
+    assert registry.resolve('s').candidates == ('solution', 'start', 'stop')
+
+
+def test_unknown_text_is_not_ambiguous(registry):
+    for text in ('x', 'starts', 'stopx'):
+        resolution: Resolution = registry.resolve(text)
+        assert resolution.command is None
+        assert not resolution.is_ambiguous
+
+
+def test_prefix_resolves_to_the_command_name(registry):
+    assert registry.resolve('sol').candidates == ('solution',)
+    assert registry.resolve('b').candidates == ('begin',)
+
+
+def test_conflicting_texts_are_rejected(registry):
+    with pytest.raises(ValueError):
+        registry.add('stop', Command.START)
+
+    with pytest.raises(ValueError):
+        registry.add('', Command.START)
+
+    registry.add('stop', Command.STOP)
+    assert registry.resolve('stop').command == Command.STOP
+
+
+def test_plugin_commands(registry):
+    calls: list[list[str]] = []
+    plugin: PluginCommand = PluginCommand('stats', 'Show statistics.', calls.append)
+
+    registry.register_plugin(plugin, aliases=('numbers',))
+
+    assert registry.resolve('n').command is plugin
+    assert registry.resolve('stat').command is plugin
+    assert registry.resolve('st').candidates == ('start', 'stats', 'stop')
+    assert registry.plugins == (plugin,)
+
+    registry.resolve('stats').command.handler(['week'])
+    assert calls == [['week']]
+
+
+@pytest.mark.parametrize('text, command', [
+    ('begin', cli.Command.START),
+    ('s', cli.Command.START),
+    ('exit', cli.Command.EXIT),
+    ('q', cli.Command.EXIT),
+    ('goto', cli.Command.GOTO),
+    ('jump', cli.Command.GOTO),
+    ('ransom', cli.Command.RANDOM),
+    ('ra', cli.Command.RANDOM),
+])
+def test_cli_commands_resolve(text, command):
+    assert cli.COMMANDS.resolve(text).command == command
@@ -0,0 +1,177 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the settings and their reload"""
+
+# imports: library
+import os
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.cli import backend
+from glossanea.cli import cli
+from glossanea.structure import config
+from glossanea.structure import manifest
+from glossanea.structure import repository
+
+from conftest import write_course
+
+
+def _point_data_folder_file(settings, data_dir_path: str) -> None:
+    """Store a data dir in the data folder file, with a newer modification time"""
+
+    file_path: str = settings.data_folder_file_path
+    previous_mtime_ns: int = os.stat(file_path).st_mtime_ns if os.path.exists(file_path) else 0
+
+    with open(file_path, 'w', encoding='UTF-8') as fh:
+        fh.write(data_dir_path)
+
+    os.utime(file_path, ns=(previous_mtime_ns + 10**9, previous_mtime_ns + 10**9))
+
+
+def _data_dirs(tmp_path, *names: str) -> list[str]:
+    """Create empty data dirs under a temporary dir"""
+
+    dir_paths: list[str] = [str(tmp_path / name) for name in names]
+    for dir_path in dir_paths:
+        os.makedirs(dir_path)
+
+    return dir_paths
+
+
+@pytest.mark.parametrize('sources, resolved', [
+    (('override', 'env', 'file'), 'override'),
+    (('env', 'file'), 'env'),
+    (('file',), 'file'),
+])
+def test_data_dir_resolution_order(tmp_path, settings, monkeypatch, sources, resolved):
+    dir_paths: dict[str, str] = dict(zip(('override', 'env', 'file'),
+                                         _data_dirs(tmp_path, 'override', 'env', 'file')))
+
+    if 'override' in sources:
+        settings.set_data_dir_override(dir_paths['override'])
+    if 'env' in sources:
+        monkeypatch.setenv(config.ENV_DATA_DIR, dir_paths['env'])
+    if 'file' in sources:
+        _point_data_folder_file(settings, dir_paths['file'])
+
+    assert settings.data_dir_path == dir_paths[resolved]
+
+
+def test_env_data_dir_which_is_not_a_dir_is_ignored(tmp_path, settings, monkeypatch):
+    (file_dir_path,) = _data_dirs(tmp_path, 'file')
+    monkeypatch.setenv(config.ENV_DATA_DIR, str(tmp_path / 'missing'))
+    _point_data_folder_file(settings, file_dir_path)
+
+    assert settings.data_dir_path == file_dir_path
+
+
+def test_data_dir_is_asked_for_and_stored(tmp_path, settings):
+    (data_dir_path,) = _data_dirs(tmp_path, 'asked')
+    capture_sink: backend.CaptureSink = backend.CaptureSink([str(tmp_path / 'missing'),
+                                                             data_dir_path])
+
+    previous_sink: backend.Sink = backend.set_sink(capture_sink)
+    try:
+        assert settings.data_dir_path == data_dir_path
+    finally:
+        backend.set_sink(previous_sink)
+
+    assert capture_sink.text.count('location of the data directory') == 2
+    with open(settings.data_folder_file_path, 'r', encoding='UTF-8') as fh:
+        assert fh.read() == data_dir_path
+
+
+def test_data_folder_file_is_only_written_on_change(tmp_path, settings):
+    (data_dir_path,) = _data_dirs(tmp_path, 'file')
+    _point_data_folder_file(settings, data_dir_path)
+    mtime_ns: int = os.stat(settings.data_folder_file_path).st_mtime_ns
+
+    assert settings.data_dir_path == data_dir_path
+    assert os.stat(settings.data_folder_file_path).st_mtime_ns == mtime_ns
+
+
+def test_data_dir_reload(tmp_path, settings):
+    dir_path_a, dir_path_b = _data_dirs(tmp_path, 'a', 'b')
+
+    # nothing to reload before the data dir is resolved
+    assert not settings.reload_data_dir_if_changed()
+
+    _point_data_folder_file(settings, dir_path_a)
+    assert settings.data_dir_path == dir_path_a
+    assert not settings.reload_data_dir_if_changed()
+
+    # touched, but the same data dir
+    _point_data_folder_file(settings, dir_path_a)
+    assert not settings.reload_data_dir_if_changed()
+
+    _point_data_folder_file(settings, dir_path_b)
+    assert settings.reload_data_dir_if_changed()
+    assert settings.data_dir_path == dir_path_b
+
+
+def test_data_dir_override_is_not_reloaded(tmp_path, settings):
+    dir_path_a, dir_path_b = _data_dirs(tmp_path, 'a', 'b')
+
+    settings.set_data_dir_override(dir_path_a)
+    assert settings.data_dir_path == dir_path_a
+
+    _point_data_folder_file(settings, dir_path_b)
+    assert not settings.reload_data_dir_if_changed()
+    assert settings.data_dir_path == dir_path_a
+
+
+def test_config_reload(settings):
+    # nothing to reload before the config is loaded
+    assert not settings.reload_config_if_changed()
+
+    assert settings.config == config.default
+    assert not settings.reload_config_if_changed()
+
+    with open(settings.config_file_path, 'w', encoding='UTF-8') as fh:
+        fh.write('{"unit_cache_max_entries": 3}')
+    mtime_ns: int = os.stat(settings.config_file_path).st_mtime_ns + 10**9
+    os.utime(settings.config_file_path, ns=(mtime_ns, mtime_ns))
+
+    assert settings.reload_config_if_changed()
+    assert settings.config == {'unit_cache_max_entries': 3}
+
+
+def test_data_dir_change_starts_the_new_course(tmp_path, settings):
+    course_a: str = write_course(str(tmp_path / 'a'), 'Course A')
+    course_b: str = write_course(str(tmp_path / 'b'), 'Course B')
+
+    _point_data_folder_file(settings, course_a)
+    try:
+        unit_obj = repository.units.get(*manifest.current().first_unit(cli.SKIP_WEEKLY_REVIEWS))
+        cli.prefetch_likely_units(unit_obj)
+
+        _point_data_folder_file(settings, course_b)
+        unit_obj = cli.reload_settings(unit_obj)
+
+        assert unit_obj.unit_data['title'] == 'Course B Day 1'
+        assert cli.get_next_unit(unit_obj).unit_data['title'] == 'Course B Day 2'
+    finally:
+        repository.units.clear()
+        manifest.clear()
+
+
+def test_config_reload_applies_capacities(settings):
+    config_file_path: str = settings.config_file_path
+    repository.configure()
+
+    with open(config_file_path, 'w', encoding='UTF-8') as fh:
+        fh.write(f'{{"{repository.CONFIG_KEY_MAX_ENTRIES}": 3}}')
+    mtime_ns: int = os.stat(config_file_path).st_mtime_ns + 10**9
+    os.utime(config_file_path, ns=(mtime_ns, mtime_ns))
+
+    current_unit: object = object()
+
+    try:
+        assert cli.reload_settings(current_unit) is current_unit
+        assert repository.units._max_entries == 3  # pylint: disable=protected-access
+    finally:
+        repository.units.resize(repository.DEFAULT_MAX_ENTRIES, repository.DEFAULT_MAX_BYTES)
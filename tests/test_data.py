@@ -0,0 +1,126 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the unit data access"""
+
+# imports: library
+import functools
+import os
+import pickle
+from typing import Any
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure import pack
+from glossanea.structure import unit_schema
+from glossanea.structure.data import LazyUnitData
+from glossanea.structure.pack import PackReader
+
+from conftest import make_day_unit, write_course
+
+
+@pytest.fixture
+def loads() -> list[str]:
+    """Keys of the sections loaded by the lazy unit data"""
+    return []
+
+
+@pytest.fixture
+def lazy_unit(loads) -> LazyUnitData:
+    """Lazy unit data of a day unit, recording the sections it loads"""
+
+    unit_data: dict[str, Any] = make_day_unit()
+
+    def loader(key: str) -> Any:
+        loads.append(key)
+        return unit_data[key]
+
+    return LazyUnitData(list(unit_data), loader)
+
+
+def test_keys_are_known_without_decoding(lazy_unit, loads):
+    assert 'definitions' in lazy_unit
+    assert 'missing' not in lazy_unit
+    assert list(lazy_unit) == list(make_day_unit())
+    assert len(lazy_unit) == len(make_day_unit())
+    assert loads == []
+
+
+def test_sections_are_decoded_once_on_access(lazy_unit, loads):
+    assert lazy_unit['title'] == make_day_unit()['title']
+    assert lazy_unit.get('title') == make_day_unit()['title']
+
+    assert loads == ['title']
+    assert lazy_unit.is_decoded('title')
+    assert not lazy_unit.is_decoded('definitions')
+
+    assert lazy_unit.get('missing', 5) == 5
+    with pytest.raises(KeyError):
+        _ = lazy_unit['missing']
+
+
+def test_lazy_data_is_read_only(lazy_unit, loads):
+    for mutate in (lambda: lazy_unit.__delitem__('title'),
+                   lambda: lazy_unit.__setitem__('title', 'Other'),
+                   lambda: lazy_unit['definitions'].pop('prompt')):
+        with pytest.raises(TypeError):
+            mutate()
+
+    assert loads == ['definitions']
+
+
+def test_view_without_a_key_shares_decoded_sections(lazy_unit, loads):
+    definitions: Any = lazy_unit['definitions']
+    view: LazyUnitData = lazy_unit.without('version')
+
+    assert 'version' not in view
+    assert list(view) == [key for key in make_day_unit() if key != 'version']
+    assert view['definitions'] is definitions
+    assert loads == ['definitions']
+
+
+def test_lazy_data_pickles_as_a_plain_dict(lazy_unit):
+    unpickled: Any = pickle.loads(pickle.dumps(lazy_unit))
+
+    assert type(unpickled) is dict  # pylint: disable=unidiomatic-typecheck
+    assert unpickled == make_day_unit()
+
+
+def test_pack_sections_decode_to_the_data_file(tmp_path):
+    data_dir_path: str = write_course(str(tmp_path / 'course'), 'Lazy')
+    pack_path: str = os.path.join(data_dir_path, pack.PACK_FILE_NAME)
+    pack.build(data_dir_path, pack_path)
+
+    pack_reader: PackReader = PackReader(pack_path)
+    try:
+        lazy_unit: LazyUnitData = LazyUnitData(pack_reader.unit_keys(1, 2),
+                                               functools.partial(pack_reader.section, 1, 2))
+
+        assert dict(lazy_unit.items()) == make_day_unit() | {'title': 'Lazy Day 2'}
+    finally:
+        pack_reader.close()
+
+
+def test_section_failing_its_check_revokes_the_token(loads):
+    unit_data: dict[str, Any] = make_day_unit()
+    unit_data['matching']['sentences'] = 5
+
+    def loader(key: str) -> Any:
+        loads.append(key)
+        return unit_data[key]
+
+    lazy_unit: LazyUnitData = unit_schema.registry.attach(
+        unit_schema.UNIT_TYPE_DAY, LazyUnitData(list(unit_data), loader))
+
+    # the unit-level check leaves the task sections to their first access
+    assert lazy_unit.validation_token is not None
+    assert 'matching' not in loads
+
+    _ = lazy_unit['definitions']
+    assert lazy_unit.validation_token is not None
+
+    _ = lazy_unit['matching']
+    assert lazy_unit.validation_token is None
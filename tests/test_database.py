@@ -0,0 +1,176 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the SQLite course database"""
+
+# pylint: disable=protected-access
+
+# imports: library
+import functools
+import json
+import os
+import threading
+from typing import Any
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure import data
+from glossanea.structure import database
+from glossanea.structure.data import Backend, LazyUnitData
+from glossanea.structure.database import Database
+
+from conftest import WORDS, write_course
+
+
+@pytest.fixture
+def course_database(tmp_path) -> tuple[str, str]:
+    """A course folder with a database built from its data files"""
+
+    data_dir_path: str = write_course(str(tmp_path / 'course'), 'Stored')
+    database_path: str = os.path.join(data_dir_path, database.DATABASE_FILE_NAME)
+    database.build(data_dir_path, database_path)
+
+    return data_dir_path, database_path
+
+
+def _day_file_path(data_dir_path: str, day_number: int = 1) -> str:
+    """Path of a day unit"""
+    return os.path.join(data_dir_path, 'week_01', f'day_{day_number}.json')
+
+
+def test_database_round_trip(course_database):
+    data_dir_path, database_path = course_database
+
+    with open(_day_file_path(data_dir_path, 2), 'r', encoding='UTF-8') as fh:
+        unit_data: dict[str, Any] = json.load(fh)
+
+    course: Database = Database(database_path)
+    try:
+        assert course.units() == [(1, 1), (1, 2)]
+        assert course.unit(1, 2) == unit_data
+        assert course.unit_keys(1, 2) == list(unit_data)
+        assert course.changed_sources(data_dir_path) == []
+    finally:
+        course.close()
+
+
+def test_sections_decode_on_access(course_database, monkeypatch):
+    _, database_path = course_database
+
+    course: Database = Database(database_path)
+    decoded: list[str] = []
+    monkeypatch.setattr(course, '_decode',
+                        lambda text, *location: decoded.append(location[-1]) or json.loads(text))
+
+    try:
+        lazy_unit: LazyUnitData = LazyUnitData(course.unit_keys(1, 1),
+                                               functools.partial(course.section, 1, 1))
+
+        assert 'definitions' in lazy_unit
+        assert decoded == []
+
+        assert lazy_unit['title'] == 'Stored Day 1'
+        assert decoded == ['title']
+    finally:
+        course.close()
+
+
+def test_connections_are_pooled(course_database, monkeypatch):
+    _, database_path = course_database
+
+    course: Database = Database(database_path)
+    connect_count: list[int] = []
+    connect = course._connect
+    monkeypatch.setattr(course, '_connect', lambda: connect_count.append(1) or connect())
+
+    try:
+        for _ in range(10):
+            course.unit_keys(1, 1)
+        assert connect_count == []
+
+        barrier: threading.Barrier = threading.Barrier(database.MAX_POOLED_CONNECTIONS + 2)
+
+        def hold_connection() -> None:
+            with course._connection():
+                barrier.wait()
+
+        threads: list[threading.Thread] = [threading.Thread(target=hold_connection)
+                                           for _ in range(barrier.parties)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert course._pool.qsize() == database.MAX_POOLED_CONNECTIONS
+    finally:
+        course.close()
+
+    assert course._pool.qsize() == 0
+
+
+@pytest.mark.parametrize('first_week, last_week, words', [
+    (1, 1, WORDS * 2),
+    (2, 3, ()),
+    (0, 1, WORDS * 2),
+])
+def test_new_words_of_a_week_range(course_database, first_week, last_week, words):
+    _, database_path = course_database
+
+    course: Database = Database(database_path)
+    try:
+        new_words: list[dict[str, Any]] = course.new_words(first_week, last_week)
+    finally:
+        course.close()
+
+    assert tuple(item['regular'] for item in new_words) == words
+    assert [item['unit'] for item in new_words] == [1] * (len(words) // 2) + [2] * (len(words) // 2)
+
+
+def test_path_with_uri_characters_opens(tmp_path):
+    data_dir_path: str = write_course(str(tmp_path / 'course ?#%41'), 'Quoted')
+    database_path: str = os.path.join(data_dir_path, database.DATABASE_FILE_NAME)
+    database.build(data_dir_path, database_path)
+
+    course: Database = Database(database_path)
+    try:
+        assert course.unit(1, 1)['title'] == 'Quoted Day 1'
+    finally:
+        course.close()
+
+
+def test_edited_and_removed_data_files_are_reported(course_database):
+    data_dir_path, database_path = course_database
+
+    with open(_day_file_path(data_dir_path), 'a', encoding='UTF-8') as fh:
+        fh.write('\n')
+    os.remove(_day_file_path(data_dir_path, 2))
+
+    course: Database = Database(database_path)
+    try:
+        assert course.changed_sources(data_dir_path) == [
+            'Week 1 / Unit 2 (removed)',
+            os.path.join('week_01', 'day_1.json'),
+        ]
+    finally:
+        course.close()
+
+
+@pytest.mark.parametrize('backend, uses_database',
+                         [(Backend.AUTO, False), (Backend.SQLITE, True)])
+def test_out_of_date_database(course_database, monkeypatch, backend, uses_database):
+    data_dir_path, database_path = course_database
+
+    with open(_day_file_path(data_dir_path), 'a', encoding='UTF-8') as fh:
+        fh.write('\n')
+
+    monkeypatch.setattr(data, '_backend', backend)
+    course = data._open_current(data_dir_path, database_path, Database)
+
+    try:
+        assert isinstance(course, Database) == uses_database
+    finally:
+        if course is not None:
+            course.close()
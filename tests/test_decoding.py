@@ -0,0 +1,71 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of JSON decoding with each available backend"""
+
+# imports: library
+from typing import Iterator
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure import decoding
+
+
+@pytest.fixture(params=decoding.available())
+def backend_name(request) -> Iterator[str]:
+    """Each available backend in turn, selected for the test"""
+
+    selected: str = decoding.backend()
+    decoding.select(request.param)
+
+    yield request.param
+
+    decoding.select(selected)
+
+
+def test_stdlib_backend_is_always_available():
+    assert decoding.available()[-1] == decoding.BACKEND_STDLIB
+
+
+def test_backend_is_selected(backend_name):
+    assert decoding.backend() == backend_name
+
+
+def test_unknown_backend_is_not_selected():
+    selected: str = decoding.backend()
+
+    with pytest.raises(ValueError):
+        decoding.select('yaml')
+
+    assert decoding.backend() == selected
+
+
+@pytest.mark.parametrize('content', [
+    '{"title": "Week 1 Day 1", "words": ["apple", 1, null, true]}',
+    '{"title": "árvíztűrő ˈapple"}',
+])
+def test_bytes_and_text_decode_alike(backend_name, content):
+    assert decoding.loads(content) == decoding.loads(content.encode('UTF-8'))
+    assert decoding.loads(content)['title'].startswith(('Week', 'á'))
+
+
+@pytest.mark.parametrize('content', [
+    b'',
+    b'{"title": ',
+    b'{"title": "Week 1"} trailing',
+    b'{title: 1}',
+    b'{"title": "\xff"}',
+])
+def test_backend_errors_are_decode_errors(backend_name, content):
+    with pytest.raises(decoding.DecodeError):
+        decoding.loads(content)
+
+
+def test_file_is_decoded(backend_name, tmp_path):
+    file_path = tmp_path / 'day_1.json'
+    file_path.write_bytes(b'{"title": "Week 1 Day 1"}')
+
+    assert decoding.load_file(str(file_path)) == {'title': 'Week 1 Day 1'}
@@ -0,0 +1,53 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the display width of text"""
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.cli import display_width
+
+
+@pytest.mark.parametrize('text, width', [
+    ('', 0),
+    ('plain words', 11),
+    ('naïve café', 10),
+    ('cafe\u0301', 4),
+    ('日本語', 6),
+    ('ｆｕｌｌ', 8),
+    ('a\u200bb', 2),
+    ('co\u00adop', 5),
+    ('\u1100\u1161\u11a8', 2),
+    ('ˈæpl', 4),
+])
+def test_text_width(text, width):
+    assert display_width.text_width(text) == width
+
+
+def test_char_width_matches_text_width():
+    for character in 'a\u00e9\u0301\u65e5\u200b\u00ad':
+        assert display_width.char_width(character) == display_width.text_width(character)
+
+
+def test_equal_blocks_are_shared():
+    display_width.char_width('\u4e00')
+    display_width.char_width('\u4f00')
+
+    # pylint: disable-next=protected-access
+    blocks: list[bytes | None] = display_width._blocks
+
+    assert blocks[0x4e] is blocks[0x4f]
+
+
+@pytest.mark.parametrize('text, width, clipped', [
+    ('plain words', 5, 'plain'),
+    ('日本語', 3, '日'),
+    ('日本語', 4, '日本'),
+    ('cafe\u0301 noir', 4, 'cafe\u0301'),
+    ('short', 10, 'short'),
+])
+def test_clip(text, width, clipped):
+    assert display_width.clip(text, width) == clipped
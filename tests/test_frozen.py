@@ -0,0 +1,81 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the read-only unit data containers"""
+
+# imports: library
+import copy
+import json
+import pickle
+from typing import Any, Callable
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure.frozen import FrozenDict, FrozenList, freeze
+
+from conftest import make_day_unit
+
+
+@pytest.mark.parametrize('mutate', [
+    lambda frozen: frozen.__setitem__('title', 'Other'),
+    lambda frozen: frozen.__delitem__('title'),
+    lambda frozen: frozen.__ior__({'title': 'Other'}),
+    lambda frozen: frozen.clear(),
+    lambda frozen: frozen.pop('title'),
+    lambda frozen: frozen.popitem(),
+    lambda frozen: frozen.setdefault('other', 1),
+    lambda frozen: frozen.update(title='Other'),
+    lambda frozen: frozen['new_words'].__setitem__(0, None),
+    lambda frozen: frozen['new_words'].__delitem__(0),
+    lambda frozen: frozen['new_words'].__iadd__([None]),
+    lambda frozen: frozen['new_words'].__imul__(2),
+    lambda frozen: frozen['new_words'].append(None),
+    lambda frozen: frozen['new_words'].extend([None]),
+    lambda frozen: frozen['new_words'].insert(0, None),
+    lambda frozen: frozen['new_words'].pop(),
+    lambda frozen: frozen['new_words'].remove(frozen['new_words'][0]),
+    lambda frozen: frozen['new_words'].reverse(),
+    lambda frozen: frozen['new_words'].sort(),
+    lambda frozen: frozen['new_words'].clear(),
+    lambda frozen: frozen['new_words'][0].__setitem__('regular', 'other'),
+])
+def test_mutation_raises(mutate: Callable[[FrozenDict], Any]):
+    frozen: FrozenDict = freeze(make_day_unit())
+
+    with pytest.raises(TypeError):
+        mutate(frozen)
+
+    assert frozen == make_day_unit()
+
+
+def test_freeze_converts_nested_containers():
+    frozen: FrozenDict = freeze(make_day_unit())
+
+    assert isinstance(frozen['definitions'], FrozenDict)
+    assert isinstance(frozen['definitions']['answers'], FrozenList)
+    assert isinstance(frozen['definitions']['answers'][0], FrozenList)
+    assert freeze(frozen) is frozen
+    assert json.loads(json.dumps(frozen)) == make_day_unit()
+
+
+def test_copies_are_the_same_object():
+    frozen: FrozenDict = freeze(make_day_unit())
+
+    assert copy.copy(frozen) is frozen
+    assert copy.deepcopy(frozen) is frozen
+    assert copy.deepcopy(frozen['new_words']) is frozen['new_words']
+
+
+def test_pickle_round_trip_keeps_containers_read_only():
+    unpickled: Any = pickle.loads(pickle.dumps(freeze(make_day_unit())))
+
+    assert unpickled == make_day_unit()
+    assert isinstance(unpickled, FrozenDict)
+    assert isinstance(unpickled['new_words'], FrozenList)
+    assert isinstance(unpickled['new_words'][0], FrozenDict)
+
+    with pytest.raises(TypeError):
+        unpickled['new_words'].append(None)
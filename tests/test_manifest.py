@@ -0,0 +1,106 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the course manifest"""
+
+# imports: library
+import random
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure import manifest
+from glossanea.structure.exceptions import DataError
+from glossanea.structure.manifest import Manifest, ManifestEntry
+
+from conftest import write_course
+
+
+def _manifest(*keys: tuple[int, int]) -> Manifest:
+    """Manifest of units given by (week number, unit number)"""
+
+    return Manifest([
+        ManifestEntry(week_number=week_number, unit_number=unit_number,
+                      task_names=('title',), size=1, content_hash='')
+        for week_number, unit_number in keys
+    ])
+
+
+@pytest.fixture
+def two_weeks() -> Manifest:
+    """Manifest of two weeks, the first one with a Weekly Review, given out of order"""
+    return _manifest((2, 1), (1, 0), (1, 2), (1, 1), (2, 2))
+
+
+def test_units_are_in_course_order(two_weeks):
+    assert [entry.key for entry in two_weeks.entries()] == [(1, 1), (1, 2), (1, 0), (2, 1), (2, 2)]
+
+
+def test_contains(two_weeks):
+    assert (1, 0) in two_weeks
+    assert (2, 2) in two_weeks
+    assert (1, 3) not in two_weeks
+    assert (3, 1) not in two_weeks
+
+
+def test_first_unit(two_weeks):
+    assert two_weeks.first_unit() == (1, 1)
+    assert _manifest((1, 0), (2, 1)).first_unit() == (1, 0)
+    assert _manifest((1, 0), (2, 1)).first_unit(skip_weekly_reviews=True) == (2, 1)
+
+    with pytest.raises(DataError):
+        _manifest((1, 0)).first_unit(skip_weekly_reviews=True)
+
+
+def test_next_unit(two_weeks):
+    assert two_weeks.next_unit(1, 2) == (1, 0)
+    assert two_weeks.next_unit(1, 2, skip_weekly_reviews=True) == (2, 1)
+    assert two_weeks.next_unit(1, 0) == (2, 1)
+    assert two_weeks.next_unit(2, 2) is None
+
+    with pytest.raises(ValueError):
+        two_weeks.next_unit(3, 1)
+
+
+@pytest.mark.parametrize('unit_type, skip_weekly_reviews, candidates', [
+    ('', False, {(1, 1), (1, 2), (1, 0), (2, 1), (2, 2)}),
+    ('', True, {(1, 1), (1, 2), (2, 1), (2, 2)}),
+    ('day', False, {(1, 1), (1, 2), (2, 1), (2, 2)}),
+    ('WR', False, {(1, 0)}),
+])
+def test_random_unit_picks_from_its_type(two_weeks, unit_type, skip_weekly_reviews, candidates):
+    random.seed(0)
+
+    picked: set[tuple[int, int]] = {two_weeks.random_unit(unit_type, skip_weekly_reviews)
+                                    for _ in range(100)}
+
+    assert picked == candidates
+
+
+def test_random_unit_of_a_missing_or_unknown_type():
+    with pytest.raises(ValueError, match='No units of type'):
+        _manifest((1, 1)).random_unit('WR')
+
+    with pytest.raises(ValueError, match='Incorrect unit type'):
+        _manifest((1, 1)).random_unit('week')
+
+
+def test_empty_manifest_is_an_error():
+    with pytest.raises(DataError):
+        Manifest([])
+
+
+def test_build_from_files_lists_task_names(tmp_path, xdg_dirs):
+    data_dir_path: str = write_course(str(tmp_path / 'course'), 'Listed')
+
+    for _ in range(2):
+        # the second build reads the cached records
+        course: Manifest = manifest._build_from_files(  # pylint: disable=protected-access
+            data_dir_path)
+
+        assert [entry.key for entry in course.entries()] == [(1, 1), (1, 2)]
+        assert 'version' not in course.entry(1, 1).task_names
+        assert 'new_words_extension' not in course.entry(1, 1).task_names
+        assert 'definitions' in course.entry(1, 1).task_names
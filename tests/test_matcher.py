@@ -0,0 +1,86 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of answer matching"""
+
+# imports: library
+import random
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure import config
+from glossanea.structure.exceptions import DataError
+from glossanea.tasks import _matcher
+from glossanea.tasks._matcher import MatchResult, Punctuation
+
+
+def _levenshtein(first: str, second: str) -> int:
+    """Edit distance of two texts, computed in full"""
+
+    previous: list[int] = list(range(len(first) + 1))
+
+    for row, character in enumerate(second, start=1):
+        current: list[int] = [row]
+        for column, other in enumerate(first, start=1):
+            current.append(min(previous[column - 1] + (other != character),
+                               previous[column] + 1,
+                               current[column - 1] + 1))
+        previous = current
+
+    return previous[-1]
+
+
+def test_within_distance_matches_levenshtein():
+    rng: random.Random = random.Random(1)
+
+    for _ in range(3000):
+        first: str = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 8)))
+        second: str = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 8)))
+        bound: int = rng.randint(0, 4)
+
+        assert _matcher.within_distance(first, second, bound) \
+            == (_levenshtein(first, second) <= bound), (first, second, bound)
+
+
+def test_close_attempt():
+    matcher: _matcher.AnswerMatcher = _matcher.compile_matcher(
+        ['necessary'], accept=['needs'], punctuation=Punctuation.EDGES, tolerance=1)
+
+    assert matcher.match('  Necessary! ') == MatchResult.EXACT
+    assert matcher.match('neccessary') == MatchResult.CLOSE
+    assert matcher.match('neccesary') == MatchResult.NO_MATCH
+    assert matcher.match('neede') == MatchResult.CLOSE
+    # attempts shorter than FUZZY_MIN_LENGTH are only matched exactly
+    assert matcher.match('need') == MatchResult.NO_MATCH
+
+
+@pytest.mark.parametrize('tolerance, expected', [
+    (2, 2),
+    (True, _matcher.DEFAULT_TOLERANCE),
+    (-1, _matcher.DEFAULT_TOLERANCE),
+    ('1', _matcher.DEFAULT_TOLERANCE),
+])
+def test_configured_tolerance(monkeypatch, tolerance, expected):
+    monkeypatch.setattr(config, 'config', lambda: {_matcher.CONFIG_KEY_TOLERANCE: tolerance})
+
+    assert _matcher.compile_matcher(['answer'], punctuation=Punctuation.EDGES).tolerance == expected
+
+
+@pytest.mark.parametrize('punctuation', [Punctuation.EDGES, Punctuation.IGNORE])
+def test_answer_empty_after_normalisation_is_rejected(punctuation):
+    with pytest.raises(DataError):
+        _matcher.compile_matcher(['...'], punctuation=punctuation, tolerance=0)
+
+    with pytest.raises(DataError):
+        _matcher.compile_matcher(['answer'], accept=[' - '], punctuation=punctuation, tolerance=0)
+
+
+def test_punctuation_answer_is_kept_with_strict_punctuation():
+    matcher: _matcher.AnswerMatcher = _matcher.compile_matcher(
+        ['...'], punctuation=Punctuation.STRICT, tolerance=0)
+
+    assert matcher.match('...') == MatchResult.EXACT
+    assert matcher.match('') == MatchResult.NO_MATCH
@@ -0,0 +1,44 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the compact course model"""
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure import model
+from glossanea.structure.exceptions import DataError
+
+
+def test_unit_record(day_unit):
+    record: model.UnitRecord = model.load_unit(1, 1, day_unit)
+
+    assert record.title == day_unit['title']
+    assert record.sample_sentences.sentences[0].answer == 'apple'
+    assert [task.name for task in record.pairing_tasks] == ['', 'Matching']
+    assert record.pairing_tasks[0].answers[0] == ('1', 'a')
+
+
+@pytest.mark.parametrize('section, field', [
+    ('sample_sentences', 'prompt'),
+    ('definitions', 'prompt'),
+])
+def test_missing_required_field_is_a_data_error(day_unit, section, field):
+    del day_unit[section][field]
+
+    with pytest.raises(DataError, match=field):
+        model.load_unit(1, 1, day_unit)
+
+
+def test_missing_item_field_is_a_data_error(day_unit):
+    del day_unit['sample_sentences']['sentences'][2]['answer']
+
+    with pytest.raises(DataError, match='answer'):
+        model.load_unit(1, 1, day_unit)
+
+    day_unit['sample_sentences']['sentences'][2]['answer'] = None
+
+    with pytest.raises(DataError, match='answer'):
+        model.load_unit(1, 1, day_unit)
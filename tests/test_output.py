@@ -0,0 +1,130 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the output functions"""
+
+# pylint: disable=protected-access
+
+# imports: library
+import random
+from typing import Any
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.cli import backend
+from glossanea.cli import output
+from glossanea.cli.display_width import text_width
+from glossanea.structure.data import UnitData
+
+WORDS: tuple[str, ...] = ('a', 'bb', 'ccc', '', 'longerword', 'x' * 9, 'dd.')
+LINE_STARTS_FIRST: tuple[str, ...] = ('', '1.', '12.', '  ')
+LINE_STARTS_ALL: tuple[str, ...] = ('', '  | ', '>')
+
+
+def _reference_block_lines(text: str,
+                           width: int,
+                           line_start_first: str,
+                           line_start_all: str,
+                           ) -> list[str]:
+    """Block lines as wrapped word by word before wrapping was memoised"""
+
+    lines: list[str] = []
+
+    line_build: str = output._init_line(line_start_first, line_start_all)
+    line_start_length: int = len(line_build)
+
+    words: list[str] = text.split(' ')
+
+    while True:
+
+        if len(words) != 0:
+            if len(line_build + ' ' + words[0]) <= width:
+
+                if len(line_build) > line_start_length:
+                    line_build += ' '
+
+                line_build += words.pop(0)
+                continue
+
+        lines.append(line_build.ljust(width, ' '))
+
+        line_build = output._init_line(' ' * len(line_start_first), line_start_all)
+
+        if len(words) == 0:
+            break
+
+    return lines
+
+
+def _show_blocks(unit_data: Any, draw_count: list[int]) -> str:
+    """Show a unit block twice, return the output"""
+
+    def draw() -> None:
+        draw_count.append(1)
+        output.simple('block text')
+
+    sink: backend.CaptureSink = backend.CaptureSink()
+    previous_sink: backend.Sink = backend.set_sink(sink)
+    try:
+        output.unit_block(unit_data, 'block', draw)
+        output.unit_block(unit_data, 'block', draw)
+        output.flush()
+    finally:
+        backend.set_sink(previous_sink)
+
+    return sink.text
+
+
+def test_unit_block_is_rendered_once_per_unit(day_unit):
+    unit_data: UnitData = UnitData(day_unit)
+    draw_count: list[int] = []
+
+    text: str = _show_blocks(unit_data, draw_count)
+
+    assert len(draw_count) == 1
+    assert text.count('block text') == 2
+    assert unit_data.task_plan('block', lambda _: 'plan') == 'plan'
+
+
+def test_unit_block_of_plain_data_is_drawn_every_time(day_unit):
+    draw_count: list[int] = []
+
+    text: str = _show_blocks(day_unit, draw_count)
+
+    assert len(draw_count) == 2
+    assert text.count('block text') == 2
+
+
+def test_block_lines_match_reference_wrapping():
+    rng: random.Random = random.Random(1)
+    compared: int = 0
+
+    while compared < 2000:
+        width: int = rng.randint(8, 40)
+        line_start_first: str = rng.choice(LINE_STARTS_FIRST)
+        line_start_all: str = rng.choice(LINE_STARTS_ALL)
+        text: str = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 12)))
+
+        # the reference wrapping never ends with a word too long for a line
+        start_length: int = len(output._init_line(line_start_first, line_start_all))
+        if any(start_length + 1 + len(word) > width for word in text.split(' ')):
+            continue
+
+        assert list(output._block_lines(text, width, line_start_first, line_start_all)) \
+            == _reference_block_lines(text, width, line_start_first, line_start_all), \
+            (text, width, line_start_first, line_start_all)
+        compared += 1
+
+
+@pytest.mark.parametrize('text', [
+    '日本語の文 と 短い 語 ' * 6,
+    'cafe\u0301 nai\u0308ve re\u0301sume\u0301 ' * 8,
+])
+def test_block_lines_are_padded_to_display_width(text):
+    lines: tuple[str, ...] = output._block_lines(text.strip(), 30, '1.')
+
+    assert len(lines) > 1
+    assert all(text_width(line) == 30 for line in lines)
@@ -0,0 +1,126 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the course pack"""
+
+# imports: library
+import json
+import os
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure import data
+from glossanea.structure import pack
+from glossanea.structure.data import Backend
+from glossanea.structure.exceptions import DataError
+from glossanea.structure.pack import PackReader
+
+from conftest import write_course
+
+
+@pytest.fixture
+def packed_course(tmp_path) -> tuple[str, str]:
+    """A course folder with a pack built from its data files"""
+
+    data_dir_path: str = write_course(str(tmp_path / 'course'), 'Packed')
+    pack_path: str = os.path.join(data_dir_path, pack.PACK_FILE_NAME)
+    pack.build(data_dir_path, pack_path)
+
+    return data_dir_path, pack_path
+
+
+def _day_file_path(data_dir_path: str) -> str:
+    """Path of the first day unit"""
+    return os.path.join(data_dir_path, 'week_01', 'day_1.json')
+
+
+def test_pack_round_trip(packed_course):
+    data_dir_path, pack_path = packed_course
+
+    with open(_day_file_path(data_dir_path), 'r', encoding='UTF-8') as fh:
+        unit_data = json.load(fh)
+
+    pack_reader: PackReader = PackReader(pack_path)
+    try:
+        assert pack_reader.unit(1, 1) == unit_data
+        assert pack_reader.unit_keys(1, 1) == list(unit_data)
+        assert pack_reader.changed_sources(data_dir_path) == []
+    finally:
+        pack_reader.close()
+
+
+def test_touched_data_file_keeps_pack_current(packed_course):
+    data_dir_path, pack_path = packed_course
+    os.utime(_day_file_path(data_dir_path), ns=(10**9, 10**9))
+
+    pack_reader: PackReader = PackReader(pack_path)
+    try:
+        assert pack_reader.changed_sources(data_dir_path) == []
+    finally:
+        pack_reader.close()
+
+
+def test_edited_and_removed_data_files_are_reported(packed_course):
+    data_dir_path, pack_path = packed_course
+
+    with open(_day_file_path(data_dir_path), 'a', encoding='UTF-8') as fh:
+        fh.write('\n')
+    os.remove(os.path.join(data_dir_path, 'week_01', 'day_2.json'))
+
+    pack_reader: PackReader = PackReader(pack_path)
+    try:
+        assert pack_reader.changed_sources(data_dir_path) == [
+            'Week 1 / Unit 2 (removed)',
+            os.path.join('week_01', 'day_1.json'),
+        ]
+    finally:
+        pack_reader.close()
+
+
+def test_pack_without_data_files_is_current(packed_course):
+    data_dir_path, pack_path = packed_course
+
+    for unit_number in (1, 2):
+        os.remove(os.path.join(data_dir_path, 'week_01', f'day_{unit_number}.json'))
+
+    pack_reader: PackReader = PackReader(pack_path)
+    try:
+        assert pack_reader.changed_sources(data_dir_path) == []
+    finally:
+        pack_reader.close()
+
+
+def test_sources_past_the_end_are_corrupt(packed_course):
+    _, pack_path = packed_course
+
+    with open(pack_path, 'rb') as fh:
+        content: bytes = fh.read()
+
+    magic, format_version, entry_count, index_size, _ = pack.HEADER.unpack_from(content)
+    with open(pack_path, 'wb') as fh:
+        fh.write(pack.HEADER.pack(magic, format_version, entry_count, index_size, 10**6))
+        fh.write(content[pack.HEADER.size:])
+
+    with pytest.raises(DataError, match='Corrupt course pack sources'):
+        PackReader(pack_path)
+
+
+@pytest.mark.parametrize('backend, uses_pack', [(Backend.AUTO, False), (Backend.PACK, True)])
+def test_out_of_date_pack(packed_course, monkeypatch, backend, uses_pack):
+    data_dir_path, pack_path = packed_course
+
+    with open(_day_file_path(data_dir_path), 'a', encoding='UTF-8') as fh:
+        fh.write('\n')
+
+    monkeypatch.setattr(data, '_backend', backend)
+    pack_reader = data._open_current(  # pylint: disable=protected-access
+        data_dir_path, pack_path, PackReader)
+
+    try:
+        assert isinstance(pack_reader, PackReader) == uses_pack
+    finally:
+        if pack_reader is not None:
+            pack_reader.close()
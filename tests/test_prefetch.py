@@ -0,0 +1,77 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the background unit prefetch"""
+
+# imports: library
+import threading
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure.prefetch import Prefetcher
+
+
+@pytest.fixture
+def release() -> threading.Event:
+    """Event that lets the test loader finish"""
+    return threading.Event()
+
+
+@pytest.fixture
+def prefetcher(release):
+    """Prefetcher of unit keys, each loaded once the release event is set"""
+
+    def loader(week_number: int, unit_number: int) -> tuple[int, int]:
+        release.wait(5)
+        if unit_number < 0:
+            raise ValueError('no such unit')
+        return week_number, unit_number
+
+    prefetcher_obj: Prefetcher = Prefetcher(loader, max_pending=2)
+    yield prefetcher_obj
+    release.set()
+    prefetcher_obj.shutdown()
+
+
+def test_scheduled_unit_is_taken_once(prefetcher, release):
+    prefetcher.schedule(1, 2)
+    release.set()
+
+    assert prefetcher.take(1, 2) == (1, 2)
+    assert prefetcher.take(1, 2) is None
+    assert prefetcher.take(1, 3) is None
+
+
+def test_oldest_scheduled_unit_is_cancelled_over_the_limit(prefetcher, release):
+    for unit_number in (1, 2, 3):
+        prefetcher.schedule(1, unit_number)
+
+    assert (1, 1) not in prefetcher
+    assert (1, 2) in prefetcher
+    assert (1, 3) in prefetcher
+
+    release.set()
+    assert prefetcher.take(1, 3) == (1, 3)
+
+
+def test_rescheduled_unit_is_kept_over_the_limit(prefetcher):
+    prefetcher.schedule(1, 1)
+    prefetcher.schedule(1, 2)
+    prefetcher.schedule(1, 1)
+    prefetcher.schedule(1, 3)
+
+    assert (1, 1) in prefetcher
+    assert (1, 2) not in prefetcher
+
+
+def test_failed_or_discarded_load_is_taken_as_none(prefetcher, release):
+    prefetcher.schedule(1, -1)
+    prefetcher.schedule(1, 2)
+    prefetcher.discard(1, 2)
+    release.set()
+
+    assert prefetcher.take(1, -1) is None
+    assert prefetcher.take(1, 2) is None
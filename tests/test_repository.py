@@ -0,0 +1,133 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the unit repository"""
+
+# imports: library
+import threading
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure import repository
+from glossanea.structure.prefetch import Prefetcher
+from glossanea.structure.repository import UnitRepository
+
+
+class _FakeUnit:
+    """Stand-in for a loaded unit"""
+
+    def __init__(self, week_number: int, unit_number: int, data_size: int = 1) -> None:
+        self.week_number: int = week_number
+        self.unit_number: int = unit_number
+        self.data_size: int = data_size
+
+
+@pytest.fixture(autouse=True)
+def fake_units(monkeypatch) -> None:
+    """Load stand-in units instead of data files"""
+    monkeypatch.setattr(repository, 'Unit', _FakeUnit)
+
+
+def test_repeated_get_is_a_hit():
+    units: UnitRepository = UnitRepository()
+
+    first_unit = units.get(1, 1)
+
+    assert units.get(1, 1) is first_unit
+    assert units.get(1, 2) is not first_unit
+    assert units.stats() == {'entries': 2, 'bytes': 2, 'hits': 1, 'misses': 2,
+                             'prefetch_hits': 0}
+
+
+def test_least_recently_used_unit_is_evicted_by_count():
+    units: UnitRepository = UnitRepository(max_entries=2)
+
+    units.get(1, 1)
+    units.get(1, 2)
+    units.get(1, 1)
+    units.get(1, 3)
+
+    assert (1, 1) in units
+    assert (1, 2) not in units
+    assert len(units) == 2
+
+
+def test_units_are_evicted_by_size_but_the_latest_is_kept():
+    units: UnitRepository = UnitRepository(max_entries=0, max_bytes=10)
+
+    units.put(_FakeUnit(1, 1, data_size=6))
+    units.put(_FakeUnit(1, 2, data_size=4))
+    assert units.size == 10
+
+    units.put(_FakeUnit(1, 3, data_size=20))
+
+    assert len(units) == 1
+    assert (1, 3) in units
+    assert units.size == 20
+
+
+def test_resize_evicts_and_rejects_invalid_capacities():
+    units: UnitRepository = UnitRepository()
+    for unit_number in range(1, 6):
+        units.get(1, unit_number)
+
+    units.resize(max_entries=3, max_bytes=0)
+    assert len(units) == 3
+    assert (1, 2) not in units
+
+    for max_entries, max_bytes in ((-1, 0), (1, -1), ('3', 0), (1, 1.5)):
+        with pytest.raises(ValueError):
+            units.resize(max_entries, max_bytes)
+
+
+def test_put_replaces_and_invalidate_drops():
+    units: UnitRepository = UnitRepository()
+    units.put(_FakeUnit(1, 1, data_size=5))
+    units.put(_FakeUnit(1, 1, data_size=3))
+
+    assert (len(units), units.size) == (1, 3)
+
+    units.invalidate(1, 1)
+    units.invalidate(1, 2)
+
+    assert (len(units), units.size) == (0, 0)
+
+
+def test_prefetched_unit_is_taken_on_a_miss():
+    prefetcher: Prefetcher = Prefetcher(_FakeUnit)
+    units: UnitRepository = UnitRepository(prefetcher=prefetcher)
+
+    units.prefetch(1, 2)
+    prefetched_unit = prefetcher._pending[(1, 2)].result()  # pylint: disable=protected-access
+
+    assert units.get(1, 2) is prefetched_unit
+    assert units.stats()['prefetch_hits'] == 1
+
+    # cached units are not prefetched again
+    units.prefetch(1, 2)
+    assert (1, 2) not in prefetcher
+
+    units.close()
+
+
+def test_clear_discards_prefetched_units():
+    release: threading.Event = threading.Event()
+
+    def loader(week_number: int, unit_number: int) -> _FakeUnit:
+        release.wait(5)
+        return _FakeUnit(week_number, unit_number)
+
+    prefetcher: Prefetcher = Prefetcher(loader)
+    units: UnitRepository = UnitRepository(prefetcher=prefetcher)
+
+    units.prefetch(1, 1)
+    units.prefetch(1, 2)
+    units.clear()
+    release.set()
+
+    assert (1, 1) not in prefetcher
+    assert prefetcher.take(1, 2) is None
+    prefetcher.shutdown()
@@ -0,0 +1,85 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the memoised data validation"""
+
+# pylint: disable=protected-access
+
+# imports: library
+import gc
+from typing import Any
+
+# imports: project
+from glossanea.structure import schema
+from glossanea.structure.schema import ValidationResult
+from glossanea.tasks import t_3_definitions
+
+
+class RevisedData(dict):
+    """Unit data whose revision is bumped by hand"""
+
+    revision: int = 0
+
+
+def _validate(data: Any) -> tuple[ValidationResult, dict[str, int | float]]:
+    """Validate data against the definitions task, return the result and the counters"""
+
+    schema.reset_stats()
+    validation_result: ValidationResult = \
+        schema.validate_unit_data(t_3_definitions.DATA_VALIDATOR, data)
+
+    return validation_result, schema.stats()
+
+
+def test_repeated_validation_is_a_memo_hit(day_unit):
+    data: RevisedData = RevisedData(day_unit)
+
+    assert _validate(data)[1]['validations'] == 1
+
+    validation_result, stats = _validate(data)
+
+    assert validation_result == ValidationResult.OK
+    assert (stats['memo_hits'], stats['validations']) == (1, 0)
+
+
+def test_failed_result_is_memoised(day_unit):
+    day_unit['definitions']['words'] = day_unit['definitions']['words'][:4]
+    data: RevisedData = RevisedData(day_unit)
+
+    _validate(data)
+    validation_result, stats = _validate(data)
+
+    assert validation_result == ValidationResult.VALIDATION_FAILED
+    assert (stats['memo_hits'], stats['validations']) == (1, 0)
+
+
+def test_revision_bump_is_a_memo_miss(day_unit):
+    data: RevisedData = RevisedData(day_unit)
+    _validate(data)
+
+    data.revision += 1
+    validation_result, stats = _validate(data)
+
+    assert validation_result == ValidationResult.OK
+    assert (stats['memo_misses'], stats['validations']) == (1, 1)
+
+
+def test_data_without_revision_is_not_memoised(day_unit):
+    _validate(day_unit)
+
+    assert _validate(day_unit)[1]['validations'] == 1
+    assert id(day_unit) not in schema._memo
+
+
+def test_collected_data_drops_its_memo_entry(day_unit):
+    data: RevisedData = RevisedData(day_unit)
+    data_id: int = id(data)
+    _validate(data)
+
+    assert data_id in schema._memo
+
+    del data
+    gc.collect()
+
+    assert data_id not in schema._memo
@@ -0,0 +1,129 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the schema compiler"""
+
+# imports: library
+import copy
+from types import ModuleType
+from typing import Any, Iterator
+
+# imports: dependencies
+import pytest
+from jsonschema import Draft202012Validator
+
+# imports: project
+from glossanea import tasks
+from glossanea.structure import data_version
+from glossanea.structure import schema_compiler
+
+from conftest import make_day_unit
+
+REPLACEMENTS: tuple[Any, ...] = (None, True, 0, 2.5, -1, '', 'text', [], [''], {})
+
+SAMPLE_SCHEMA: dict[str, Any] = {
+    'type': 'object',
+    'required': ['count', 'items'],
+    'properties': {
+        'count': {'type': 'integer', 'minimum': 1, 'maximum': 3},
+        'ratio': {'type': 'number'},
+        'items': {
+            'type': 'array',
+            'minItems': 1,
+            'maxItems': 2,
+            'items': {'type': ['string', 'null']},
+        },
+        'flag': {'type': 'boolean'},
+    },
+}
+
+
+def _validators() -> Iterator[Draft202012Validator]:
+    """Data version validator and the validators of every task"""
+
+    yield data_version.DATA_VALIDATOR
+
+    for value in vars(tasks).values():
+        if isinstance(value, ModuleType) and hasattr(value, 'DATA_VALIDATOR'):
+            yield value.DATA_VALIDATOR
+
+
+def _paths(value: Any, path: tuple[Any, ...] = ()) -> Iterator[tuple[Any, ...]]:
+    """Paths of every nested value"""
+
+    if isinstance(value, dict):
+        items: Iterator[tuple[Any, Any]] = iter(value.items())
+    elif isinstance(value, list):
+        items: Iterator[tuple[Any, Any]] = enumerate(value)
+    else:
+        return
+
+    for key, item in items:
+        yield path + (key,)
+        yield from _paths(item, path + (key,))
+
+
+def _mutations(unit_data: dict[str, Any], data_key: str) -> Iterator[dict[str, Any]]:
+    """Copies of unit data with a single value of a section replaced or removed"""
+
+    for path in _paths(unit_data):
+        if path[0] != data_key:
+            continue
+        for replacement in REPLACEMENTS + ('remove',):
+            mutated: dict[str, Any] = copy.deepcopy(unit_data)
+            parent: Any = mutated
+            for key in path[:-1]:
+                parent = parent[key]
+            if replacement == 'remove':
+                del parent[path[-1]]
+            else:
+                parent[path[-1]] = replacement
+            yield mutated
+
+
+def test_compiled_checks_agree_with_jsonschema_on_unit_data():
+    unit_data: dict[str, Any] = make_day_unit()
+
+    for data_validator in _validators():
+        check: schema_compiler.CheckFunction = schema_compiler.check_function(data_validator)
+        samples: list[dict[str, Any]] = [unit_data]
+        for data_key in data_validator.schema.get('properties', {}):
+            samples += _mutations(unit_data, data_key)
+        for sample in samples:
+            assert check(sample) == data_validator.is_valid(sample), \
+                (data_validator.schema, sample)
+
+
+@pytest.mark.parametrize('sample', [
+    {'count': 1, 'items': ['a']},
+    {'count': 3.0, 'items': ['a', None], 'ratio': 1, 'flag': False},
+    {'count': 0, 'items': ['a']},
+    {'count': 4, 'items': ['a']},
+    {'count': True, 'items': ['a']},
+    {'count': 1.5, 'items': ['a']},
+    {'count': 1, 'items': []},
+    {'count': 1, 'items': ['a', 'b', 'c']},
+    {'count': 1, 'items': [1]},
+    {'count': 1, 'items': ['a'], 'ratio': '1'},
+    {'count': 1, 'items': ['a'], 'flag': 0},
+    {'count': 1},
+    ['count', 'items'],
+])
+def test_compiled_keywords_agree_with_jsonschema(sample):
+    check: schema_compiler.CheckFunction = schema_compiler.compile_schema(SAMPLE_SCHEMA)
+
+    assert check(sample) == Draft202012Validator(SAMPLE_SCHEMA).is_valid(sample)
+
+
+def test_unsupported_keyword_falls_back_to_jsonschema():
+    schema_dict: dict[str, Any] = {'type': 'string', 'pattern': '^a'}
+
+    with pytest.raises(schema_compiler.SchemaCompileError):
+        schema_compiler.compile_schema(schema_dict)
+
+    check: schema_compiler.CheckFunction = \
+        schema_compiler.check_function(Draft202012Validator(schema_dict))
+
+    assert check('abc')
+    assert not check('bc')
@@ -0,0 +1,51 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the full-screen output"""
+
+# imports: library
+import io
+
+# imports: project
+from glossanea.cli import screen
+from glossanea.cli.screen import ScreenSink
+
+LINE: str = 'x' * 90
+
+
+def _sink(stream: io.StringIO, columns: int) -> ScreenSink:
+    """Full-screen sink for output laid out at 90 columns"""
+    return ScreenSink(stream, (columns, 20), lambda _: 'answer', min_columns=len(LINE))
+
+
+def test_wide_terminal_gets_full_screen_output():
+    stream: io.StringIO = io.StringIO()
+
+    _sink(stream, 100).write(LINE + '\n')
+
+    assert stream.getvalue().startswith(screen.CLEAR_SCREEN)
+    assert LINE in stream.getvalue()
+
+
+def test_narrow_terminal_scrolls_without_cutting_rows():
+    stream: io.StringIO = io.StringIO()
+    sink: ScreenSink = _sink(stream, 80)
+
+    sink.write(LINE + '\n')
+    answer: str = sink.write_and_read_line('second\n', '1. ')
+
+    assert answer == 'answer'
+    assert stream.getvalue() == LINE + '\nsecond\n1. '
+
+
+def test_widened_terminal_returns_to_full_screen():
+    stream: io.StringIO = io.StringIO()
+    sink: ScreenSink = _sink(stream, 80)
+
+    sink.write('scrolled\n')
+    sink._geometry.fixed_size = (100, 20)  # pylint: disable=protected-access
+    sink.write(LINE + '\n')
+
+    assert stream.getvalue().startswith('scrolled\n' + screen.CLEAR_SCREEN)
+    assert LINE in stream.getvalue()
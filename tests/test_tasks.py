@@ -0,0 +1,125 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of task flows, run on scripted input"""
+
+# imports: library
+import builtins
+from typing import Any, Callable
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea.structure.data import UnitData
+from glossanea.tasks import t_2_sample_sentences
+from glossanea.tasks import t_3_definitions
+from glossanea.tasks import t_4_matching
+from glossanea.tasks._common import TaskProgress, TaskResult
+
+
+@pytest.fixture
+def run_task(monkeypatch, capsys) -> Callable[..., tuple[TaskResult, str]]:
+    """Runner of a task on scripted input, returning its result and output"""
+
+    def run(task_fn: Callable[..., TaskResult],
+            unit_data: dict[str, Any],
+            input_lines: list[str],
+            progress: TaskProgress | None = None,
+            ) -> tuple[TaskResult, str]:
+
+        lines = iter(input_lines)
+
+        def scripted_input(prompt: str = '') -> str:
+            try:
+                line: str = next(lines)
+            except StopIteration as exc:
+                raise EOFError from exc
+            print(prompt + line)
+            return line
+
+        monkeypatch.setattr(builtins, 'input', scripted_input)
+        capsys.readouterr()
+
+        task_result: TaskResult = task_fn(unit_data, progress)
+
+        return task_result, capsys.readouterr().out
+
+    return run
+
+
+def test_sample_sentences_answers_and_commands(run_task, day_unit):
+    progress: TaskProgress = TaskProgress()
+
+    task_result, text = run_task(
+        t_2_sample_sentences.task, UnitData(day_unit),
+        ['wrong', 'apple', '', '/solution', 'Brave!', '', '/next', '/jump'],
+        progress)
+
+    assert task_result == TaskResult.JUMP_TO_NEXT_TASK
+    assert (progress.subtask_index, progress.answered) == (3, {0, 1})
+
+    assert '1. wrong\nIncorrect, try again.\n' in text
+    assert 'The apple was apple.' in text
+    assert 'HINT: "brave"' in text
+    assert '4. /jump' in text
+
+
+def test_definitions_finish_with_ids_or_words(run_task, day_unit):
+    progress: TaskProgress = TaskProgress()
+
+    task_result, text = run_task(
+        t_3_definitions.task, UnitData(day_unit),
+        ['a', '', 'brave', '', 'c', '', 'd', '', 'E', ''],
+        progress)
+
+    assert task_result == TaskResult.FINISHED
+    assert progress.answered == {0, 1, 2, 3, 4}
+    assert text.count('Correct!') == 5
+    assert 'Incorrect' not in text
+
+
+def test_resumed_task_skips_answered_items(run_task, day_unit):
+    progress: TaskProgress = TaskProgress(subtask_index=1, answered={1, 2})
+
+    task_result, text = run_task(t_3_definitions.task, UnitData(day_unit),
+                                 ['/next', 'd', '', 'E', ''], progress)
+
+    assert task_result == TaskResult.FINISHED
+    assert '2. /next' in text
+    assert '3. ' not in text
+    assert '4. d' in text
+    # the item list is only shown when the task starts
+    assert 'Match definitions.' not in text
+
+
+@pytest.mark.parametrize('command, task_result', [
+    ('/previous', TaskResult.BACK_TO_PREVIOUS_TASK),
+    ('/exit', TaskResult.EXIT_TASK),
+    ('/jump', TaskResult.JUMP_TO_NEXT_TASK),
+])
+def test_matching_leaves_on_commands(run_task, day_unit, command, task_result):
+    assert run_task(t_4_matching.task, UnitData(day_unit), ['/help', command])[0] == task_result
+
+
+def test_plan_is_built_once_per_unit(run_task, day_unit, monkeypatch):
+    plan_count: list[int] = []
+    plan: Callable[[dict[str, Any]], Any] = t_3_definitions.plan
+    monkeypatch.setattr(t_3_definitions, 'plan',
+                        lambda unit_data: plan_count.append(1) or plan(unit_data))
+
+    unit_data: UnitData = UnitData(day_unit)
+    for _ in range(2):
+        run_task(t_3_definitions.task, unit_data, ['/exit'])
+
+    assert len(plan_count) == 1
+
+
+def test_invalid_data_is_not_run(run_task, day_unit):
+    day_unit['definitions']['words'] = day_unit['definitions']['words'][:4]
+
+    task_result, text = run_task(t_3_definitions.task, day_unit, [])
+
+    assert task_result == TaskResult.DATA_VALIDATION_FAILED
+    assert 'Correct' not in text
@@ -0,0 +1,103 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the unit schemas composed from the task schemas"""
+
+# imports: library
+from typing import Any
+
+# imports: project
+from glossanea import tasks
+from glossanea.structure import schema
+from glossanea.structure import schema_compiler
+from glossanea.structure import unit_schema
+from glossanea.structure.data import LazyUnitData, UnitData
+from glossanea.structure.schema import ValidationResult
+
+SAMPLE_SENTENCES_VALIDATOR = tasks.sample_sentences.DATA_VALIDATOR
+
+
+def _attach(unit_data: dict[str, Any]) -> UnitData:
+    """Unit data after unit-level validation"""
+    return unit_schema.registry.attach(unit_schema.UNIT_TYPE_DAY, UnitData(unit_data))
+
+
+def _attach_lazy(unit_data: dict[str, Any]) -> LazyUnitData:
+    """Lazily decoded unit data after unit-level validation"""
+    return unit_schema.registry.attach(unit_schema.UNIT_TYPE_DAY,
+                                       LazyUnitData(list(unit_data), unit_data.__getitem__))
+
+
+def test_valid_unit_gets_token(day_unit):
+    unit_data: UnitData = _attach(day_unit)
+
+    assert unit_data.validation_token is not None
+    assert unit_data.is_validated(SAMPLE_SENTENCES_VALIDATOR)
+
+
+def test_unit_without_task_is_valid(day_unit):
+    del day_unit['sample_sentences']
+    del day_unit['new_words_extension']
+
+    unit_data: UnitData = _attach(day_unit)
+
+    assert unit_data.validation_token is not None
+    assert not unit_data.is_validated(SAMPLE_SENTENCES_VALIDATOR)
+
+
+def test_task_sibling_key_is_type_checked(day_unit):
+    day_unit['new_words_extension'] = 5
+
+    unit_data: UnitData = _attach(day_unit)
+
+    assert unit_data.validation_token is None
+    assert schema.validate_unit_data(SAMPLE_SENTENCES_VALIDATOR, unit_data) \
+        == ValidationResult.VALIDATION_FAILED
+
+
+def test_task_sibling_key_is_required(day_unit):
+    del day_unit['new_words_extension']
+
+    unit_data: UnitData = _attach(day_unit)
+
+    assert unit_data.validation_token is None
+    assert schema.validate_unit_data(SAMPLE_SENTENCES_VALIDATOR, unit_data) \
+        == ValidationResult.VALIDATION_FAILED
+
+
+def test_lazy_sibling_key_is_checked_before_token_is_trusted(day_unit):
+    day_unit['new_words_extension'] = 5
+
+    unit_data: LazyUnitData = _attach_lazy(day_unit)
+
+    assert not unit_data.is_validated(SAMPLE_SENTENCES_VALIDATOR)
+    assert schema.validate_unit_data(SAMPLE_SENTENCES_VALIDATOR, unit_data) \
+        == ValidationResult.VALIDATION_FAILED
+
+
+def test_lazy_sibling_key_is_required(day_unit):
+    del day_unit['new_words_extension']
+
+    unit_data: LazyUnitData = _attach_lazy(day_unit)
+
+    assert not unit_data.is_validated(SAMPLE_SENTENCES_VALIDATOR)
+
+
+def test_composed_check_agrees_with_task_validators(day_unit):
+    day_unit['new_words_extension'] = ['fine', 5]
+
+    unit_validator = unit_schema.registry.validator(unit_schema.UNIT_TYPE_DAY)
+
+    assert not SAMPLE_SENTENCES_VALIDATOR.is_valid(day_unit)
+    assert not unit_validator.is_valid(day_unit)
+    assert len(unit_schema.registry.errors(unit_schema.UNIT_TYPE_DAY, day_unit)) > 0
+
+
+def test_composed_schema_compiles(day_unit):
+    unit_validator = unit_schema.registry.validator(unit_schema.UNIT_TYPE_DAY)
+    check = schema_compiler.compile_schema(unit_validator.schema)
+
+    assert check(day_unit)
+    day_unit['new_words_extension'] = 5
+    assert not check(day_unit)
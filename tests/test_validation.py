@@ -0,0 +1,178 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Tests of the whole-course validation"""
+
+# imports: library
+import json
+import os
+from typing import Any
+
+# imports: dependencies
+import pytest
+
+# imports: project
+from glossanea import version
+from glossanea.cli import cli_data
+from glossanea.structure import config
+from glossanea.structure import validation
+
+from conftest import make_day_unit, write_course
+
+
+@pytest.fixture
+def course(tmp_path, xdg_dirs) -> str:
+    """Two day units, the second one without the matching task"""
+
+    data_dir_path: str = write_course(str(tmp_path / 'course'), 'Course')
+
+    unit_data: dict[str, Any] = _read_unit(data_dir_path, 2)
+    del unit_data['matching']
+    _write_unit(data_dir_path, 2, unit_data)
+
+    return data_dir_path
+
+
+@pytest.fixture
+def broken_course(course) -> str:
+    """The two day units, the first one with an answer missing from its definitions"""
+
+    unit_data: dict[str, Any] = _read_unit(course, 1)
+    unit_data['definitions']['answers'].pop()
+    _write_unit(course, 1, unit_data)
+
+    return course
+
+
+def _unit_file_path(data_dir_path: str, day_number: int) -> str:
+    """Path of a day unit data file"""
+    return os.path.join(data_dir_path, 'week_01', f'day_{day_number}.json')
+
+
+def _read_unit(data_dir_path: str, day_number: int) -> dict[str, Any]:
+    """Read the data of a day unit"""
+
+    with open(_unit_file_path(data_dir_path, day_number), 'r', encoding='UTF-8') as fh:
+        return json.load(fh)
+
+
+def _write_unit(data_dir_path: str, day_number: int, unit_data: dict[str, Any]) -> None:
+    """Write the data of a day unit"""
+
+    with open(_unit_file_path(data_dir_path, day_number), 'w', encoding='UTF-8') as fh:
+        json.dump(unit_data, fh)
+
+
+def _checked_days(data_dir_path: str) -> list[int]:
+    """Validate a course incrementally, return the day numbers checked"""
+
+    report: dict[str, Any] = validation.validate_course(data_dir_path, jobs=1, incremental=True)
+
+    assert report['failed'] == 0
+    assert report['checked'] + report['skipped'] == report['units']
+
+    return [day_number for day_number in (1, 2)
+            if _unit_file_path(data_dir_path, day_number) in report['checked_paths']]
+
+
+def test_unchanged_files_are_skipped(course):
+    assert _checked_days(course) == [1, 2]
+    assert _checked_days(course) == []
+
+
+def test_changed_content_is_checked_again(course):
+    _checked_days(course)
+
+    unit_data: dict[str, Any] = _read_unit(course, 2)
+    unit_data['title'] = 'Course Day 2, edited'
+    _write_unit(course, 2, unit_data)
+
+    assert _checked_days(course) == [2]
+    assert _checked_days(course) == []
+
+
+def test_changed_task_schema_checks_the_units_with_the_task(course, monkeypatch):
+    _checked_days(course)
+
+    # pylint: disable-next=protected-access
+    task_fingerprint = validation._task_fingerprint
+    monkeypatch.setattr(validation, '_task_fingerprint',
+                        lambda task_name: 'changed' if task_name == 'matching'
+                        else task_fingerprint(task_name))
+
+    assert _checked_days(course) == [1]
+
+
+def test_other_program_version_checks_every_unit(course, monkeypatch):
+    _checked_days(course)
+
+    monkeypatch.setattr(version, '__version__', version.__version__ + '.1')
+
+    assert _checked_days(course) == [1, 2]
+
+
+def test_recorded_errors_are_reported_when_skipped(broken_course):
+    reports: list[dict[str, Any]] = [
+        validation.validate_course(broken_course, jobs=1, incremental=True) for _ in range(2)
+    ]
+
+    assert [report['skipped'] for report in reports] == [0, 2]
+    assert reports[0]['results'] == reports[1]['results']
+    assert reports[1]['results'][0]['errors'][0]['task'] == 'definitions'
+
+
+def test_valid_unit_data_has_no_errors():
+    assert validation.validate_unit_data(make_day_unit()) == []
+
+
+def test_unit_data_errors_name_their_task():
+    unit_data: dict[str, Any] = make_day_unit()
+    unit_data['definitions']['answers'].pop()
+    unit_data['unknown_task'] = {}
+
+    errors: list[tuple[str, str]] = validation.validate_unit_data(unit_data)
+
+    assert {task_name for task_name, _ in errors} == {'definitions', 'unknown_task'}
+    assert ('unknown_task', 'Unrecognized task type: unknown_task') in errors
+
+
+def test_unit_data_without_version_is_only_checked_for_it():
+    unit_data: dict[str, Any] = make_day_unit()
+    del unit_data['version']
+    unit_data['unknown_task'] = {}
+
+    assert {task_name for task_name, _ in validation.validate_unit_data(unit_data)} == {'version'}
+
+
+# threads left by other tests, e.g. prefetching units, the validate command starts none
+@pytest.mark.filterwarnings('ignore:This process .* is multi-threaded:DeprecationWarning')
+def test_process_pool_reports_like_a_single_job(broken_course):
+    reports: list[dict[str, Any]] = [
+        validation.validate_course(broken_course, jobs=jobs) for jobs in (1, 2)
+    ]
+
+    assert [report['jobs'] for report in reports] == [1, 2]
+    assert reports[0]['results'] == reports[1]['results']
+    assert (reports[1]['units'], reports[1]['failed']) == (2, 1)
+    assert reports[1]['results'][0]['path'] == _unit_file_path(broken_course, 1)
+
+
+def test_validate_command_prints_a_json_report(broken_course, monkeypatch, capsys):
+    monkeypatch.setattr(config, 'data_dir_path', lambda: broken_course)
+
+    assert cli_data.run_validate(jobs=1, incremental=False) == 1
+
+    report: dict[str, Any] = json.loads(capsys.readouterr().out)
+
+    assert report['data_dir'] == broken_course
+    assert (report['units'], report['failed']) == (2, 1)
+    assert report['error_count'] == len(report['results'][0]['errors'])
+    assert {error['task'] for error in report['results'][0]['errors']} == {'definitions'}
+    assert (report['results'][0]['week'], report['results'][0]['unit']) == (1, 1)
+
+
+def test_validate_command_refuses_zero_jobs(course, monkeypatch):
+    monkeypatch.setattr(config, 'data_dir_path', lambda: course)
+
+    assert cli_data.run_validate(jobs=0, incremental=False) == 2